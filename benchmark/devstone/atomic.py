@@ -66,9 +66,7 @@ class DEVStoneAtomic(BehaviorModel):
 
     def output(self, msg_deliver):
         for port in self._out_ports:
-            sys_msg = SysMessage(self.get_name(), port)
-            sys_msg.insert(1)
-            msg_deliver.insert_message(sys_msg)
+            msg_deliver.insert_message(SysMessage.single(self.get_name(), port, 1))
 
     def get_counts(self):
         return self._ext_count, self._int_count
@@ -105,9 +103,9 @@ class DEVStoneGenerator(BehaviorModel):
 
     def output(self, msg_deliver):
         if self._cur_state == "active":
-            sys_msg = SysMessage(self.get_name(), "out")
-            sys_msg.insert(self._fired + 1)
-            msg_deliver.insert_message(sys_msg)
+            msg_deliver.insert_message(
+                SysMessage.single(self.get_name(), "out", self._fired + 1)
+            )
 
     def get_fired(self):
         return self._fired
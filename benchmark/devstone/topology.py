@@ -21,6 +21,12 @@ HO  - High Output:       same as HI plus every atomic of the level emits
 
 The shape is simple to reason about and exercises the scheduler in the same
 ways the literature describes for these variants.
+
+``populate_devstone`` registers the same graph on any engine with the
+``register_entity`` / ``coupling_relation`` API. With ``partitions`` it
+targets ``ParallelSysExecutor``: consecutive levels share a partition and
+every coupling gets ``lookahead=int_delay`` (an atomic only emits when its
+active state expires, at least ``int_delay`` after any transition).
 """
 
 from pyjevsim.definition import ExecutionType
@@ -29,14 +35,16 @@ from pyjevsim.system_executor import SysExecutor
 from .atomic import DEVStoneAtomic, DEVStoneGenerator, DEVStoneSink
 
 
-def _make_atomic(name, variant, dhrystones):
+def _make_atomic(name, variant, dhrystones, int_delay=0.0):
     if variant == "ho":
         return DEVStoneAtomic(
             name,
             out_ports=("out", "outx"),
+            int_delay=int_delay,
             dhrystones=dhrystones,
         )
-    return DEVStoneAtomic(name, out_ports=("out",), dhrystones=dhrystones)
+    return DEVStoneAtomic(name, out_ports=("out",), int_delay=int_delay,
+                          dhrystones=dhrystones)
 
 
 def build_devstone(
@@ -47,6 +55,9 @@ def build_devstone(
     gen_period=1.0,
     dhrystones=0,
     time_resolution=1,
+    parallel_workers=None,
+    message_pool=False,
+    profile=False,
 ):
     """Build a DEVStone simulation.
 
@@ -58,61 +69,101 @@ def build_devstone(
         gen_period (float): Time between generator firings.
         dhrystones (int): Synthetic per-event CPU work.
         time_resolution (int): SysExecutor time resolution.
+        parallel_workers (int): Forwarded to ``SysExecutor``; fans CPU-heavy
+            ticks out to threads on free-threaded builds.
+        message_pool (bool): Forwarded to ``SysExecutor``; recycles the
+            emitted messages after every tick.
+        profile (bool): Forwarded to ``SysExecutor``; collects per-model
+            and per-phase timings.
 
     Returns:
         (SysExecutor, dict): The executor and a dict of model handles useful
         for post-run statistics.
     """
+    ss = SysExecutor(
+        time_resolution,
+        ex_mode=ExecutionType.V_TIME,
+        snapshot_manager=None,
+        parallel_workers=parallel_workers,
+        message_pool=message_pool,
+        profile=profile,
+    )
+    handles = populate_devstone(ss, variant, depth, width, gen_count, gen_period, dhrystones)
+    return ss, handles
+
+
+def populate_devstone(engine, variant, depth, width, gen_count, gen_period=1.0,
+                      dhrystones=0, int_delay=0.0, partitions=None):
+    """Register a DEVStone graph on ``engine``.
+
+    Args:
+        engine: ``SysExecutor`` or, with ``partitions``, a
+            ``ParallelSysExecutor`` / ``TimeWarpSysExecutor``.
+        int_delay (float): Time spent in the active state; also the
+            lookahead of every coupling when ``partitions`` is given.
+        partitions (int, optional): Split the levels into this many
+            contiguous blocks, one per worker.
+
+    Returns:
+        dict: Model handles (``gen``, ``sink``, ``levels``).
+    """
     variant = variant.lower()
     if variant not in {"li", "hi", "ho"}:
         raise ValueError(f"unknown DEVStone variant: {variant}")
     if depth < 1 or width < 1:
         raise ValueError("depth and width must be >= 1")
 
-    ss = SysExecutor(
-        time_resolution,
-        ex_mode=ExecutionType.V_TIME,
-        snapshot_manager=None,
-    )
+    if partitions is None:
+        def register(model, d):
+            engine.register_entity(model)
+
+        def couple(src, out_port, dst, in_port):
+            engine.coupling_relation(src, out_port, dst, in_port)
+    else:
+        def register(model, d):
+            engine.register_entity(model, partition=d * partitions // depth)
+
+        def couple(src, out_port, dst, in_port):
+            engine.coupling_relation(src, out_port, dst, in_port, lookahead=int_delay)
 
     gen = DEVStoneGenerator("gen", period=gen_period, count=gen_count)
     sink = DEVStoneSink("sink")
-    ss.register_entity(gen)
-    ss.register_entity(sink)
+    register(gen, 0)
+    register(sink, depth - 1)
 
     levels = []
     for d in range(depth):
         level = [
-            _make_atomic(f"a_d{d}_w{w}", variant, dhrystones)
+            _make_atomic(f"a_d{d}_w{w}", variant, dhrystones, int_delay)
             for w in range(width)
         ]
         for atomic in level:
-            ss.register_entity(atomic)
+            register(atomic, d)
         levels.append(level)
 
     # Generator -> first atomic of level 0
-    ss.coupling_relation(gen, "out", levels[0][0], "in")
+    couple(gen, "out", levels[0][0], "in")
 
     for d, level in enumerate(levels):
         next_input = levels[d + 1][0] if d + 1 < depth else sink
 
         if variant == "li":
-            ss.coupling_relation(level[0], "out", next_input, "in")
+            couple(level[0], "out", next_input, "in")
         else:
             # HI / HO: chain atomics within the level
             for i in range(width - 1):
-                ss.coupling_relation(level[i], "out", level[i + 1], "in")
-            ss.coupling_relation(level[-1], "out", next_input, "in")
+                couple(level[i], "out", level[i + 1], "in")
+            couple(level[-1], "out", next_input, "in")
 
             # HI / HO: also feed the level input to every atomic to amplify
             # the per-level fan-in (mirrors the high-interconnect property).
             level_input = level[0]
             for i in range(1, width):
-                ss.coupling_relation(level_input, "out", level[i], "in")
+                couple(level_input, "out", level[i], "in")
 
             if variant == "ho":
                 # extra outputs short-circuit straight to the sink
                 for atomic in level:
-                    ss.coupling_relation(atomic, "outx", sink, "in")
+                    couple(atomic, "outx", sink, "in")
 
-    return ss, {"gen": gen, "sink": sink, "levels": levels}
+    return {"gen": gen, "sink": sink, "levels": levels}
@@ -9,7 +9,10 @@ Matches the semantics of `xdevs.examples.devstone.DelayedAtomic`:
     output, and return to passive.
 """
 
+from pyjevsim.atomic_model import AtomicModel
 from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.declarative_model import DeclarativeBehaviorModel
+from pyjevsim.definition import Infinite
 from pyjevsim.system_message import SysMessage
 
 
@@ -59,6 +62,62 @@ class DEVStoneAtomic(BehaviorModel):
         msg_deliver.insert_message(sys_msg)
 
 
+class DEVStoneClassicAtomic(AtomicModel):
+    """The same atomic written xdevs-style: a phase plus a persistent
+    sigma, executed by ``AtomicExecutor``."""
+
+    def __init__(self, name: str, int_cycles: int = 0, ext_cycles: int = 0):
+        super().__init__(name)
+        self.hold_in("passive", Infinite)
+
+        self.insert_input_port("in")
+        self.insert_output_port("out")
+
+        self._int_cycles = int_cycles
+        self._ext_cycles = ext_cycles
+        self._n_externals = 0
+        self._n_internals = 0
+        self._n_events = 0
+
+    def ext_trans(self, port, msg):
+        if port != "in":
+            return
+        _burn(self._ext_cycles)
+        self._n_externals += 1
+        self._n_events += len(msg.retrieve())
+        self.hold_in("active", 0)
+
+    def int_trans(self):
+        if self._cur_state == "active":
+            _burn(self._int_cycles)
+            self._n_internals += 1
+            self.hold_in("passive", Infinite)
+
+    def output(self, msg_deliver):
+        sys_msg = SysMessage(self.get_name(), "out")
+        sys_msg.insert(0)
+        msg_deliver.insert_message(sys_msg)
+
+
+class DEVStoneTableAtomic(DeclarativeBehaviorModel):
+    """The same state machine as pure tables, run by ``DeclarativeExecutor``.
+
+    There is no model code, so no synthetic CPU work and no transition
+    counters; the runner takes the counts from the BehaviorModel build.
+    """
+
+    state_table = {"passive": Infinite, "active": 0}
+    initial_state = "passive"
+    input_ports = ("in",)
+    output_ports = ("out",)
+    external_transitions = {("passive", "in"): "active", ("active", "in"): "active"}
+    internal_transitions = {"active": "passive"}
+    state_outputs = {"active": (("out", 0),)}
+
+    def __init__(self, name: str, int_cycles: int = 0, ext_cycles: int = 0):
+        super().__init__(name)
+
+
 class Seeder(BehaviorModel):
     """One-shot generator: fires a single event at t=0 then passivates."""
 
@@ -0,0 +1,22 @@
+"""pyjevsim DEVStone runner with classic-DEVS ``AtomicModel`` atomics.
+
+Same topology as :mod:`.runner`, but the atomics are ``AtomicModel``
+subclasses driven by a persistent ``sigma``, so they run on
+``AtomicExecutor`` instead of ``BehaviorExecutor``.
+"""
+
+from benchmark.engines.common import RunResult
+from . import runner
+
+
+ENGINE_NAME = "pyjevsim-atomic"
+
+
+def is_available() -> bool:
+    return runner.is_available()
+
+
+def run(variant: str, depth: int, width: int,
+        int_cycles: int = 0, ext_cycles: int = 0) -> RunResult:
+    return runner.run(variant, depth, width, int_cycles, ext_cycles,
+                      kind="atomic", engine_name=ENGINE_NAME)
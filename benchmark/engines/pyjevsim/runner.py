@@ -18,9 +18,10 @@ def is_available() -> bool:
 
 
 def run(variant: str, depth: int, width: int,
-        int_cycles: int = 0, ext_cycles: int = 0) -> RunResult:
+        int_cycles: int = 0, ext_cycles: int = 0,
+        kind: str = "behavior", engine_name: str = ENGINE_NAME) -> RunResult:
     result = RunResult(
-        engine=ENGINE_NAME,
+        engine=engine_name,
         variant=variant,
         depth=depth,
         width=width,
@@ -29,7 +30,8 @@ def run(variant: str, depth: int, width: int,
     )
 
     t0 = time.perf_counter()
-    ss, atomics, _levels = build(variant, depth, width, int_cycles, ext_cycles)
+    ss, atomics, _levels = build(variant, depth, width, int_cycles, ext_cycles,
+                                 kind=kind)
     t1 = time.perf_counter()
 
     # No real engine setup phase beyond model registration in pyjevsim.
@@ -38,9 +40,9 @@ def run(variant: str, depth: int, width: int,
     simulate(ss, depth, width)
     t3 = time.perf_counter()
 
-    n_int = sum(a._n_internals for a in atomics)
-    n_ext = sum(a._n_externals for a in atomics)
-    n_evt = sum(a._n_events for a in atomics)
+    n_int = sum(getattr(a, "_n_internals", 0) for a in atomics)
+    n_ext = sum(getattr(a, "_n_externals", 0) for a in atomics)
+    n_evt = sum(getattr(a, "_n_events", 0) for a in atomics)
 
     result.model_build_s = t1 - t0
     result.engine_setup_s = t2 - t1
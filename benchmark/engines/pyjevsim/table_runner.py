@@ -0,0 +1,30 @@
+"""pyjevsim DEVStone runner with table-driven atomics.
+
+Same topology as :mod:`.runner`, but the atomics are
+``DeclarativeBehaviorModel`` subclasses with no Python transition code,
+so they run on ``DeclarativeExecutor``. Table atomics cannot do the
+synthetic ``int_cycles`` / ``ext_cycles`` work or count their own
+transitions, so the counts are taken from an untimed run of the
+BehaviorModel build of the same (deterministic) graph.
+"""
+
+from benchmark.engines.common import RunResult
+from . import runner
+
+
+ENGINE_NAME = "pyjevsim-table"
+
+
+def is_available() -> bool:
+    return runner.is_available()
+
+
+def run(variant: str, depth: int, width: int,
+        int_cycles: int = 0, ext_cycles: int = 0) -> RunResult:
+    result = runner.run(variant, depth, width, int_cycles, ext_cycles,
+                        kind="table", engine_name=ENGINE_NAME)
+    reference = runner.run(variant, depth, width)
+    result.n_internals = reference.n_internals
+    result.n_externals = reference.n_externals
+    result.n_events = reference.n_events
+    return result
@@ -21,7 +21,13 @@ import time
 from pyjevsim.definition import ExecutionType
 from pyjevsim.system_executor import SysExecutor
 
-from .atomic import DEVStoneAtomic, Seeder
+from .atomic import DEVStoneAtomic, DEVStoneClassicAtomic, DEVStoneTableAtomic, Seeder
+
+ATOMIC_KINDS = {
+    "behavior": DEVStoneAtomic,
+    "atomic": DEVStoneClassicAtomic,
+    "table": DEVStoneTableAtomic,
+}
 
 
 def _atomics_per_level(depth: int, width: int) -> list[int]:
@@ -30,7 +36,10 @@ def _atomics_per_level(depth: int, width: int) -> list[int]:
 
 
 def build(variant: str, depth: int, width: int,
-          int_cycles: int = 0, ext_cycles: int = 0):
+          int_cycles: int = 0, ext_cycles: int = 0, kind: str = "behavior"):
+    """``kind`` picks the atomic class: ``"behavior"`` (BehaviorModel),
+    ``"atomic"`` (AtomicModel on AtomicExecutor) or ``"table"``
+    (DeclarativeBehaviorModel on DeclarativeExecutor)."""
     variant = variant.upper()
     if variant not in ("LI", "HI", "HO"):
         raise ValueError(f"variant {variant} not supported")
@@ -42,11 +51,12 @@ def build(variant: str, depth: int, width: int,
     seeder = Seeder("seeder")
     ss.register_entity(seeder)
 
+    atomic_class = ATOMIC_KINDS[kind]
     levels: list[list[DEVStoneAtomic]] = []
     for d, count in enumerate(_atomics_per_level(depth, width)):
         row = []
         for i in range(count):
-            atomic = DEVStoneAtomic(
+            atomic = atomic_class(
                 f"a_d{d}_i{i}",
                 int_cycles=int_cycles,
                 ext_cycles=ext_cycles,
@@ -0,0 +1,152 @@
+"""Per-transition allocation benchmark.
+
+Drives a DEVStone model one ``schedule()`` tick at a time under
+``tracemalloc`` and reports, per transition:
+
+- ``peak_B`` — transient heap bytes: the highest traced memory seen
+  inside a tick above the level at its start, summed over all ticks.
+  Everything the tick allocates and frees again (deliverers, bags,
+  sets, messages, ...) shows up here.
+- ``retained_B`` — net growth of traced memory over the run.
+
+Tracing slows the run down several-fold, so no wall time is reported;
+use ``run_devstone.py`` for throughput.
+
+Examples
+--------
+
+Default sweep (LI / HI / HO, with and without the message pool):
+
+    python -m benchmark.run_alloc
+
+Single config:
+
+    python -m benchmark.run_alloc --variant ho --depth 5 --width 5
+
+Save CSV:
+
+    python -m benchmark.run_alloc --output benchmark/results/alloc.csv
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tracemalloc
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.devstone.topology import build_devstone  # noqa: E402
+
+
+def _transitions(levels):
+    total = 0
+    for level in levels:
+        for atomic in level:
+            e, i = atomic.get_counts()
+            total += e + i
+    return total
+
+
+def run_one(variant, depth, width, events, message_pool=False, warmup=2):
+    """Return ``(transitions, ticks, peak_bytes, retained_bytes)``
+    measured after ``warmup`` generator periods."""
+    ss, handles = build_devstone(variant=variant, depth=depth, width=width,
+                                 gen_count=events + warmup,
+                                 message_pool=message_pool)
+    levels = handles["levels"]
+
+    # Warm up outside the traced region so lazily built structures
+    # (routing index, scratch buffers, free lists) already exist.
+    ss.simulate(warmup, _tm=False)
+    ss.target_time = ss.global_time + events + depth + 2
+
+    tracemalloc.start()
+    start_transitions = _transitions(levels)
+    start_mem, _ = tracemalloc.get_traced_memory()
+    peak_total = 0
+    ticks = 0
+    while ss.global_time < ss.target_time:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        ss.schedule()
+        _, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - before
+        ticks += 1
+    end_mem, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (_transitions(levels) - start_transitions, ticks,
+            peak_total, end_mem - start_mem)
+
+
+def run_grid(configs, events, pools):
+    rows = []
+    for variant, depth, width in configs:
+        for pool in pools:
+            transitions, ticks, peak, retained = run_one(
+                variant, depth, width, events, message_pool=pool)
+            rows.append({
+                "variant": variant,
+                "depth": depth,
+                "width": width,
+                "message_pool": pool,
+                "ticks": ticks,
+                "transitions": transitions,
+                "peak_B_per_transition": round(peak / transitions, 1),
+                "retained_B_per_transition": round(retained / transitions, 1),
+            })
+    return rows
+
+
+def format_table(rows):
+    header = (
+        f"{'variant':>7} {'d':>2} {'w':>2} {'pool':>5} {'ticks':>6} "
+        f"{'transitions':>11} {'peak_B/tr':>10} {'retained_B/tr':>13}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r['variant']:>7} {r['depth']:>2} {r['width']:>2} "
+            f"{str(r['message_pool']):>5} {r['ticks']:>6} {r['transitions']:>11} "
+            f"{r['peak_B_per_transition']:>10.1f} "
+            f"{r['retained_B_per_transition']:>13.1f}"
+        )
+    return "\n".join(lines)
+
+
+def write_csv(rows, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Per-transition allocation benchmark")
+    p.add_argument("--variant", choices=["li", "hi", "ho"], default=None,
+                   help="single variant (default: sweep LI/HI/HO)")
+    p.add_argument("--depth", type=int, default=4)
+    p.add_argument("--width", type=int, default=4)
+    p.add_argument("--events", type=int, default=20)
+    p.add_argument("--message-pool", choices=["off", "on", "both"], default="both")
+    p.add_argument("--output", default=None)
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    variants = [args.variant] if args.variant else ["li", "hi", "ho"]
+    configs = [(v, args.depth, args.width) for v in variants]
+    pools = {"off": [False], "on": [True], "both": [False, True]}[args.message_pool]
+    rows = run_grid(configs, args.events, pools)
+    print(format_table(rows))
+    if args.output:
+        write_csv(rows, args.output)
+        print(f"\nwrote {len(rows)} rows to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
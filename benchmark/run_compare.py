@@ -36,6 +36,8 @@ if __package__ in (None, ""):
 
 from benchmark.engines.common import RunResult, VARIANTS  # noqa: E402
 from benchmark.engines.pyjevsim import runner as pyjevsim_runner  # noqa: E402
+from benchmark.engines.pyjevsim import atomic_runner as pyjevsim_atomic_runner  # noqa: E402
+from benchmark.engines.pyjevsim import table_runner as pyjevsim_table_runner  # noqa: E402
 from benchmark.engines.pypdevs import runner as pypdevs_runner  # noqa: E402
 from benchmark.engines.reference import runner as reference_runner  # noqa: E402
 from benchmark.engines.xdevs import runner as xdevs_runner  # noqa: E402
@@ -43,6 +45,8 @@ from benchmark.engines.xdevs import runner as xdevs_runner  # noqa: E402
 
 ENGINE_RUNNERS = {
     pyjevsim_runner.ENGINE_NAME: pyjevsim_runner,
+    pyjevsim_atomic_runner.ENGINE_NAME: pyjevsim_atomic_runner,
+    pyjevsim_table_runner.ENGINE_NAME: pyjevsim_table_runner,
     xdevs_runner.ENGINE_NAME: xdevs_runner,
     pypdevs_runner.ENGINE_NAME: pypdevs_runner,
     reference_runner.ENGINE_NAME: reference_runner,
@@ -92,7 +96,7 @@ def run_grid(grid, engines, int_cycles=0, ext_cycles=0, repeat=1):
 
 def format_table(results: list[RunResult]) -> str:
     header = (
-        f"{'engine':>10} {'variant':>7} {'d':>2} {'w':>2} "
+        f"{'engine':>15} {'variant':>7} {'d':>2} {'w':>2} "
         f"{'atomics':>8} {'transitions':>11} "
         f"{'sim_s':>9} {'tr/s':>11}"
     )
@@ -100,12 +104,12 @@ def format_table(results: list[RunResult]) -> str:
     for r in results:
         if r.error:
             lines.append(
-                f"{r.engine:>10} {r.variant:>7} {r.depth:>2} {r.width:>2} "
+                f"{r.engine:>15} {r.variant:>7} {r.depth:>2} {r.width:>2} "
                 f"{'-':>8} {'-':>11} {'-':>9} {'-':>11}  ERROR: {r.error}"
             )
             continue
         lines.append(
-            f"{r.engine:>10} {r.variant:>7} {r.depth:>2} {r.width:>2} "
+            f"{r.engine:>15} {r.variant:>7} {r.depth:>2} {r.width:>2} "
             f"{r.n_atomics:>8} {r.transitions:>11} "
             f"{r.sim_s:>9.4f} {r.transitions_per_s:>11,.0f}"
         )
@@ -11,6 +11,10 @@ Examples:
     # Persist a sweep into benchmark/results/
     python -m benchmark.run_devstone --sweep --csv \
         --output benchmark/results/devstone.csv
+
+    # CPU-heavy models on 4 threads (free-threaded CPython only)
+    python -m benchmark.run_devstone --variant hi --depth 4 --width 64 \
+        --dhrystones 2000 --parallel-workers 4
 """
 
 import argparse
@@ -27,7 +31,8 @@ if __package__ in (None, ""):
 from benchmark.devstone.topology import build_devstone
 
 
-def run_one(variant, depth, width, events, period, dhrystones):
+def run_one(variant, depth, width, events, period, dhrystones,
+            parallel_workers=None, message_pool=False, profile_path=None):
     ss, handles = build_devstone(
         variant=variant,
         depth=depth,
@@ -35,6 +40,9 @@ def run_one(variant, depth, width, events, period, dhrystones):
         gen_count=events,
         gen_period=period,
         dhrystones=dhrystones,
+        parallel_workers=parallel_workers,
+        message_pool=message_pool,
+        profile=profile_path is not None,
     )
 
     # Run long enough for every generator firing to drain through the graph.
@@ -43,6 +51,8 @@ def run_one(variant, depth, width, events, period, dhrystones):
     start = time.perf_counter()
     ss.simulate(sim_horizon, _tm=False)
     elapsed = time.perf_counter() - start
+    if profile_path is not None:
+        ss.dump_profile(profile_path)
 
     ext_total, int_total = 0, 0
     for level in handles["levels"]:
@@ -98,6 +108,13 @@ def parse_args(argv=None):
     p.add_argument("--period", type=float, default=1.0)
     p.add_argument("--dhrystones", type=int, default=0,
                    help="synthetic CPU work per ext_trans (0 = simulator overhead only)")
+    p.add_argument("--parallel-workers", type=int, default=None,
+                   help="Phase A/C threads (free-threaded CPython only; ignored under the GIL)")
+    p.add_argument("--message-pool", action="store_true",
+                   help="recycle emitted SysMessages after every tick")
+    p.add_argument("--profile", default=None, metavar="PATH",
+                   help="collect per-model / per-phase timings and dump them "
+                        "to PATH (.json or .csv; single run only)")
     p.add_argument("--sweep", action="store_true",
                    help="run all variants across a small parameter grid")
     p.add_argument("--csv", action="store_true",
@@ -125,7 +142,9 @@ def main(argv=None):
 
     results = []
     for variant, depth, width, events in configs:
-        res = run_one(variant, depth, width, events, args.period, args.dhrystones)
+        res = run_one(variant, depth, width, events, args.period, args.dhrystones,
+                      args.parallel_workers, args.message_pool,
+                      None if args.sweep else args.profile)
         results.append(res)
         print(format_row(res), file=sys.stderr if args.csv else sys.stdout, flush=True)
 
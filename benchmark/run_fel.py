@@ -0,0 +1,168 @@
+"""Future-event-list micro-benchmark.
+
+Times the classic *hold* operation — dequeue the earliest executor and
+reschedule it at ``now + increment`` — against every ``SysExecutor(fel=...)``
+backend, for several increment distributions and queue sizes. The
+SysExecutor tick is left out entirely so only FEL cost is measured.
+
+Distributions
+-------------
+
+- ``exponential`` — continuous Exp(1) inter-arrival times (banksim-like):
+  practically every timestamp is unique.
+- ``uniform`` — U(0, 2).
+- ``bimodal`` — 90 % U(0, 0.1), 10 % U(90, 110): mixes near-term and
+  far-future events.
+- ``shared`` — integer increments in ``{1, 2, 3}``: many executors share
+  each timestamp (DEVStone / lock-step-like).
+
+Examples
+--------
+
+Default sweep:
+
+    python -m benchmark.run_fel
+
+Single config:
+
+    python -m benchmark.run_fel --dist exponential --size 100000
+
+Save CSV:
+
+    python -m benchmark.run_fel --output benchmark/results/fel.csv
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyjevsim.schedule_queue import FEL_BACKENDS, make_schedule_queue  # noqa: E402
+
+
+DISTRIBUTIONS = {
+    "exponential": lambda rnd: rnd.expovariate(1.0),
+    "uniform": lambda rnd: rnd.uniform(0.0, 2.0),
+    "bimodal": lambda rnd: (rnd.uniform(0.0, 0.1) if rnd.random() < 0.9
+                            else rnd.uniform(90.0, 110.0)),
+    "shared": lambda rnd: float(rnd.randint(1, 3)),
+}
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_HOLDS = 200_000
+
+
+class _Entry:
+    """Just enough of an executor for the FEL: an id and a request time."""
+
+    __slots__ = ("_obj_id", "req_time")
+
+    def __init__(self, obj_id, req_time):
+        self._obj_id = obj_id
+        self.req_time = req_time
+
+    def get_obj_id(self):
+        return self._obj_id
+
+    def get_req_time(self):
+        return self.req_time
+
+
+def run_hold(kind, dist, size, holds, seed=0):
+    """Return seconds spent on ``holds`` hold operations."""
+    rnd = random.Random(seed)
+    draw = DISTRIBUTIONS[dist]
+    fel = make_schedule_queue(kind)
+    for i in range(size):
+        fel.push(_Entry(i, draw(rnd)))
+    increments = [draw(rnd) for _ in range(holds)]
+    # Let lazily-organised backends (ladder) sort their initial
+    # contents outside the timed region.
+    fel.peek_time()
+
+    done = 0
+    start = time.perf_counter()
+    while done < holds:
+        now = fel.peek_time()
+        for entry in fel.pop_all_at(now):
+            entry.req_time = now + increments[done % holds]
+            fel.push(entry)
+            done += 1
+    return time.perf_counter() - start, done
+
+
+def run_grid(kinds, dists, sizes, holds, repeat=3):
+    rows = []
+    for dist in dists:
+        for size in sizes:
+            for kind in kinds:
+                best = None
+                for _ in range(repeat):
+                    secs, done = run_hold(kind, dist, size, holds)
+                    if best is None or secs < best[0]:
+                        best = (secs, done)
+                rows.append({
+                    "fel": kind,
+                    "dist": dist,
+                    "size": size,
+                    "holds": best[1],
+                    "sim_s": round(best[0], 6),
+                    "ns_per_hold": round(best[0] / best[1] * 1e9, 1),
+                })
+    return rows
+
+
+def format_table(rows):
+    header = (
+        f"{'dist':>12} {'size':>8} {'fel':>9} {'holds':>8} "
+        f"{'sim_s':>9} {'ns/hold':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r['dist']:>12} {r['size']:>8} {r['fel']:>9} {r['holds']:>8} "
+            f"{r['sim_s']:>9.4f} {r['ns_per_hold']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def write_csv(rows, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Future-event-list hold benchmark")
+    p.add_argument("--fel", nargs="+", default=sorted(FEL_BACKENDS),
+                   choices=sorted(FEL_BACKENDS))
+    p.add_argument("--dist", nargs="+", default=list(DISTRIBUTIONS),
+                   choices=list(DISTRIBUTIONS))
+    p.add_argument("--size", nargs="+", type=int, default=DEFAULT_SIZES,
+                   help="number of queued executors")
+    p.add_argument("--holds", type=int, default=DEFAULT_HOLDS,
+                   help="hold operations per run")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--output", default=None)
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rows = run_grid(args.fel, args.dist, args.size, args.holds, args.repeat)
+    print(format_table(rows))
+    if args.output:
+        write_csv(rows, args.output)
+        print(f"\nwrote {len(rows)} rows to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
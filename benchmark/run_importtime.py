@@ -0,0 +1,110 @@
+"""Import-time benchmark for the core ``import pyjevsim`` path.
+
+Runs ``python -X importtime -c "import pyjevsim"`` in fresh interpreters
+and reports, from the best of ``--repeat`` runs:
+
+- ``total_us`` — cumulative import time of the top-level module.
+- the slowest modules below it (cumulative microseconds).
+- whether heavy optional machinery (``dill``, ``asyncio``,
+  ``concurrent.futures``, ...) was loaded at all; on the core path
+  none of it should be.
+
+Bytecode is written on a warm-up run and reused afterwards, so the
+numbers exclude compilation.
+
+Examples
+--------
+
+Default (``import pyjevsim``, 10 runs):
+
+    python -m benchmark.run_importtime
+
+Another entry point, more runs:
+
+    python -m benchmark.run_importtime --module pyjevsim.system_executor --repeat 30
+
+Save CSV:
+
+    python -m benchmark.run_importtime --output benchmark/results/importtime.csv
+"""
+
+import argparse
+import csv
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("dill", "asyncio", "concurrent.futures", "pickle",
+                 "json", "ast", "traceback", "signal", "numpy")
+
+
+def run_once(module):
+    """Returns ``{module: (self_us, cumulative_us)}`` for one fresh import."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env, cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative))
+    return timings
+
+
+def measure(module, repeat):
+    run_once(module)  # warm-up: writes bytecode
+    runs = [run_once(module) for _ in range(repeat)]
+    return min(runs, key=lambda t: t[module][1])
+
+
+def format_report(module, timings, top):
+    total = timings[module][1]
+    lines = [f"{module}: {total / 1000:.1f} ms cumulative", ""]
+    header = f"{'module':<40} {'self_us':>8} {'cumul_us':>9}"
+    lines += [header, "-" * len(header)]
+    ranked = sorted(timings.items(), key=lambda kv: kv[1][1], reverse=True)
+    for name, (self_us, cumulative) in ranked[:top]:
+        lines.append(f"{name:<40} {self_us:>8} {cumulative:>9}")
+    loaded = [m for m in HEAVY_MODULES if m in timings]
+    lines += ["", "heavy modules loaded: " + (", ".join(loaded) or "none")]
+    return "\n".join(lines)
+
+
+def write_csv(timings, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("module", "self_us", "cumulative_us"))
+        for name, (self_us, cumulative) in timings.items():
+            writer.writerow((name, self_us, cumulative))
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Import-time benchmark")
+    p.add_argument("--module", default="pyjevsim")
+    p.add_argument("--repeat", type=int, default=10)
+    p.add_argument("--top", type=int, default=15,
+                   help="number of slowest modules to list")
+    p.add_argument("--output", default=None)
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    timings = measure(args.module, args.repeat)
+    print(format_report(args.module, timings, args.top))
+    if args.output:
+        write_csv(timings, args.output)
+        print(f"\nwrote {len(timings)} rows to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
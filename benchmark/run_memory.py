@@ -0,0 +1,163 @@
+"""Per-model memory benchmark.
+
+Builds ``N`` bare atomic models (two states, one input and one output
+port), registers them with a V_TIME ``SysExecutor`` and runs the first
+instant so every executor is in the FEL. ``tracemalloc`` then reports,
+per registered atomic:
+
+- ``model_B`` — the ``BehaviorModel`` instances themselves.
+- ``engine_B`` — executors plus the ``SysExecutor`` bookkeeping
+  (``product_port_map``, ``model_map``, FEL entries, ...).
+- ``total_B`` — the sum.
+
+``--style`` picks how the models declare their states and ports:
+``imperative`` (``insert_state`` / ``insert_*_port`` in ``__init__``)
+or ``tables`` (class-level ``state_table`` / ``input_ports`` /
+``output_ports`` shared by all instances).
+
+Names are allocated outside the traced region, so only the simulator's
+own footprint is counted.
+
+Examples
+--------
+
+Default sweep (10^4, 10^5, 10^6 models):
+
+    python -m benchmark.run_memory
+
+Custom sizes, saved to CSV:
+
+    python -m benchmark.run_memory --sizes 1000 50000 --output benchmark/results/memory.csv
+
+Class-level tables only:
+
+    python -m benchmark.run_memory --style tables
+"""
+
+import argparse
+import csv
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyjevsim.behavior_model import BehaviorModel  # noqa: E402
+from pyjevsim.definition import ExecutionType, Infinite  # noqa: E402
+from pyjevsim.system_executor import SysExecutor  # noqa: E402
+
+
+class BareAtomic(BehaviorModel):
+    def __init__(self, name):
+        super().__init__(name)
+        self.insert_state("idle", Infinite)
+        self.insert_state("busy", 1)
+        self.init_state("idle")
+        self.insert_input_port("in")
+        self.insert_output_port("out")
+
+    def ext_trans(self, port, msg):
+        pass
+
+    def int_trans(self):
+        pass
+
+    def output(self, msg_deliver):
+        pass
+
+
+class TableAtomic(BareAtomic):
+    state_table = {"idle": Infinite, "busy": 1}
+    initial_state = "idle"
+    input_ports = ("in",)
+    output_ports = ("out",)
+
+    def __init__(self, name):
+        BehaviorModel.__init__(self, name)
+
+
+STYLES = {"imperative": BareAtomic, "tables": TableAtomic}
+
+
+def run_one(count, style="imperative"):
+    """Return ``(model_bytes, engine_bytes, seconds)`` for ``count`` models."""
+    model_class = STYLES[style]
+    names = [f"m{i}" for i in range(count)]
+    gc.collect()
+    start = time.perf_counter()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    models = [model_class(name) for name in names]
+    built, _ = tracemalloc.get_traced_memory()
+
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    for model in models:
+        ss.register_entity(model)
+    ss.simulate(1, _tm=False)
+    registered, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    elapsed = time.perf_counter() - start
+    return built - base, registered - built, elapsed
+
+
+def run_grid(sizes, styles):
+    rows = []
+    for count in sizes:
+        for style in styles:
+            model_bytes, engine_bytes, elapsed = run_one(count, style)
+            rows.append({
+                "style": style,
+                "models": count,
+                "model_B": round(model_bytes / count, 1),
+                "engine_B": round(engine_bytes / count, 1),
+                "total_B": round((model_bytes + engine_bytes) / count, 1),
+                "seconds": round(elapsed, 2),
+            })
+    return rows
+
+
+def format_table(rows):
+    header = (f"{'style':>10} {'models':>9} {'model_B':>8} {'engine_B':>9} "
+              f"{'total_B':>8} {'seconds':>8}")
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r['style']:>10} {r['models']:>9} {r['model_B']:>8.1f} "
+            f"{r['engine_B']:>9.1f} {r['total_B']:>8.1f} {r['seconds']:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def write_csv(rows, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Per-model memory benchmark")
+    p.add_argument("--sizes", type=int, nargs="+",
+                   default=[10_000, 100_000, 1_000_000])
+    p.add_argument("--style", choices=["imperative", "tables", "both"], default="both")
+    p.add_argument("--output", default=None)
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    styles = list(STYLES) if args.style == "both" else [args.style]
+    rows = run_grid(args.sizes, styles)
+    print(format_table(rows))
+    if args.output:
+        write_csv(rows, args.output)
+        print(f"\nwrote {len(rows)} rows to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""Multi-process DEVStone scaling benchmark.
+
+Runs DEVStone HI / HO with synthetic per-transition CPU work
+(``--dhrystones``) on the sequential ``SysExecutor`` and on
+``ParallelSysExecutor`` (``--engine parallel``) or ``TimeWarpSysExecutor``
+(``--engine timewarp``) with 1, 2, 4, ... workers, and reports wall time,
+speedup over the sequential run and whether the transition and sink
+counts match it. Time Warp rows also report the rounds rolled back.
+
+Every atomic stays active for ``--int-delay`` before emitting, which is the
+lookahead of the cross-partition couplings: 1 by default for the
+conservative engine, 0 (no lookahead at all) for Time Warp. Consecutive
+DEVStone levels share a worker, so the levels run concurrently.
+
+Speedup needs as many idle cores as workers and enough work per transition
+to pay for pickling every cross-partition message; ``cores`` in the output
+is ``os.sched_getaffinity`` (or ``os.cpu_count``).
+
+Examples
+--------
+
+Default sweep (HI and HO, 1/2/4 workers):
+
+    python -m benchmark.run_parallel
+
+Zero-lookahead DEVStone on Time Warp:
+
+    python -m benchmark.run_parallel --engine timewarp
+
+Heavier models, more workers, saved to CSV:
+
+    python -m benchmark.run_parallel --dhrystones 50000 --workers 1 2 4 8 \\
+        --output benchmark/results/parallel.csv
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.devstone.topology import populate_devstone  # noqa: E402
+from pyjevsim.definition import ExecutionType  # noqa: E402
+from pyjevsim.optimistic_executor import TimeWarpSysExecutor  # noqa: E402
+from pyjevsim.parallel_executor import ParallelSysExecutor  # noqa: E402
+from pyjevsim.system_executor import SysExecutor  # noqa: E402
+
+ENGINES = {"parallel": ParallelSysExecutor, "timewarp": TimeWarpSysExecutor}
+DEFAULT_INT_DELAY = {"parallel": 1.0, "timewarp": 0.0}
+
+
+def _cores():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _counts(handles):
+    transitions = sum(sum(atomic.get_counts()) for level in handles["levels"] for atomic in level)
+    return transitions, handles["sink"].get_received()
+
+
+def run_one(variant, depth, width, events, dhrystones, int_delay, workers=None,
+            engine_name="parallel"):
+    """Run one configuration; ``workers=None`` is the sequential engine.
+
+    Returns:
+        tuple: ``(seconds, transitions, sink_received, rolled_back)``
+    """
+    horizon = events + depth * width * max(int_delay, 1) + 2
+    if workers is None:
+        engine = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+        handles = populate_devstone(engine, variant, depth, width, events,
+                                    dhrystones=dhrystones, int_delay=int_delay)
+        start = time.perf_counter()
+        engine.simulate(horizon, _tm=False)
+    else:
+        engine = ENGINES[engine_name](1, workers=workers)
+        handles = populate_devstone(engine, variant, depth, width, events,
+                                    dhrystones=dhrystones, int_delay=int_delay,
+                                    partitions=workers)
+        start = time.perf_counter()
+        engine.simulate(horizon)
+    elapsed = time.perf_counter() - start
+    stats = getattr(engine, "stats", {})
+    rolled_back = sum(s["rolled_back"] for s in stats.values())
+    return (elapsed,) + _counts(handles) + (rolled_back,)
+
+
+def run_grid(variants, depth, width, events, dhrystones, int_delay, worker_counts,
+             engine_name="parallel"):
+    rows = []
+    for variant in variants:
+        base, transitions, sink, _ = run_one(variant, depth, width, events, dhrystones,
+                                             int_delay)
+        rows.append(_row(variant, "sequential", 0, base, base, transitions, True, 0))
+        for workers in worker_counts:
+            elapsed, got, got_sink, rolled_back = run_one(
+                variant, depth, width, events, dhrystones, int_delay, workers, engine_name
+            )
+            rows.append(_row(variant, engine_name, workers, elapsed, base, got,
+                             (got, got_sink) == (transitions, sink), rolled_back))
+    return rows
+
+
+def _row(variant, engine, workers, elapsed, base, transitions, match, rolled_back):
+    return {
+        "variant": variant,
+        "engine": engine,
+        "workers": workers,
+        "seconds": round(elapsed, 4),
+        "speedup": round(base / elapsed, 2) if elapsed else 0,
+        "transitions": transitions,
+        "match": match,
+        "rolled_back": rolled_back,
+    }
+
+
+def format_table(rows):
+    header = (f"{'variant':>7} {'engine':>10} {'workers':>7} {'seconds':>8} "
+              f"{'speedup':>7} {'transitions':>11} {'match':>5} {'rolled_back':>11}")
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r['variant']:>7} {r['engine']:>10} {r['workers']:>7} {r['seconds']:>8.3f} "
+            f"{r['speedup']:>7.2f} {r['transitions']:>11} {str(r['match']):>5} "
+            f"{r['rolled_back']:>11}"
+        )
+    return "\n".join(lines)
+
+
+def write_csv(rows, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Multi-process DEVStone scaling benchmark")
+    p.add_argument("--engine", choices=sorted(ENGINES), default="parallel")
+    p.add_argument("--variant", choices=["hi", "ho", "both"], default="both")
+    p.add_argument("--depth", type=int, default=8)
+    p.add_argument("--width", type=int, default=8)
+    p.add_argument("--events", type=int, default=10)
+    p.add_argument("--dhrystones", type=int, default=20000,
+                   help="synthetic CPU work per ext_trans")
+    p.add_argument("--int-delay", type=float, default=None,
+                   help="active-state duration, used as the coupling lookahead "
+                        "(default: 1 for parallel, 0 for timewarp)")
+    p.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    p.add_argument("--output", default=None)
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    variants = ["hi", "ho"] if args.variant == "both" else [args.variant]
+    int_delay = args.int_delay
+    if int_delay is None:
+        int_delay = DEFAULT_INT_DELAY[args.engine]
+    rows = run_grid(variants, args.depth, args.width, args.events, args.dhrystones,
+                    int_delay, args.workers, args.engine)
+    print(f"cores: {_cores()}")
+    print(format_table(rows))
+    if args.output:
+        write_csv(rows, args.output)
+        print(f"\nwrote {len(rows)} rows to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Trace-recording overhead benchmark.
+
+Runs DEVStone with no recorder, with a ``TraceRecorder`` keeping only the
+transitions (``deliveries=False``) and with full recording, and reports
+the best wall time of each and the overhead of recording over the run
+without it. The three modes run back to back, ``--repeat`` times, and the
+overhead is the median of the per-repeat ratios, so drift on a busy or
+virtualised host hits both sides of each ratio alike.
+
+Examples
+--------
+
+Default sweep (LI / HI / HO, no synthetic work, the worst case):
+
+    python -m benchmark.run_trace
+
+Single config with synthetic per-transition work:
+
+    python -m benchmark.run_trace --variant hi --depth 10 --width 10 \
+        --dhrystones 200
+
+Save CSV:
+
+    python -m benchmark.run_trace --output benchmark/results/trace.csv
+"""
+
+import argparse
+import csv
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.devstone.topology import build_devstone  # noqa: E402
+from pyjevsim.trace_recorder import TraceRecorder  # noqa: E402
+
+MODES = ("off", "transitions", "full")
+
+
+def run_one(variant, depth, width, events, dhrystones, mode, directory):
+    """Return ``(seconds, records)`` of one run; ``seconds`` includes
+    closing the recorder."""
+    ss, _ = build_devstone(variant=variant, depth=depth, width=width,
+                           gen_count=events, dhrystones=dhrystones)
+    recorder = None
+    path = os.path.join(directory, f"{variant}-{mode}.trace")
+    if mode != "off":
+        recorder = TraceRecorder(path, deliveries=mode == "full")
+        ss.set_trace_recorder(recorder)
+    start = time.perf_counter()
+    ss.simulate(events + depth + 2, _tm=False)
+    if recorder is None:
+        return time.perf_counter() - start, 0
+    recorder.close()
+    elapsed = time.perf_counter() - start
+    # Drop the trace right away so the next run does not compete with
+    # its writeback.
+    for suffix in ("", ".json"):
+        os.remove(path + suffix)
+    return elapsed, recorder.count
+
+
+def run_grid(variants, depth, width, events, dhrystones, repeat):
+    rows = []
+    directory = tempfile.mkdtemp(prefix="pyjevsim-trace-")
+    try:
+        for variant in variants:
+            times = {mode: [] for mode in MODES}
+            records = dict.fromkeys(MODES, 0)
+            for _ in range(repeat):
+                for mode in MODES:
+                    elapsed, records[mode] = run_one(variant, depth, width, events,
+                                                     dhrystones, mode, directory)
+                    times[mode].append(elapsed)
+            for mode in MODES:
+                ratio = statistics.median(
+                    t / base for t, base in zip(times[mode], times["off"])
+                )
+                rows.append({
+                    "variant": variant,
+                    "mode": mode,
+                    "seconds": round(min(times[mode]), 4),
+                    "records": records[mode],
+                    "overhead_pct": round(100 * (ratio - 1), 1),
+                })
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return rows
+
+
+def format_table(rows):
+    header = f"{'variant':>7} {'mode':>12} {'seconds':>8} {'records':>9} {'overhead':>8}"
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r['variant']:>7} {r['mode']:>12} {r['seconds']:>8.3f} "
+            f"{r['records']:>9} {r['overhead_pct']:>7.1f}%"
+        )
+    return "\n".join(lines)
+
+
+def write_csv(rows, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Trace-recording overhead benchmark")
+    p.add_argument("--variant", choices=["li", "hi", "ho"], default=None,
+                   help="single variant (default: sweep LI/HI/HO)")
+    p.add_argument("--depth", type=int, default=10)
+    p.add_argument("--width", type=int, default=10)
+    p.add_argument("--events", type=int, default=20)
+    p.add_argument("--dhrystones", type=int, default=0)
+    p.add_argument("--repeat", type=int, default=7)
+    p.add_argument("--output", default=None)
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    variants = [args.variant] if args.variant else ["li", "hi", "ho"]
+    rows = run_grid(variants, args.depth, args.width, args.events, args.dhrystones,
+                    args.repeat)
+    print(format_table(rows))
+    if args.output:
+        write_csv(rows, args.output)
+        print(f"\nwrote {len(rows)} rows to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
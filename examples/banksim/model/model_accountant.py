@@ -45,8 +45,7 @@ class BankAccountant(BehaviorModel):
         _time = self.global_time
         if port == "in":
             self.user = msg.retrieve()[0]
-            self._cur_state = "PROC"  # Transition state to "PROC"
-            self.update_state("PROC", self.user.get_service_time())  # Update "PROC" state duration
+            self.hold_in("PROC", self.user.get_service_time())  # "PROC" for this user's service time
 
     def output(self, msg_deliver):
         """
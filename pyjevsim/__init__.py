@@ -9,6 +9,9 @@ __author__ = "me@cbchoi.info"
 __all__ = [
     "behavior_model",
     "behavior_executor",
+    "atomic_executor",
+    "declarative_model",
+    "declarative_executor",
     "core_model",
     "default_message_catcher",
     "definition",
@@ -16,6 +19,16 @@ __all__ = [
     "executor",
     "structural_model",
     "structural_executor",
+    "flat_structural_executor",
+    "parallel_executor",
+    "optimistic_executor",
+    "experiment",
+    "structure_edit",
+    "external_source",
+    "output_channel",
+    "realtime_clock",
+    "profiler",
+    "trace_recorder",
     "executor_factory",
     "system_executor",
     "system_message",
@@ -37,5 +50,29 @@ from .system_executor import SysExecutor
 from .system_message import SysMessage
 from .behavior_model import BehaviorModel
 from .structural_model import StructuralModel
-from .snapshot_manager import SnapshotManager
-from .restore_handler import RestoreHandler
\ No newline at end of file
+
+# Snapshot / restore (dill, json, ast) and the other optional machinery
+# load on first use (PEP 562): `pyjevsim.SnapshotManager` imports
+# `snapshot_manager`, `pyjevsim.trace_recorder` imports that submodule.
+_LAZY_ATTRIBUTES = {
+    "SnapshotManager": "snapshot_manager",
+    "RestoreHandler": "restore_handler",
+}
+
+
+def __getattr__(name):
+    import importlib
+
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+    elif name in __all__:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_ATTRIBUTES))
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains ArrayBehaviorModel, a population of N identical atomic models whose state is held in NumPy arrays.
+"""
+
+from abc import abstractmethod
+
+from .core_model import CoreModel
+from .definition import Infinite, ModelType
+from .system_message import SysMessage
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency: pip install pyjevsim[array]
+    np = None
+
+
+class ArrayBehaviorModel(CoreModel):
+    """Template for a population of ``size`` identical atomic models.
+
+    Instead of registering one ``BehaviorModel`` (and one executor, one
+    FEL entry, one ``_states`` dict) per agent, the whole population is a
+    single entity. Per-member state lives in NumPy arrays:
+
+    - ``state`` — integer state code per member (see :py:meth:`insert_state`)
+    - ``sigma`` — time advance per member, applied after each transition
+    - ``next_t`` — absolute next internal event time per member (owned
+      by :class:`ArrayExecutor`)
+
+    The executor schedules the population at ``next_t.min()`` and passes
+    the transition hooks an index array of the members concerned, so
+    user code is written with vectorized NumPy operations.
+
+    Messages are addressed to member indices: every item in the payload
+    of a ``SysMessage`` delivered to an ``ArrayBehaviorModel`` must be a
+    ``(member, value)`` pair. :py:meth:`emit` builds outputs in the same
+    shape, so array models can be coupled to each other directly.
+
+    Args:
+        _name (str): Unique model name
+        size (int): Number of members in the population
+    """
+    def __init__(self, _name, size):
+        if np is None:
+            raise ImportError(
+                "ArrayBehaviorModel requires numpy (pip install pyjevsim[array])"
+            )
+        super().__init__(_name, ModelType.ARRAY)
+        self.size = int(size)
+
+        self._state_names = []   # code -> state name
+        self._state_codes = {}   # state name -> code
+        self._deadlines = np.empty(0, dtype=np.float64)  # code -> deadline
+
+        self.state = np.zeros(self.size, dtype=np.int32)
+        self.sigma = np.full(self.size, Infinite, dtype=np.float64)
+        self.next_t = np.full(self.size, Infinite, dtype=np.float64)
+        self._cancel_mask = None
+
+        self.global_time = 0
+
+    def insert_state(self, name, deadline="inf"):
+        """
+        Insert "state" into the ArrayBehaviorModel
+
+        Args:
+            name (str): State name
+            deadline (str or Infinite): Default time advance of the state
+
+        Returns:
+            int: The state's integer code
+        """
+        if name in self._state_codes:
+            code = self._state_codes[name]
+            self._deadlines[code] = float(deadline)
+            return code
+        code = len(self._state_names)
+        self._state_names.append(name)
+        self._state_codes[name] = code
+        self._deadlines = np.append(self._deadlines, float(deadline))
+        return code
+
+    def state_code(self, name):
+        """Returns the integer code of a state
+
+        Args:
+            name (str): State name
+        """
+        return self._state_codes[name]
+
+    def state_name(self, code):
+        """Returns the state name for an integer code
+
+        Args:
+            code (int): State code
+        """
+        return self._state_names[code]
+
+    def init_state(self, state, members=None):
+        """
+        Sets the initial state of the given members (all by default)
+
+        Args:
+            state (str): Initial state name
+            members (array-like, optional): Member indices
+        """
+        self.hold_in(slice(None) if members is None else members, state)
+
+    def hold_in(self, members, state, sigma=None):
+        """
+        Moves members to ``state`` and sets their time advance
+
+        Args:
+            members (array-like or slice): Member indices
+            state (str): State name
+            sigma (float or array-like, optional): Time advance. Defaults
+                to the state's deadline from :py:meth:`insert_state`.
+        """
+        code = self._state_codes[state]
+        self.state[members] = code
+        self.sigma[members] = self._deadlines[code] if sigma is None else sigma
+
+    def passivate(self, members):
+        """Sets an infinite time advance for members without changing their state
+
+        Args:
+            members (array-like or slice): Member indices
+        """
+        self.sigma[members] = Infinite
+
+    def in_state(self, state):
+        """Returns a boolean mask of the members currently in ``state``
+
+        Args:
+            state (str): State name
+        """
+        return self.state == self._state_codes[state]
+
+    def cancel_rescheduling(self, members):
+        """Keeps the previous deadline of members receiving an external
+        event when it is earlier than the new one (the array analogue of
+        ``BehaviorModel.cancel_rescheduling``).
+
+        Args:
+            members (array-like): Member indices
+        """
+        if self._cancel_mask is None:
+            self._cancel_mask = np.zeros(self.size, dtype=bool)
+        self._cancel_mask[members] = True
+
+    def set_global_time(self, gtime):
+        """
+        Set gloabl time
+
+        Args:
+            gtime (float): Global time
+        """
+        self.global_time = gtime
+
+    def emit(self, msg_deliver, port, members, values=None):
+        """Emits one message on ``port`` addressed by member index
+
+        Args:
+            msg_deliver (MessageDeliverer): The output bag passed to :py:meth:`output`
+            port (str): Output port
+            members (array-like): Source member indices
+            values (Iterable, optional): One value per member. Defaults to None values.
+        """
+        members = np.asarray(members).tolist()
+        if not members:
+            return
+        msg = SysMessage(self.get_name(), port)
+        if values is None:
+            msg.extend([(m, None) for m in members])
+        else:
+            msg.extend(zip(members, values))
+        msg_deliver.insert_message(msg)
+
+    @abstractmethod
+    def output(self, members, msg_deliver):
+        """Output function of the imminent ``members``, to be implemented by subclasses"""
+        pass
+
+    @abstractmethod
+    def int_trans(self, members):
+        """Internal transition of the imminent ``members``, to be implemented by subclasses"""
+        pass
+
+    @abstractmethod
+    def ext_trans(self, port, members, values):
+        """External transition, to be implemented by subclasses
+
+        Args:
+            port (str): Input port
+            members (numpy.ndarray): Addressed member index per message
+                (a member may appear more than once)
+            values (list): Payload value per message, aligned with ``members``
+        """
+        pass
+
+    def con_trans(self, members, inputs):
+        """Confluent transition: ``δ_con = δ_int ; δ_ext``
+
+        Invoked when some members are imminent while the population also
+        receives messages at the same instant. The default runs
+        :py:meth:`int_trans` on the imminent members, then
+        :py:meth:`ext_trans` for every port; members that are only
+        receiving therefore see a plain ``ext_trans``.
+
+        Args:
+            members (numpy.ndarray): Imminent member indices
+            inputs (dict): ``port -> (members, values)``
+        """
+        self.int_trans(members)
+        for port, (receivers, values) in inputs.items():
+            self.ext_trans(port, receivers, values)
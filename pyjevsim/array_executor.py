@@ -0,0 +1,195 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains an ArrayExecutor, an object for executing an ArrayBehaviorModel.
+"""
+
+import numpy as np
+
+from .definition import Infinite
+from .executor import Executor
+
+class ArrayExecutor(Executor):
+    """
+    Executes an ArrayBehaviorModel as one schedulable entity.
+
+    The SysExecutor sees a single executor whose request time is the
+    earliest ``next_t`` across the population. At that instant the
+    imminent members are found with a vectorized mask and the
+    transitions run in :py:meth:`int_trans`, :py:meth:`ext_trans_bag`
+    and :py:meth:`con_trans`. The executor sets ``groups_inputs``, so
+    the SysExecutor hands it an instant's whole bag at once, and every
+    port gets one vectorized ``ext_trans`` call. :py:meth:`set_req_time`
+    (Phase D of the tick) only reschedules the members that transitioned.
+
+    Args:
+        itime (int or Infinite): Time of instance creation
+        dtime (int or Infinite): Time of instance destruction
+        ename (str): SysExecutor name
+        array_model (ArrayBehaviorModel): Population model
+    """
+
+    groups_inputs = True
+
+    def __init__(self, itime=Infinite, dtime=Infinite, ename="default", array_model=None, parent=None):
+        super().__init__(itime, dtime, ename, array_model, parent)
+
+        self.array_model = array_model
+        self.request_time = Infinite
+        self.global_time = 0
+
+        self._scheduled = False
+        self._imminent = None
+        self._transitioned = None   # imminent members awaiting rescheduling
+        self._receivers = []        # receiver index arrays awaiting rescheduling
+
+        self._cached_destruct_time = self._destruct_t
+        self._obj_id = array_model.get_obj_id()
+
+    def __str__(self):
+        """Returns a string representation of the executor"""
+        return f"[N]:{self.get_name()}, [S]:{self.array_model.size} members"
+
+    def get_core_model(self):
+        """Returns the ArrayBehaviorModel"""
+        return self.array_model
+
+    def get_name(self):
+        """Returns the name of the array model"""
+        return self.array_model.get_name()
+
+    def get_engine_name(self):
+        """Returns the name of the engine"""
+        return self.engine_name
+
+    def set_engine_name(self, engine_name):
+        """Sets the name of the engine"""
+        self.engine_name = engine_name
+
+    def get_create_time(self):
+        """Returns the instance creation time"""
+        return self._instance_t
+
+    def get_destruct_time(self):
+        """Returns the destruction time"""
+        return self._cached_destruct_time
+
+    def get_obj_id(self):
+        """Returns the object ID of the array model"""
+        return self._obj_id
+
+    def imminent_members(self):
+        """Returns the indices of the members due at the current request time"""
+        return np.flatnonzero(self.array_model.next_t <= self.request_time)
+
+    def output(self, msg_deliver):
+        """Runs the model's output function on the imminent members"""
+        self._imminent = self.imminent_members()
+        if self._imminent.size:
+            self.array_model.output(self._imminent, msg_deliver)
+
+    def int_trans(self):
+        """Runs the model's internal transition on the imminent members"""
+        imminent = self._take_imminent()
+        if imminent.size:
+            self.array_model.int_trans(imminent)
+            self._transitioned = imminent
+
+    def ext_trans(self, port, msg):
+        """Runs the model's external transition for one message"""
+        self.ext_trans_bag(((port, msg),))
+
+    def ext_trans_bag(self, port_msgs):
+        """Runs the model's external transition once per port of the bag
+
+        Args:
+            port_msgs (Iterable[tuple[str, SysMessage]]): bag of messages
+                with their input ports
+        """
+        model = self.array_model
+        for port, (members, values) in self._collect_inputs(port_msgs).items():
+            model.ext_trans(port, members, values)
+            self._receivers.append(members)
+
+    def con_trans(self, port_msgs):
+        """Runs the model's confluent transition on the imminent members
+        with the whole bag grouped per port"""
+        imminent = self._take_imminent()
+        if not imminent.size:
+            self.ext_trans_bag(port_msgs)
+            return
+        inputs = self._collect_inputs(port_msgs)
+        self.array_model.con_trans(imminent, inputs)
+        self._transitioned = imminent
+        self._receivers.extend(members for members, _ in inputs.values())
+
+    def time_advance(self):
+        """Returns the smallest time advance across the population"""
+        sigma = self.array_model.sigma
+        return float(sigma.min()) if sigma.size else Infinite
+
+    def _take_imminent(self):
+        """Returns the imminent members found by :py:meth:`output`"""
+        imminent = self._imminent
+        self._imminent = None
+        return self.imminent_members() if imminent is None else imminent
+
+    @staticmethod
+    def _collect_inputs(port_msgs):
+        """Groups a bag of messages into ``port -> (members, values)``."""
+        grouped = {}
+        for port, msg in port_msgs:
+            pairs = grouped.get(port)
+            if pairs is None:
+                grouped[port] = pairs = []
+            pairs.extend(msg.retrieve())
+
+        inputs = {}
+        for port, pairs in grouped.items():
+            members = np.fromiter((p[0] for p in pairs), dtype=np.intp, count=len(pairs))
+            inputs[port] = (members, [p[1] for p in pairs])
+        return inputs
+
+    def set_req_time(self, global_time):
+        """Reschedule the members that transitioned at ``global_time``.
+
+        Imminent members and every addressed receiver get
+        ``next_t = global_time + sigma``; receivers flagged through
+        ``cancel_rescheduling`` keep their previous deadline when it is
+        earlier. The request time is then ``next_t.min()``.
+        """
+        model = self.array_model
+        self.global_time = global_time
+        model.global_time = global_time
+        next_t = model.next_t
+
+        if not self._scheduled:
+            # First activation: every member starts its time advance now.
+            self._scheduled = True
+            np.add(global_time, model.sigma, out=next_t)
+
+        imminent = self._transitioned
+        if imminent is not None:
+            next_t[imminent] = global_time + model.sigma[imminent]
+            self._transitioned = None
+        if self._receivers:
+            receivers = np.unique(np.concatenate(self._receivers))
+            self._receivers = []
+            rescheduled = global_time + model.sigma[receivers]
+            cancel = model._cancel_mask
+            if cancel is not None:
+                keep = cancel[receivers]
+                rescheduled[keep] = np.minimum(rescheduled[keep], next_t[receivers][keep])
+                model._cancel_mask = None
+            next_t[receivers] = rescheduled
+
+        self._imminent = None
+        self.request_time = float(next_t.min()) if next_t.size else Infinite
+
+    def get_req_time(self):
+        """Returns the request time"""
+        return self.request_time
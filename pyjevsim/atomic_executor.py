@@ -0,0 +1,72 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains AtomicExecutor, the lean executor for classic-DEVS AtomicModels driven by time_advance().
+"""
+
+from .atomic_model import AtomicModel
+from .behavior_executor import BehaviorExecutor
+from .definition import Infinite
+
+
+class AtomicExecutor(BehaviorExecutor):
+    """
+    Executes an :class:`AtomicModel` the classic-DEVS way.
+
+    The next event time is ``global_time + time_advance()``, evaluated
+    once per transition. Models that keep the inherited
+    ``AtomicModel.time_advance`` are read inline (``sigma``, else the
+    state table), so they pay no method call at all; models that
+    override it are called. There is no cancel-reschedule bookkeeping:
+    an AtomicModel that wants to keep its old deadline after an
+    external event sets ``sigma`` to the time remaining instead.
+
+    ``ExecutorFactory`` picks this executor for every ``AtomicModel``.
+
+    Args:
+        itime (int or Infinite): Time of instance creation
+        dtime (int or Infinite): Time of instance destruction
+        ename (str): SysExecutor name
+        behavior_model (AtomicModel): Atomic Model
+    """
+
+    __slots__ = ("_custom_ta",)
+
+    def __init__(self, itime=Infinite, dtime=Infinite, ename="default", behavior_model=None, parent=None):
+        super().__init__(itime, dtime, ename, behavior_model, parent)
+        self._custom_ta = type(behavior_model).time_advance is not AtomicModel.time_advance
+
+    def ext_trans(self, port, msg):
+        """Handles external transition"""
+        self.behavior_model.ext_trans(port, msg)
+
+    def con_trans(self, port_msgs):
+        """Handles confluent transition"""
+        self.behavior_model.con_trans(port_msgs)
+
+    def time_advance(self):
+        """Returns the model's time advance"""
+        return self.behavior_model.time_advance()
+
+    def set_req_time(self, global_time):
+        """Sets the next request time to ``global_time + time_advance()``"""
+        bm = self.behavior_model
+        self.global_time = global_time
+        bm.global_time = global_time
+
+        if self._custom_ta:
+            ta = bm.time_advance()
+        else:
+            ta = bm.sigma
+            if ta is None:
+                ta = bm._states.get(bm._cur_state, -1)
+
+        self.request_time = Infinite if ta == Infinite else global_time + ta
+
+    def get_req_time(self):
+        """Returns the request time"""
+        return self.request_time
@@ -15,6 +15,18 @@ from .behavior_model import BehaviorModel
 from .definition import ModelType
 
 class AtomicModel(BehaviorModel):
+	"""Classic-DEVS atomic model, executed by AtomicExecutor.
+
+	The time advance is ``time_advance()``, evaluated once after every
+	transition. The default returns ``sigma`` when it is set and the
+	current state's deadline otherwise. Unlike on a plain BehaviorModel,
+	``sigma`` (and ``hold_in`` / ``passivate``) persists until the model
+	changes it, as in xdevs or PythonPDEVS.
+	``cancel_rescheduling`` has no effect here.
+
+	Args:
+		_name (str): Unique model name
+	"""
 	def __init__(self, _name=""):
 		super().__init__(_name)
 
@@ -33,7 +45,14 @@ class AtomicModel(BehaviorModel):
 		"""Defines the output function, to be implemented by subclasses"""
 		pass
 
-	@abstractmethod
 	def time_advance(self):
-		"""Defines the output function, to be implemented by subclasses"""
-		return -1
\ No newline at end of file
+		"""
+		Returns the time until the next internal transition
+
+		Returns:
+			float: ``sigma`` if set, else the current state's deadline
+			(-1 for an unknown state)
+		"""
+		if self.sigma is not None:
+			return self.sigma
+		return self._states.get(self._cur_state, -1)
\ No newline at end of file
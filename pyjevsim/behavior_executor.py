@@ -21,13 +21,30 @@ class BehaviorExecutor(Executor):
         dtime (int or Infinite): Time of instance destruction
         ename (str): SysExecutor name
         behavior_model (ModelType.BEHAVIORAL): Behavior Model
+
+    The fixed fields are slotted to keep million-model runs small.
+    ``__dict__`` stays in the slots so that subclasses and the profiler
+    can still attach attributes; it is only allocated when they do.
     """
+
+    __slots__ = (
+        "_next_event_t",
+        "_cur_state",
+        "request_time",
+        "behavior_model",
+        "_cancel_reschedule_f",
+        "_cached_destruct_time",
+        "_obj_id",
+        "global_time",
+        "__dict__",
+    )
+
     def __init__(self, itime=Infinite, dtime=Infinite, ename="default", behavior_model=None, parent=None):
         super().__init__(itime, dtime, ename, behavior_model, parent)
 
         self._next_event_t = 0  # Next event time
         self._cur_state = ""  # Current state of the behavior executor
-        self.request_time = float("inf")  # Request time initialized to infinity
+        self.request_time = Infinite  # Request time initialized to infinity
 
         self.behavior_model = behavior_model #Behavior Model
         self._cancel_reschedule_f = False #cancel reschedule flag
@@ -131,6 +148,8 @@ class BehaviorExecutor(Executor):
     # Time Advance Function
     def time_advance(self):
         """Returns the time advance value for the current state"""
+        if self.behavior_model.sigma is not None:
+            return self.behavior_model.sigma
         if self.behavior_model._cur_state in self.behavior_model._states:
             return self.behavior_model._states[self.behavior_model._cur_state]
 
@@ -148,8 +167,13 @@ class BehaviorExecutor(Executor):
         self.global_time = global_time
         bm.global_time = global_time
 
-        # Inlined `time_advance`: read state and look up its deadline.
-        ta = bm._states.get(bm._cur_state, -1)
+        # Inlined `time_advance`: a one-shot sigma set by `hold_in`
+        # wins; otherwise look up the current state's deadline.
+        ta = bm.sigma
+        if ta is None:
+            ta = bm._states.get(bm._cur_state, -1)
+        else:
+            bm.sigma = None
 
         if ta == Infinite:
             self._next_event_t = Infinite
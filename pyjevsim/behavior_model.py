@@ -12,32 +12,106 @@ from abc import abstractmethod
 from collections import OrderedDict
 
 from .core_model import CoreModel
-from .definition import ModelType
+from .definition import Infinite, ModelType
+
+class _LazyMap:
+    """Class attribute that creates an empty dict on first access and
+    stores it on the instance under the same name.
+
+    Being a non-data descriptor, it is shadowed by that instance entry
+    afterwards, so later reads cost nothing extra.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name] = {}
+        return value
+
 
 class BehaviorModel(CoreModel):
     """BehaviorModel template to inherit when constructing a new Model.
 
+    The four transition maps are created on first use: most models never
+    declare transitions, and four empty dicts are about a third of a
+    bare model's footprint.
+
+    States and ports may also be declared on the class instead of in
+    ``__init__``::
+
+        class Generator(BehaviorModel):
+            state_table = {"WAIT": Infinite, "GEN": 1}
+            initial_state = "WAIT"
+            input_ports = ("start",)
+            output_ports = ("out",)
+
+    The tables are built once per class and shared by all instances
+    (flyweight). ``insert_state``, ``update_state`` and
+    ``insert_*_port`` copy them on an instance's first change, so only
+    instances that override something pay for their own copy.
+
     Args:
         _name (str): Unique model name
-    """   
+    """
+
+    #: Class-level ``{state: deadline}`` table shared by all instances
+    state_table = None
+    #: State set by ``__init__`` (``init_state`` still overrides it)
+    initial_state = ""
+    #: Class-level input port names shared by all instances
+    input_ports = ()
+    #: Class-level output port names shared by all instances
+    output_ports = ()
+
+    #: Time advance for the next reschedule only (see :py:meth:`hold_in`);
+    #: ``None`` means the state table decides
+    sigma = None
+
+    # True when ``_states`` is the class-level table built from
+    # ``state_table``; it is copied on the first insert_state/update_state.
+    _shared_states = False
+
+    # External transition map
+    external_transition_map_tuple = _LazyMap()
+    external_transition_map_state = _LazyMap()
+
+    # Internal transition map
+    internal_transition_map_tuple = _LazyMap()
+    internal_transition_map_state = _LazyMap()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "state_table" in cls.__dict__:
+            cls._states = {name: float(deadline)
+                           for name, deadline in cls.state_table.items()}
+            cls._shared_states = True
+        if "input_ports" in cls.__dict__ or "output_ports" in cls.__dict__:
+            cls.external_input_ports = list(cls.input_ports)
+            cls.external_output_ports = list(cls.output_ports)
+            cls._shared_ports = True
+
     def __init__(self, _name=""):
 
         super().__init__(_name, ModelType.BEHAVIORAL)
-        self._states = {}
-
-        # External transition map
-        self.external_transition_map_tuple = {} 
-        self.external_transition_map_state = {}
-        
-        # Internal transition map
-        self.internal_transition_map_tuple = {}
-        self.internal_transition_map_state = {}
-
+        # A shared table is still bound on the instance, so that
+        # set_req_time finds it without falling back to the class.
+        self._states = type(self)._states if self._shared_states else {}
 
         self._cancel_reschedule_f = False
-        self._cur_state = ""
+        self._cur_state = self.initial_state
+        self.sigma = None
         self.global_time = 0
 
+    def _own_states(self):
+        """Returns this instance's state table, copying the shared one first."""
+        states = self._states
+        if self._shared_states and states is type(self)._states:
+            states = self._states = dict(states)
+        return states
+
     def insert_state(self, name, deadline="inf"):
         """
         Insert "state" into the BehaviorModel
@@ -46,7 +120,7 @@ class BehaviorModel(CoreModel):
             name (str): State name
             deadline (str or Infinite): Time until the state is active. Defaults to Infinite.
         """
-        self._states[name] = float(deadline)
+        self._own_states()[name] = float(deadline)
 
     def update_state(self, name, deadline="inf"):
         """
@@ -56,7 +130,28 @@ class BehaviorModel(CoreModel):
             name (str): state name to update
             deadline (str or Infinite): Time until the state is active. Defaults to Infinite.
         """
-        self._states[name] = float(deadline)
+        self._own_states()[name] = float(deadline)
+
+    def hold_in(self, state, sigma=None):
+        """
+        Moves to ``state`` and sets the time advance of this transition
+
+        Unlike ``update_state``, the state table is left alone: ``sigma``
+        applies to this one reschedule, and the executor goes back to the
+        table's deadline afterwards. Setting ``self.sigma`` directly does
+        the same without changing state.
+
+        Args:
+            state (str): Next state
+            sigma (float or Infinite, optional): Time until the next
+                internal transition. Defaults to the state's deadline.
+        """
+        self._cur_state = state
+        self.sigma = None if sigma is None else float(sigma)
+
+    def passivate(self):
+        """Sets an infinite time advance for this transition without changing state"""
+        self.sigma = Infinite
 
     def cancel_rescheduling(self):
         """Canceled scheduling"""
@@ -113,7 +208,8 @@ class BehaviorModel(CoreModel):
         Args:
             port_msgs (Iterable[tuple[str, SysMessage]]): the bag of
                 messages that arrived this instant, paired with the input
-                port each was delivered on.
+                port each was delivered on. The bag is reused by the
+                next tick; copy it if it must outlive this call.
         """
         self.int_trans()
         for port, msg in port_msgs:
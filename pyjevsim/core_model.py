@@ -14,6 +14,12 @@ class CoreModel(SystemObject):
     All forms of Models in Pyjevsim have a CoreModel as their foundation. 
     CoreModel class serves as a base model with basic functionalities for input and output ports.
     """
+
+    # True when the port lists are class attributes shared by every
+    # instance (see BehaviorModel.input_ports); they are copied on the
+    # first insert.
+    _shared_ports = False
+
     def __init__(self, _name, _type):
         """
         Args:
@@ -25,10 +31,11 @@ class CoreModel(SystemObject):
         self.model_type = _type
         self._name = _name
 
-        # Input Ports Declaration
-        self.external_input_ports = []
-        # Output Ports Declaration
-        self.external_output_ports = []
+        if not self._shared_ports:
+            # Input Ports Declaration
+            self.external_input_ports = []
+            # Output Ports Declaration
+            self.external_output_ports = []
 
     def set_name(self, _name):
         """
@@ -63,7 +70,10 @@ class CoreModel(SystemObject):
         Args:
             port (str): Name of the input port
         """
-        self.external_input_ports.append(port)
+        ports = self.external_input_ports
+        if self._shared_ports and ports is type(self).external_input_ports:
+            ports = self.external_input_ports = list(ports)
+        ports.append(port)
 
     def retrieve_input_ports(self):
         """
@@ -81,7 +91,10 @@ class CoreModel(SystemObject):
         Args:
             port (str): Name of the output port
         """
-        self.external_output_ports.append(port)
+        ports = self.external_output_ports
+        if self._shared_ports and ports is type(self).external_output_ports:
+            ports = self.external_output_ports = list(ports)
+        ports.append(port)
 
     def retrieve_output_ports(self):
         """
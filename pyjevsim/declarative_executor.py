@@ -0,0 +1,109 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains DeclarativeExecutor, which runs a DeclarativeBehaviorModel from its compiled tables without calling model code.
+"""
+
+from .behavior_executor import BehaviorExecutor
+from .definition import Infinite
+from .system_message import SysMessage
+
+
+class DeclarativeExecutor(BehaviorExecutor):
+    """
+    Executes a :class:`~pyjevsim.declarative_model.DeclarativeBehaviorModel`.
+
+    The current state is an integer code into the model's
+    :class:`~pyjevsim.declarative_model.CompiledFSM`, and every
+    transition, output and deadline is a list lookup. The model's
+    ``_cur_state`` is kept in step so that snapshots and inspection
+    still see the state name. An ignored input keeps the pending
+    request time, as ``cancel_rescheduling`` would.
+
+    ``ExecutorFactory`` picks this executor for every
+    DeclarativeBehaviorModel.
+
+    Args:
+        itime (int or Infinite): Time of instance creation
+        dtime (int or Infinite): Time of instance destruction
+        ename (str): SysExecutor name
+        behavior_model (DeclarativeBehaviorModel): Table-driven model
+    """
+
+    __slots__ = ("_fsm", "_code", "_hold")
+
+    def __init__(self, itime=Infinite, dtime=Infinite, ename="default", behavior_model=None, parent=None):
+        super().__init__(itime, dtime, ename, behavior_model, parent)
+        fsm = self._fsm = behavior_model.compile()
+        try:
+            self._code = fsm.codes[behavior_model._cur_state]
+        except KeyError:
+            raise ValueError(
+                f"{behavior_model.get_name()!r}: initial state "
+                f"{behavior_model._cur_state!r} is not in the state table"
+            ) from None
+        # None: no transition yet this instant; True: only ignored
+        # inputs; False: the state changed.
+        self._hold = None
+
+    def init_state(self, state):
+        """Initializes the state of the executor"""
+        self._code = self._fsm.codes[state]
+        self.behavior_model._cur_state = state
+
+    def output(self, msg_deliver):
+        """Emits the current state's outputs"""
+        emits = self._fsm.outputs[self._code]
+        if emits:
+            name = self.behavior_model._name
+            for port, value in emits:
+                msg_deliver.insert_message(SysMessage.single(name, port, value))
+
+    def int_trans(self):
+        """Moves to the current state's internal successor"""
+        fsm = self._fsm
+        code = self._code = fsm.int_next[self._code]
+        self.behavior_model._cur_state = fsm.names[code]
+        self._hold = False
+
+    def ext_trans(self, port, msg):
+        """Moves on ``port`` if the table has a transition for it"""
+        fsm = self._fsm
+        index = fsm.port_codes.get(port)
+        code = -1 if index is None else fsm.ext_next[self._code * fsm.n_ports + index]
+        if code < 0:
+            if self._hold is None:
+                self._hold = True
+            return
+        self._code = code
+        self.behavior_model._cur_state = fsm.names[code]
+        self._hold = False
+
+    def con_trans(self, port_msgs):
+        """Internal transition, then the external ones"""
+        self.int_trans()
+        for port, msg in port_msgs:
+            self.ext_trans(port, msg)
+
+    def time_advance(self):
+        """Returns the time advance of the current state"""
+        return self._fsm.deadlines[self._code]
+
+    def set_req_time(self, global_time):
+        """Sets the next request time from the current state's deadline"""
+        self.global_time = global_time
+        self.behavior_model.global_time = global_time
+        hold = self._hold
+        self._hold = None
+        if hold:
+            return
+        ta = self._fsm.deadlines[self._code]
+        self.request_time = Infinite if ta == Infinite else global_time + ta
+
+    def get_req_time(self):
+        """Returns the request time"""
+        return self.request_time
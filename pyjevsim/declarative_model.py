@@ -0,0 +1,208 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains DeclarativeBehaviorModel, a finite-state machine model defined entirely by tables, and CompiledFSM, the integer-coded form the DeclarativeExecutor runs.
+"""
+
+from .behavior_model import BehaviorModel
+from .system_message import SysMessage
+
+
+class CompiledFSM:
+    """Flat integer tables for one state machine.
+
+    States are numbered ``0 .. n_states - 1`` in state-table order and
+    input ports ``0 .. n_ports - 1``:
+
+    - ``deadlines[s]`` — time advance of state ``s``
+    - ``int_next[s]`` — state after the internal transition of ``s``
+    - ``ext_next[s * n_ports + p]`` — state after an input on port
+      ``p`` in state ``s``, or -1 when the input is ignored
+    - ``outputs[s]`` — ``((port, value), ...)`` emitted when ``s`` expires
+    """
+
+    __slots__ = ("names", "codes", "port_codes", "n_ports",
+                 "deadlines", "int_next", "ext_next", "outputs")
+
+    def __init__(self, states, external, internal, outputs):
+        """
+        Args:
+            states (dict): ``{state: deadline}``
+            external (dict): ``{(state, port): next state}``
+            internal (dict): ``{state: next state}``
+            outputs (dict): ``{state: ((port, value), ...)}``
+
+        Raises:
+            ValueError: A table refers to a state missing from ``states``
+        """
+        self.names = tuple(states)
+        codes = self.codes = {name: code for code, name in enumerate(self.names)}
+
+        def code_of(state):
+            try:
+                return codes[state]
+            except KeyError:
+                raise ValueError(f"unknown state {state!r}") from None
+
+        ports = sorted({port for _, port in external}, key=str)
+        self.port_codes = {port: index for index, port in enumerate(ports)}
+        self.n_ports = n_ports = len(ports)
+
+        self.deadlines = [float(states[name]) for name in self.names]
+        self.int_next = list(range(len(self.names)))
+        for state, post in internal.items():
+            self.int_next[code_of(state)] = code_of(post)
+        self.ext_next = [-1] * (len(self.names) * n_ports)
+        for (state, port), post in external.items():
+            self.ext_next[code_of(state) * n_ports + self.port_codes[port]] = code_of(post)
+        self.outputs = [()] * len(self.names)
+        for state, emits in outputs.items():
+            self.outputs[code_of(state)] = tuple(emits)
+
+    def next_external(self, code, port):
+        """
+        Returns:
+            int: The state code after an input on ``port``, or -1 when
+            the input is ignored
+        """
+        index = self.port_codes.get(port)
+        if index is None:
+            return -1
+        return self.ext_next[code * self.n_ports + index]
+
+
+class DeclarativeBehaviorModel(BehaviorModel):
+    """A BehaviorModel whose transitions, outputs and deadlines are tables.
+
+    Nothing needs overriding::
+
+        class Door(DeclarativeBehaviorModel):
+            state_table = {"closed": Infinite, "opening": 2, "open": Infinite}
+            initial_state = "closed"
+            input_ports = ("push",)
+            output_ports = ("opened",)
+            external_transitions = {("closed", "push"): "opening"}
+            internal_transitions = {"opening": "open"}
+            state_outputs = {"opening": (("opened", True),)}
+
+    When a state's deadline expires, its ``state_outputs`` are emitted
+    and ``internal_transitions`` gives the next state (the same state by
+    default). An input on a port listed in ``external_transitions`` for
+    the current state moves to the next state. Any other input is ignored
+    and leaves the pending deadline alone. The message payload is not
+    inspected.
+
+    ``insert_external_transition(state, port, next)``,
+    ``insert_internal_transition(state, None, next)`` and
+    :py:meth:`insert_state_output` add per-instance entries on top of the
+    class tables.
+
+    ``DeclarativeExecutor`` compiles the tables once into integer state
+    codes and flat lists (:class:`CompiledFSM`). It then runs every
+    transition without calling model code. Models that only use class
+    tables share one compiled FSM per class. The ``ext_trans`` /
+    ``int_trans`` / ``output`` below interpret the same tables for
+    executors that call the model, such as HLAExecutor.
+    """
+
+    #: ``{(state, input port): next state}``
+    external_transitions = {}
+    #: ``{state: next state}`` taken when the state's deadline expires
+    internal_transitions = {}
+    #: ``{state: ((output port, value), ...)}`` emitted when the state's deadline expires
+    state_outputs = {}
+
+    # Set once an instance adds its own table entries; its FSM is then
+    # compiled per instance instead of per class.
+    _fsm = None
+    _custom_tables = False
+
+    def __init__(self, _name=""):
+        super().__init__(_name)
+        self._state_outputs = None
+
+    def insert_state(self, name, deadline="inf"):
+        super().insert_state(name, deadline)
+        self._fsm = None
+
+    def update_state(self, name, deadline="inf"):
+        super().update_state(name, deadline)
+        self._fsm = None
+
+    def insert_external_transition(self, pre_state, event, post_state):
+        super().insert_external_transition(pre_state, event, post_state)
+        self._custom_tables = True
+        self._fsm = None
+
+    def insert_internal_transition(self, pre_state, event, post_state):
+        super().insert_internal_transition(pre_state, event, post_state)
+        self._custom_tables = True
+        self._fsm = None
+
+    def insert_state_output(self, state, port, value=None):
+        """
+        Emits ``value`` on ``port`` whenever ``state`` expires
+
+        Args:
+            state (str): State name
+            port (str): Output port
+            value (any, optional): Payload of the emitted message
+        """
+        if self._state_outputs is None:
+            self._state_outputs = {}
+        self._state_outputs.setdefault(state, []).append((port, value))
+        self._custom_tables = True
+        self._fsm = None
+
+    def compile(self):
+        """
+        Returns:
+            CompiledFSM: The integer tables for this model, built on first
+            use and shared per class while the instance adds nothing
+        """
+        fsm = self._fsm
+        if fsm is not None:
+            return fsm
+        cls = type(self)
+        shared = (not self._custom_tables and self._shared_states
+                  and self._states is cls._states)
+        if shared:
+            fsm = cls.__dict__.get("_class_fsm")
+            if fsm is None:
+                fsm = CompiledFSM(self._states, self.external_transitions,
+                                  self.internal_transitions, self.state_outputs)
+                cls._class_fsm = fsm
+        else:
+            external = dict(self.external_transitions)
+            internal = dict(self.internal_transitions)
+            outputs = {state: list(emits) for state, emits in self.state_outputs.items()}
+            if self._custom_tables:
+                external.update(self.external_transition_map_tuple)
+                internal.update((pre, post) for (pre, _), post
+                                in self.internal_transition_map_tuple.items())
+                for state, emits in (self._state_outputs or {}).items():
+                    outputs.setdefault(state, []).extend(emits)
+            fsm = CompiledFSM(self._states, external, internal, outputs)
+        self._fsm = fsm
+        return fsm
+
+    def ext_trans(self, port, msg):
+        fsm = self.compile()
+        post = fsm.next_external(fsm.codes[self._cur_state], port)
+        if post < 0:
+            self.cancel_rescheduling()
+        else:
+            self._cur_state = fsm.names[post]
+
+    def int_trans(self):
+        fsm = self.compile()
+        self._cur_state = fsm.names[fsm.int_next[fsm.codes[self._cur_state]]]
+
+    def output(self, msg_deliver):
+        fsm = self.compile()
+        for port, value in fsm.outputs[fsm.codes[self._cur_state]]:
+            msg_deliver.insert_message(SysMessage.single(self._name, port, value))
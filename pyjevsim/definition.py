@@ -71,6 +71,7 @@ class ModelType(Enum):
     BEHAVIORAL = 0 #BehaviorModel type : DEVS Atomic Model
     STRUCTURAL = 1 #StructuralModel type : DEVS Coupled Model
     UTILITY = 2 
+    ARRAY = 3 #ArrayBehaviorModel type : population of identical DEVS Atomic Models
 
 
 class ExecutionType(Enum):
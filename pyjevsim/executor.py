@@ -18,8 +18,19 @@ class Executor:
     stores ``(req_time, obj_id, entry_id, executor)`` tuples — Python
     settles the order on the first three immutable fields without ever
     comparing executor objects directly.
+
+    The base fields live in ``__slots__``; subclasses that declare no
+    slots of their own still get a ``__dict__``.
+
+    An executor that sets ``groups_inputs`` receives an instant's whole
+    bag in one ``ext_trans_bag(port_msgs)`` call instead of one
+    ``ext_trans`` per message.
     """
 
+    __slots__ = ("engine_name", "_instance_t", "_destruct_t", "model", "parent")
+
+    groups_inputs = False
+
     def __init__(self, itime, dtime, ename, model, parent):
         """
         Args:
@@ -9,7 +9,11 @@ This module contains an ExecutorFactory that decorates an object of type Model i
 """
 
 from .definition import ModelType
+from .atomic_executor import AtomicExecutor
+from .atomic_model import AtomicModel
 from .behavior_executor import BehaviorExecutor
+from .declarative_executor import DeclarativeExecutor
+from .declarative_model import DeclarativeBehaviorModel
 
 class ExecutorFactory:
     """Factory class to create different types of executors."""
@@ -39,6 +43,10 @@ class ExecutorFactory:
             return self.create_structural_executor(
                 global_time, ins_t, des_t, en_name, model, parent
             )
+        elif model.get_model_type() == ModelType.ARRAY:
+            return self.create_array_executor(
+                global_time, ins_t, des_t, en_name, model, parent
+            )
         else:
             return None
 
@@ -54,7 +62,13 @@ class ExecutorFactory:
 
         Returns:
             BehaviorModelExecutor: The created BehaviorModelexecutor
+            (an AtomicExecutor for an AtomicModel, a DeclarativeExecutor
+            for a DeclarativeBehaviorModel)
         """
+        if isinstance(model, DeclarativeBehaviorModel):
+            return DeclarativeExecutor(ins_t, des_t, en_name, model, parent)
+        if isinstance(model, AtomicModel):
+            return AtomicExecutor(ins_t, des_t, en_name, model, parent)
         return BehaviorExecutor(ins_t, des_t, en_name, model, parent)
 
     def create_structural_executor(self, global_time, ins_t, des_t, en_name, model, parent):
@@ -74,4 +88,20 @@ class ExecutorFactory:
         return StructuralExecutor(
             global_time, ins_t, des_t, en_name, model, parent, self 
         )
-    
\ No newline at end of file
+    
+
+    def create_array_executor(self, _, ins_t, des_t, en_name, model, parent):
+        """Create ArrayExecutor
+
+        Args:
+            _ (float): Unused global time
+            ins_t (float): Instance creation time
+            des_t (float): Destruction time
+            en_name (str): SysExecutor name
+            model (ArrayBehaviorModel): Population model to execute
+
+        Returns:
+            ArrayExecutor: created ArrayExecutor
+        """
+        from .array_executor import ArrayExecutor
+        return ArrayExecutor(ins_t, des_t, en_name, model, parent)
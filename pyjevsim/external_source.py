@@ -0,0 +1,97 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains ExternalSource, the pull-based protocol through which a SysExecutor reads external input events lazily, and IterableSource, its implementation over a time-ordered iterable.
+"""
+
+from abc import ABC, abstractmethod
+
+from .definition import Infinite
+
+
+class ExternalSource(ABC):
+    """A time-ordered stream of external input events.
+
+    A :class:`SysExecutor` polls attached sources (see
+    :py:meth:`SysExecutor.add_external_source`) instead of holding their
+    events in ``input_event_queue``. It only asks for the next event time
+    and takes events once their instant is due, so the stream can be far
+    larger than memory (e.g. a trace file read line by line).
+
+    Times are absolute simulation times and must not decrease.
+    Subclasses implement :py:meth:`peek_time` and :py:meth:`pop`.
+    """
+
+    @abstractmethod
+    def peek_time(self):
+        """
+        Returns the time of the next event without consuming it.
+
+        Returns:
+            float: The next event time, or ``Infinite`` when exhausted
+        """
+        pass
+
+    @abstractmethod
+    def pop(self):
+        """
+        Consumes the next event.
+
+        Returns:
+            tuple: ``(time, port, payload)``
+        """
+        pass
+
+
+class IterableSource(ExternalSource):
+    """:class:`ExternalSource` over an iterable of ``(time, port, payload)``.
+
+    The iterable is consumed one event ahead, so a generator over a file
+    keeps only the current line in memory::
+
+        def trace(path):
+            with open(path) as f:
+                for line in f:
+                    t, value = line.split(",")
+                    yield float(t), "in", float(value)
+
+        ss.add_external_source(IterableSource(trace("traffic.csv")))
+
+    Raises ``ValueError`` when an event time is smaller than the one
+    before it.
+    """
+
+    def __init__(self, events):
+        """
+        Args:
+            events (iterable): ``(time, port, payload)`` tuples in
+                non-decreasing time order
+        """
+        self._events = iter(events)
+        self._head = None
+        self._last_time = -Infinite
+        self._advance()
+
+    def _advance(self):
+        head = next(self._events, None)
+        if head is not None:
+            if head[0] < self._last_time:
+                raise ValueError(
+                    f"external event at {head[0]} follows one at {self._last_time}"
+                )
+            self._last_time = head[0]
+        self._head = head
+
+    def peek_time(self):
+        return Infinite if self._head is None else self._head[0]
+
+    def pop(self):
+        head = self._head
+        if head is None:
+            raise IndexError("pop from an exhausted IterableSource")
+        self._advance()
+        return head
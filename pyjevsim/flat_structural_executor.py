@@ -0,0 +1,74 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains FlatStructuralExecutor, the placeholder a SysExecutor registers for a StructuralModel whose children were flattened into the root.
+"""
+
+from .executor import Executor
+
+class FlatStructuralExecutor(Executor):
+    """Handle for a StructuralModel flattened into its root SysExecutor.
+
+    With ``SysExecutor(..., flatten_structural=True)`` the children of a
+    StructuralModel are registered directly with the root executor, so
+    they share its FEL and its Parallel-DEVS tick. This object is what
+    ``product_port_map`` / ``model_map`` keep for the structural model
+    itself: it is never scheduled, but it lets ``get_model``,
+    ``coupling_relation`` and ``remove_entity`` keep addressing the
+    structural model by object or name.
+
+    Couplings that refer to the structural model's own ports are kept on
+    the handle and resolved by ``SysExecutor.freeze`` when the routing
+    index is compiled:
+
+    - ``eic`` — ``in_port -> [(dst_executor, dst_port), ...]``; a
+      destination equal to this handle is an in-to-out pass-through.
+    - ``members`` — the child executors (behavior executors and nested
+      handles) created for the structural model's children.
+
+    Args:
+        itime (float): Instance creation time
+        dtime (float): Destruction time
+        ename (str): SysExecutor name
+        model (StructuralModel): The flattened structural model
+        parent (SysExecutor): The root executor
+    """
+    def __init__(self, itime, dtime, ename, model, parent):
+        super().__init__(itime, dtime, ename, model, parent)
+        self.structural_model = model
+        self.members = []
+        self.eic = {}
+
+        self._obj_id = model.get_obj_id()
+        self._cached_destruct_time = self._destruct_t
+
+    def __str__(self):
+        return f"[N]:{self.get_name()}, [S]:flattened"
+
+    def get_core_model(self):
+        """Returns the flattened StructuralModel"""
+        return self.structural_model
+
+    def get_name(self):
+        """Returns the name of the structural model"""
+        return self.structural_model.get_name()
+
+    def get_engine_name(self):
+        """Returns the name of the engine"""
+        return self.engine_name
+
+    def get_create_time(self):
+        """Returns the instance creation time"""
+        return self._instance_t
+
+    def get_destruct_time(self):
+        """Returns the destruction time"""
+        return self._cached_destruct_time
+
+    def get_obj_id(self):
+        """Returns the object ID of the structural model"""
+        return self._obj_id
@@ -0,0 +1,525 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains TimeWarpSysExecutor, an optimistic (Time Warp) multi-process driver with in-memory state saving, rollback and anti-messages.
+"""
+
+import heapq
+import queue
+import threading
+import time
+import traceback
+from bisect import bisect_left
+
+import dill
+
+from .behavior_executor import BehaviorExecutor
+from .definition import Infinite
+from .message_deliverer import MessageDeliverer
+from .parallel_executor import (
+    ParallelSysExecutor,
+    _final_states,
+    _PartitionGraph,
+    _restore_state,
+    _save_state,
+    _slot_names,
+)
+from .system_message import SysMessage
+
+
+class TimeWarpSysExecutor(ParallelSysExecutor):
+    """Optimistic parallel simulation (Time Warp) over worker processes.
+
+    Partitioning and the registration API are those of
+    :class:`ParallelSysExecutor`, but no lookahead is needed: each
+    worker (logical process) runs ahead speculatively. Virtual time is
+    the pair ``(t, round)`` where ``round`` counts the zero-delay
+    cascade rounds of the sequential engine at ``t``, so even
+    zero-lookahead interactions produce the sequential results.
+
+    - State saving — incremental. Before every round, only the models
+      the round is about to touch (the imminent ones and the receivers
+      of its messages) are saved: the plain fields of their executors
+      and a ``dill`` copy of the model's attributes. A round that
+      creates or destroys entities, or touches a non-behavioral
+      executor, saves the whole partition graph instead. Attributes
+      that refer to the SysExecutor, to an executor or to a model are
+      saved as references and rebound to the partition's live objects
+      on restore. Everything else is copied per model, so models must
+      not share other mutable objects.
+    - Rollback — a message stamped at or before the last processed
+      round (a straggler) undoes the processed rounds from the newest
+      back to the first affected one, restoring their saved models and
+      rescheduling them. Messages sent by the undone rounds are
+      cancelled lazily: re-execution that regenerates an identical
+      message reuses it, and only messages that are not regenerated are
+      cancelled with anti-messages (which roll back their receivers in
+      turn). Without this, two partitions exchanging messages at the
+      same stamp would roll each other back forever.
+    - GVT — every ``gvt_interval`` seconds (or as soon as every worker
+      has run out of work) the parent freezes the workers and counts
+      sent/received messages until no message is in flight; GVT is then
+      the smallest unprocessed stamp. Checkpoints, inputs and sent-logs
+      below GVT are reclaimed (fossil collection) and external outputs
+      below GVT are committed.
+
+    After :py:meth:`simulate`, ``stats`` maps each partition to its
+    ``rounds``, ``rollbacks``, ``rolled_back`` rounds and
+    ``anti_messages`` counters.
+
+    Args:
+        _time_resolution (float): The time resolution of each worker
+        _sim_name (str, optional): The name of the simulation
+        workers (int, optional): Number of partitions. Defaults to
+            ``os.cpu_count()``.
+        gvt_interval (float, optional): Wall-clock seconds between GVT
+            computations
+    """
+
+    _requires_lookahead = False
+
+    def __init__(self, _time_resolution, _sim_name="default", workers=None, gvt_interval=0.05):
+        super().__init__(_time_resolution, _sim_name, workers)
+        self.gvt_interval = gvt_interval
+        self.stats = {}
+
+    def _run_worker(self, plan, part, target_time, inboxes, results):
+        try:
+            _LogicalProcess(self, plan, part, target_time, inboxes, results).run()
+        except BaseException:
+            results.put(dill.dumps(("error", part, traceback.format_exc())))
+
+    def _coordinate(self, target_time, inboxes, results):
+        """Run GVT rounds until GVT passes the horizon, then collect
+        the committed results of every worker."""
+        n = len(inboxes)
+        end = (target_time, 0)
+        epoch = 0
+        try:
+            while True:
+                idle = set()
+                deadline = time.monotonic() + self.gvt_interval
+                while len(idle) < n:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        kind, part, payload = _report(results.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+                    if kind == "idle" and payload == epoch:
+                        idle.add(part)
+
+                gvt = self._compute_gvt(inboxes, results)
+                epoch += 1
+                for inbox in inboxes:
+                    inbox.put(dill.dumps(("gvt", epoch, gvt)))
+                if gvt >= end:
+                    break
+
+            reports = []
+            while len(reports) < n:
+                kind, part, payload = _report(results.get())
+                if kind == "ok":
+                    states, outputs, stats = payload
+                    self.stats[part] = stats
+                    reports.append((kind, part, (states, outputs)))
+            return reports
+        except _WorkerError as exc:
+            return [("error", exc.args[0], exc.args[1])]
+
+    def _compute_gvt(self, inboxes, results):
+        """Freeze every worker and return the global minimum of the
+        unprocessed stamps once no message is in flight.
+
+        Frozen workers still receive (and roll back on) messages but do
+        not start new rounds. Two consecutive polls reporting the same
+        counters with ``sent == received`` prove the channels are empty.
+        """
+        request = dill.dumps(("freeze",))
+        previous = None
+        while True:
+            for inbox in inboxes:
+                inbox.put(request)
+            counts = {}
+            while len(counts) < len(inboxes):
+                kind, part, payload = _report(results.get())
+                if kind == "counts":
+                    counts[part] = payload
+            sent = sum(c[0] for c in counts.values())
+            received = sum(c[1] for c in counts.values())
+            if sent == received and counts == previous:
+                return min(c[2] for c in counts.values())
+            previous = counts
+            request = dill.dumps(("poll",))
+
+
+class _WorkerError(Exception):
+    pass
+
+
+def _report(raw):
+    kind, part, payload = dill.loads(raw)
+    if kind == "error":
+        raise _WorkerError(part, payload)
+    return kind, part, payload
+
+
+class _LogicalProcess:
+    """One Time Warp worker.
+
+    Channel protocol (``stamp`` is ``(t, round)``):
+
+    - ``("msg", src_part, seq, stamp, src_index, src_name, port, body)``
+    - ``("anti", src_part, seq, stamp)`` — cancels message ``seq``
+    - ``("freeze",)`` / ``("poll",)`` — reply with message counters
+    - ``("gvt", epoch, gvt)`` — fossil-collect below ``gvt`` and resume
+    """
+
+    def __init__(self, parallel, plan, part, target_time, inboxes, results):
+        self.parallel = parallel
+        self.part = part
+        self.end = (target_time, 0)
+        self.inboxes = inboxes
+        self.inbox = inboxes[part]
+        self.results = results
+        self._bind(_PartitionGraph(parallel, plan, part))
+
+        self.lvt = (self.ss.global_time, -1)    # last processed stamp
+        # [(stamp, lvt before the round, graph blob or None, saved models,
+        #   input_event_queue copy or None)]
+        self.checkpoints = []
+        self.inputs = {}        # stamp -> {(src_part, seq): (src_index, src_name, port, body)}
+        self.pending = []       # heap of stamps with unprocessed inputs
+        self.sent_log = []      # [(stamp, dst_part, seq, content)]
+        self.lazy = []          # sent_log entries undone by a rollback
+        self.outputs = []       # [(stamp, src, port, body)] not yet committed
+        self.committed = []
+
+        self.seq = 0
+        self.n_sent = 0
+        self.n_received = 0
+        self.epoch = 0
+        self.frozen = False
+        self.finished = False
+        self.stats = {"rounds": 0, "rollbacks": 0, "rolled_back": 0, "anti_messages": 0}
+
+    def _bind(self, graph):
+        self.graph = graph
+        self.ss = graph.ss
+        # dill restores an unlocked RLock with its inner lock held, so a
+        # restored checkpoint would deadlock on the executor's condition.
+        self.ss.condition = threading.Condition()
+        # Per-model saving only knows how to restore behavior executors.
+        executors = list(self.ss.active_obj_map.values())
+        for waiting in self.ss.waiting_obj_map.values():
+            executors.extend(waiting)
+        self.incremental = all(isinstance(ex, BehaviorExecutor) for ex in executors)
+
+    def _put(self, q, message):
+        self.n_sent += 1
+        self.inboxes[q].put(dill.dumps(message))
+
+    def _handle(self, raw):
+        message = dill.loads(raw)
+        kind = message[0]
+        if kind == "msg":
+            _, src_part, seq, stamp, src_index, src_name, port, body = message
+            self.n_received += 1
+            if stamp <= self.lvt:
+                self._rollback(stamp)
+            self.inputs.setdefault(stamp, {})[(src_part, seq)] = (src_index, src_name, port, body)
+            heapq.heappush(self.pending, stamp)
+        elif kind == "anti":
+            _, src_part, seq, stamp = message
+            self.n_received += 1
+            if stamp <= self.lvt:
+                self._rollback(stamp)
+            bucket = self.inputs[stamp]
+            del bucket[(src_part, seq)]
+            if not bucket:
+                del self.inputs[stamp]
+        elif kind in ("freeze", "poll"):
+            self.frozen = True
+            # A lazily cancelled message may still produce an anti-message.
+            local_min = min([self._next_stamp()] + [entry[0] for entry in self.lazy])
+            self.results.put(dill.dumps((
+                "counts", self.part, (self.n_sent, self.n_received, local_min)
+            )))
+        else:
+            _, self.epoch, gvt = message
+            self._fossil_collect(gvt)
+            self.frozen = False
+            self.finished = gvt >= self.end
+
+    def _receive(self, block):
+        if block:
+            self._handle(self.inbox.get())
+        while True:
+            try:
+                self._handle(self.inbox.get_nowait())
+            except queue.Empty:
+                return
+
+    def _next_stamp(self):
+        """Smallest stamp with local or inbound work."""
+        t = self.ss._peek_next_event_time()
+        stamp = (t, self.lvt[1] + 1) if t == self.lvt[0] else (t, 0)
+        pending = self.pending
+        while pending and (pending[0] <= self.lvt or pending[0] not in self.inputs):
+            heapq.heappop(pending)
+        if pending and pending[0] < stamp:
+            stamp = pending[0]
+        return stamp
+
+    def _round(self, stamp):
+        """Process one round: save state, then run it like a sequential tick."""
+        graph = self.graph
+        ss = self.ss
+        t, k = stamp
+
+        # Entity creation and destruction change the graph itself, so
+        # those rounds save all of it.
+        full = None
+        if (not self.incremental
+                or (k == 0 and min(ss.next_creation_time(),
+                                   ss.next_destruction_time()) <= t)):
+            full = dill.dumps(graph)
+
+        ss.global_time = t
+        if k == 0:
+            # As in SysExecutor.schedule: entities expire as time reaches
+            # the instant, before it runs; new ones join it.
+            ss.destroy_active_entity()
+            ss.create_entity()
+        fel = ss.min_schedule_item
+        imminent = fel.pop_all_at(t) if fel and fel.peek_time(default=Infinite) == t else []
+
+        outputs = []
+        for X in imminent:
+            md = MessageDeliverer()
+            X.output(md)
+            if not md.has_contents():
+                continue
+            outputs.append((X, md))
+            for msg in md.get_contents():
+                dsts = graph.cross_out.get((X, msg.get_dst()))
+                if not dsts:
+                    continue
+                content = (graph.src_index[X], msg.get_src(), msg.get_dst(), list(msg.retrieve()))
+                content_key = dill.dumps(content)
+                for q in dsts:
+                    self._send(stamp, q, content, content_key)
+
+        bucket = self.inputs.get(stamp)
+        if bucket:
+            inbound = {}
+            for key in sorted(bucket, key=lambda key: (bucket[key][0], key)):
+                src_index, src_name, port, body = bucket[key]
+                stub = graph.stubs[src_index]
+                msg = SysMessage(src_name, port)
+                msg.extend(body)
+                if stub not in inbound:
+                    inbound[stub] = MessageDeliverer()
+                inbound[stub].insert_message(msg)
+            outputs.extend(inbound.items())
+
+        if full is None:
+            saved, inputs = self._save_touched(t, imminent, outputs)
+        else:
+            saved, inputs = (), None
+        self.checkpoints.append((stamp, self.lvt, full, saved, inputs))
+
+        ss._run_instant(t, imminent, outputs)
+        out_queue = ss.output_event_queue
+        while out_queue:
+            _, msg = out_queue.popleft()
+            self.outputs.append((stamp, msg.get_src(), msg.get_dst(), list(msg.retrieve())))
+        self.lvt = stamp
+        self.stats["rounds"] += 1
+        if self.lazy:
+            self._cancel_lazy(stamp)
+
+    def _save_touched(self, t, imminent, outputs):
+        """
+        Saves the models round ``t`` is about to transition: the
+        imminent executors and every active receiver of ``outputs`` or
+        of the external events due at ``t``.
+
+        Returns:
+            tuple: ``(saved, inputs)`` — ``[(obj_id, fields, model
+            state), ...]`` and a copy of
+            ``input_event_queue`` when the round consumes from it
+        """
+        ss = self.ss
+        active = ss.active_obj_map
+        touched = {X._obj_id: X for X in imminent}
+        for X, md in outputs:
+            for msg in md.get_contents():
+                for dst, _ in ss._destinations_for(X, msg.get_dst()):
+                    if dst is not ss and dst._obj_id in active:
+                        touched[dst._obj_id] = dst
+        inputs = None
+        queue = ss.input_event_queue
+        if queue and queue[0][0] <= t:
+            inputs = list(queue)
+            for due, msg in queue:
+                if due <= t:
+                    for dst, _ in ss._destinations_for(ss, msg.get_dst()):
+                        if dst is not ss and dst._obj_id in active:
+                            touched[dst._obj_id] = dst
+        return [_save_model(ex) for ex in touched.values()], inputs
+
+    def _undo(self, checkpoint, live):
+        """Restores the models saved by ``checkpoint`` and reschedules
+        them; ``live`` is :func:`_live_objects` of the partition."""
+        _, _, _, saved, inputs = checkpoint
+        ss = self.ss
+        fel = ss.min_schedule_item
+        for obj_id, fields, state in saved:
+            executor = ss.active_obj_map[obj_id]
+            _restore_model(executor, fields, state, live)
+            fel.push(executor)
+        if inputs is not None:
+            ss.input_event_queue = list(inputs)
+
+    def _send(self, stamp, q, content, content_key):
+        """Send a message, or reuse an identical one kept by lazy cancellation."""
+        for i, entry in enumerate(self.lazy):
+            if entry[0] == stamp and entry[1] == q and entry[3] == content_key:
+                del self.lazy[i]
+                self.sent_log.append(entry)
+                return
+        self.seq += 1
+        self.sent_log.append((stamp, q, self.seq, content_key))
+        self._put(q, ("msg", self.part, self.seq, stamp) + content)
+
+    def _cancel_lazy(self, upto):
+        """Send anti-messages for undone messages stamped ``<= upto``
+        that re-execution did not regenerate."""
+        keep = []
+        for entry in self.lazy:
+            sent_stamp, q, seq, _ = entry
+            if sent_stamp <= upto:
+                self._put(q, ("anti", self.part, seq, sent_stamp))
+                self.stats["anti_messages"] += 1
+            else:
+                keep.append(entry)
+        self.lazy = keep
+
+    def _rollback(self, stamp):
+        """Restore the state before the first processed round ``>= stamp``."""
+        i = bisect_left(self.checkpoints, (stamp,), key=lambda c: c[:1])
+        if i == len(self.checkpoints):
+            return
+        undone = self.checkpoints[i:]
+        restored, lvt = undone[0][:2]
+        self.stats["rollbacks"] += 1
+        self.stats["rolled_back"] += len(undone)
+        # A whole-graph checkpoint replaces everything after it; the
+        # rounds before it are undone model by model, newest first.
+        for j, checkpoint in enumerate(undone):
+            if checkpoint[2] is not None:
+                self._bind(dill.loads(checkpoint[2]))
+                undone = undone[:j]
+                break
+        if undone:
+            live = _live_objects(self.ss)
+            for checkpoint in reversed(undone):
+                self._undo(checkpoint, live)
+        self.ss.global_time = lvt[0]
+        del self.checkpoints[i:]
+        self.lvt = lvt
+
+        i = bisect_left(self.sent_log, (restored,), key=lambda e: e[:1])
+        self.lazy.extend(self.sent_log[i:])
+        del self.sent_log[i:]
+        self.outputs = [o for o in self.outputs if o[0] < restored]
+
+        self.pending = [s for s in self.inputs if s > lvt]
+        heapq.heapify(self.pending)
+
+    def _fossil_collect(self, gvt):
+        """Reclaim everything no rollback can reach and commit outputs."""
+        i = bisect_left(self.checkpoints, (gvt,), key=lambda c: c[:1])
+        del self.checkpoints[:i]
+        for stamp in [s for s in self.inputs if s < gvt]:
+            del self.inputs[stamp]
+        self.sent_log = [entry for entry in self.sent_log if entry[0] >= gvt]
+        self.committed.extend(o for o in self.outputs if o[0] < gvt)
+        self.outputs = [o for o in self.outputs if o[0] >= gvt]
+
+    def run(self):
+        self.ss.init_sim()
+        idle_epoch = None
+        while True:
+            self._receive(block=False)
+            if self.finished:
+                break
+            stamp = self._next_stamp()
+            if self.frozen or stamp[0] >= self.end[0]:
+                if self.lazy and not self.frozen:
+                    self._cancel_lazy(self.end)
+                    continue
+                if not self.frozen and idle_epoch != self.epoch:
+                    idle_epoch = self.epoch
+                    self.results.put(dill.dumps(("idle", self.part, self.epoch)))
+                self._receive(block=True)
+                if self.finished:
+                    break
+                continue
+            self._round(stamp)
+
+        outputs = [(stamp[0], src, port, body)
+                   for stamp, src, port, body in self.committed + self.outputs]
+        states = _final_states(self.parallel, self.graph)
+        self.results.put(dill.dumps(("ok", self.part, (states, outputs, self.stats))))
+
+
+_PLAIN = (int, float, str, bool, type(None))
+
+
+def _plain_fields(executor):
+    """Slot and instance fields of ``executor`` that hold plain values
+    (times, state names, flags). Fields holding objects — the model,
+    the parent, compiled tables — never change during a run."""
+    fields = {}
+    for name in _slot_names(type(executor)):
+        value = getattr(executor, name, None)
+        if isinstance(value, _PLAIN):
+            fields[name] = value
+    extra = getattr(executor, "__dict__", None)
+    if extra:
+        for name, value in extra.items():
+            if isinstance(value, _PLAIN):
+                fields[name] = value
+    return fields
+
+
+def _live_objects(ss):
+    """``(kind, obj_id) -> object`` for the SysExecutor ``ss``, its
+    executors and their models. A whole-graph rollback replaces these
+    objects, so references are bound by key, not by identity."""
+    live = {("model", ss.get_obj_id()): ss}
+    executors = list(ss.active_obj_map.values())
+    for waiting in ss.waiting_obj_map.values():
+        executors.extend(waiting)
+    for executor in executors:
+        live[("executor", executor.get_obj_id())] = executor
+        model = executor.get_core_model()
+        live[("model", model.get_obj_id())] = model
+    return live
+
+
+def _save_model(executor):
+    return executor._obj_id, _plain_fields(executor), _save_state(executor.behavior_model)
+
+
+def _restore_model(executor, fields, state, live):
+    for name, value in fields.items():
+        setattr(executor, name, value)
+    _restore_state(executor.behavior_model, state, live)
@@ -0,0 +1,184 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains OutputChannel, a bounded, thread-safe buffer that receives a SysExecutor's external output events and hands them to consumers by batch, by generator or by ``async for``.
+"""
+
+import threading
+from collections import deque
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+BLOCK = "block"
+POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+
+class OutputChannel:
+    """Bounded ring buffer of external output events.
+
+    Created by :py:meth:`SysExecutor.open_output_channel`. Every message a
+    model sends to one of the executor's output ports (EOC) is pushed as
+    ``(time, port, msg)``; with ``ports`` only those ports are received.
+    Messages are not copied, so treat them as read-only.
+
+    When ``capacity`` events are buffered, ``policy`` decides:
+
+    - ``"drop_oldest"`` (default) — the oldest buffered event is dropped.
+    - ``"drop_newest"`` — the incoming event is dropped.
+    - ``"block"`` — the simulation thread waits until a consumer makes
+      room (backpressure). Only use it with a consumer on another thread
+      or event loop, otherwise the simulation deadlocks.
+
+    ``dropped`` counts the events lost to the first two policies.
+
+    Consumers either call :py:meth:`drain`, which swaps the buffer for an
+    empty one and returns the old one without copying, or iterate:
+    ``for event in channel`` blocks for new events and ``async for event
+    in channel`` awaits them; both end once the channel is closed and
+    empty. ``SysExecutor.terminate_simulation`` closes its channels.
+    """
+
+    def __init__(self, capacity=None, policy=DROP_OLDEST, ports=None):
+        """
+        Args:
+            capacity (int, optional): Maximum buffered events; None is
+                unbounded
+            policy (str): ``"drop_oldest"``, ``"drop_newest"`` or
+                ``"block"``
+            ports (iterable, optional): Output ports to receive; None
+                receives every port
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"unknown output channel policy {policy!r}")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.policy = policy
+        self.ports = None if ports is None else frozenset(ports)
+        self.dropped = 0
+        self._buffer = self._new_buffer()
+        self._cond = threading.Condition()
+        self._blocked = 0
+        self._readers = 0
+        self._async_waiters = []
+        self._closed = False
+
+    def _new_buffer(self):
+        maxlen = self.capacity if self.policy == DROP_OLDEST else None
+        return deque(maxlen=maxlen)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def push(self, time, port, msg):
+        """
+        Buffers one event; called by the executor.
+
+        Returns:
+            bool: False if the event was dropped (or the channel closed)
+        """
+        with self._cond:
+            if self._closed:
+                return False
+            buffer = self._buffer
+            if self.capacity is not None and len(buffer) >= self.capacity:
+                if self.policy == DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.policy == BLOCK:
+                    self._blocked += 1
+                    try:
+                        while len(self._buffer) >= self.capacity and not self._closed:
+                            self._cond.wait()
+                    finally:
+                        self._blocked -= 1
+                    if self._closed:
+                        return False
+                    buffer = self._buffer
+                else:
+                    self.dropped += 1
+            buffer.append((time, port, msg))
+            if self._readers:
+                self._cond.notify_all()
+            if self._async_waiters:
+                self._wake_async()
+        return True
+
+    def drain(self):
+        """
+        Takes every buffered event.
+
+        The buffer is swapped for an empty one under the lock, so no
+        event is copied.
+
+        Returns:
+            deque: ``(time, port, msg)`` events, oldest first
+        """
+        with self._cond:
+            events = self._buffer
+            if not events:
+                return events
+            self._buffer = self._new_buffer()
+            if self._blocked:
+                self._cond.notify_all()
+        return events
+
+    def close(self):
+        """Stops accepting events and wakes every waiting producer and
+        consumer; buffered events can still be drained."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            self._wake_async()
+
+    def _wake_async(self):
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # the consumer's loop is already closed
+                pass
+
+    def __iter__(self):
+        while True:
+            with self._cond:
+                while not self._buffer and not self._closed:
+                    self._readers += 1
+                    try:
+                        self._cond.wait()
+                    finally:
+                        self._readers -= 1
+            events = self.drain()
+            if not events:
+                return
+            yield from events
+
+    def __aiter__(self):
+        return self._aiter()
+
+    async def _aiter(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        while True:
+            events = self.drain()
+            if events:
+                for event in events:
+                    yield event
+                continue
+            wakeup = asyncio.Event()
+            with self._cond:
+                if self._buffer:
+                    continue
+                if self._closed:
+                    return
+                self._async_waiters.append((loop, wakeup))
+            await wakeup.wait()
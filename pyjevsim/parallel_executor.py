@@ -0,0 +1,679 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains ParallelSysExecutor, a multi-process conservative (Chandy-Misra-Bryant) driver that runs partitions of a model graph on separate SysExecutors.
+"""
+
+import heapq
+import io
+import multiprocessing
+import os
+import queue
+import traceback
+from collections import deque
+
+import dill
+
+from .core_model import CoreModel
+from .definition import ExecutionType, Infinite, ModelType
+from .executor import Executor
+from .message_deliverer import MessageDeliverer
+from .system_executor import SysExecutor
+from .system_message import SysMessage
+
+
+class ParallelSysExecutor(CoreModel):
+    """Conservative parallel simulation over worker processes.
+
+    Registered models are split into partitions; at :py:meth:`simulate`
+    time every partition is run by its own :class:`SysExecutor` in a
+    forked worker process. Couplings inside a partition are ordinary
+    couplings of that worker. A coupling between two partitions becomes
+    an inter-process channel that carries timestamped messages, and the
+    workers synchronise with null messages (Chandy-Misra-Bryant).
+
+    Every cross-partition coupling needs a positive ``lookahead``,
+    declared on :py:meth:`coupling_relation`. It is a promise about the
+    source model: after any transition at time ``t`` the source does not
+    emit on that port before ``t + lookahead`` (e.g. a server whose
+    service time is at least ``lookahead``). Messages keep zero-delay
+    DEVS semantics — a message emitted at ``t`` is delivered at ``t`` —
+    so results are identical to the sequential engine. A source that
+    breaks its promise makes the run fail with ``RuntimeError`` instead
+    of silently diverging.
+
+    Only virtual time is supported and the horizon passed to
+    :py:meth:`simulate` must be finite. When the run finishes, the
+    attributes of each model, nested models included, are copied back
+    from its worker into the model object registered here (see
+    :func:`_restore_state`), and external outputs are collected in
+    ``output_event_queue``.
+
+    Args:
+        _time_resolution (float): The time resolution of each worker
+        _sim_name (str, optional): The name of the simulation
+        workers (int, optional): Number of partitions. Defaults to
+            ``os.cpu_count()``.
+    """
+
+    _requires_lookahead = True
+
+    def __init__(self, _time_resolution, _sim_name="default", workers=None):
+        CoreModel.__init__(self, _sim_name, ModelType.UTILITY)
+        self.time_resolution = _time_resolution
+        self.workers = workers or os.cpu_count() or 1
+
+        self.global_time = 0
+        self.output_event_queue = deque()
+
+        # registration order -> (entity, inst_t, dest_t, ename, partition)
+        self._entities = []
+        self._entity_index = {}
+        # (src, out_port, dst, in_port, lookahead); None stands for self
+        self._couplings = []
+        self._input_events = []
+        self._finished = False
+
+    def get_global_time(self):
+        """
+        Retrieves the current global time.(simulation time)
+
+        Returns:
+            float: The current global time
+        """
+        return self.global_time
+
+    def register_entity(self, entity, inst_t=0, dest_t=Infinite, ename="default", partition=None):
+        """
+        Register simulation entity(Model).
+
+        Args:
+            entity (BehaviorModel or StructuralModel): The entity to register
+            inst_t (float, optional): Instance creation time
+            dest_t (float, optional): Destruction time
+            ename (str, optional): SysExecutor name
+            partition (int, optional): Worker that runs the entity. Entities
+                without a partition are split into contiguous blocks in
+                registration order, which keeps models built next to each
+                other (and usually coupled) on the same worker.
+        """
+        if partition is not None and not 0 <= partition < self.workers:
+            raise ValueError(f"partition {partition} out of range (workers={self.workers})")
+        self._entity_index[entity] = len(self._entities)
+        self._entities.append((entity, inst_t, dest_t, ename, partition))
+
+    def get_model(self, name):
+        """
+        Retrieves a registered model by name.
+
+        Args:
+            name (str): The name of the model
+
+        Returns:
+            CoreModel: The model
+        """
+        for entity, *_ in self._entities:
+            if entity.get_name() == name:
+                return entity
+        raise KeyError(name)
+
+    def coupling_relation(self, src_obj, out_port, dst_obj, in_port, lookahead=0):
+        """
+        Related src_obj's output port to dst_obj's input port.
+
+        Args:
+            src_obj (BehaviorModel or StructuralModel): Model to relate as output ports
+                (``None`` or this executor for an external input port)
+            out_port (str): src_obj's output port
+            dst_obj (CoreModel): Model to relate as input ports
+                (``None`` or this executor for an external output port)
+            in_port (str): dst_obj's input port
+            lookahead (float, optional): Minimum delay between any
+                transition of ``src_obj`` and its next emit on
+                ``out_port``. Required (> 0) when the two models end up
+                in different partitions.
+        """
+        src_obj = None if src_obj is self else src_obj
+        dst_obj = None if dst_obj is self else dst_obj
+        self._couplings.append((src_obj, out_port, dst_obj, in_port, lookahead))
+
+    def insert_external_event(self, _port, _msg, scheduled_time=0):
+        """
+        Inserts an external event into the simulation.
+
+        Args:
+            _port (str): port name
+            _msg (any): Event message
+            scheduled_time (float, optional): The scheduled time for the event
+        """
+        if _port in self.external_input_ports:
+            self._input_events.append((scheduled_time + self.global_time, _port, _msg))
+        else:
+            print("[INSERT_EXTERNAL_EVNT] Port Not Found")
+
+    def get_generated_event(self):
+        """
+        Returns a snapshot of the generated events queue.
+
+        Returns:
+            deque: A copy of the generated events queue
+        """
+        return deque(self.output_event_queue)
+
+    def _run_worker(self, plan, part, target_time, inboxes, results):
+        """Worker process entry point."""
+        _run_partition(self, plan, part, target_time, inboxes, results)
+
+    def _coordinate(self, target_time, inboxes, results):
+        """Parent side of a run: returns one ``(kind, part, payload)``
+        report per worker. Conservative workers need no coordination."""
+        return [dill.loads(results.get()) for _ in inboxes]
+
+    def _plan(self):
+        """Assign every entity to a partition and drop empty partitions.
+
+        Returns:
+            list: partition index per entity, numbered ``0..k-1``
+        """
+        unassigned = [i for i, e in enumerate(self._entities) if e[4] is None]
+        assigned = [e[4] for e in self._entities]
+        block = -(-len(unassigned) // self.workers) if unassigned else 1
+        for n, i in enumerate(unassigned):
+            assigned[i] = n // block
+
+        renumber = {p: k for k, p in enumerate(sorted(set(assigned)))}
+        plan = [renumber[p] for p in assigned]
+
+        for src, out_port, dst, in_port, lookahead in self._couplings:
+            if not self._requires_lookahead or src is None or dst is None:
+                continue
+            if (plan[self._entity_index[src]] != plan[self._entity_index[dst]]
+                    and not lookahead > 0):
+                raise ValueError(
+                    f"coupling {src.get_name()}.{out_port} -> {dst.get_name()}.{in_port} "
+                    "crosses partitions and needs a positive lookahead"
+                )
+        return plan
+
+    def simulate(self, _time):
+        """
+        Runs the partitions in worker processes up to ``global_time + _time``.
+
+        Args:
+            _time (float): The simulation time (finite)
+        """
+        if _time == Infinite:
+            raise ValueError(f"{type(self).__name__} needs a finite simulation time")
+        if self._finished:
+            raise RuntimeError(f"{type(self).__name__}.simulate can only run once")
+        self._finished = True
+
+        target_time = self.global_time + _time
+        plan = self._plan()
+        n_parts = max(plan, default=-1) + 1
+
+        # Workers inherit the registered models through fork; nothing
+        # but messages and the final states crosses a process boundary.
+        ctx = multiprocessing.get_context("fork")
+        inboxes = [ctx.Queue() for _ in range(n_parts)]
+        results = ctx.Queue()
+        procs = [
+            ctx.Process(target=self._run_worker,
+                        args=(plan, part, target_time, inboxes, results),
+                        daemon=True)
+            for part in range(n_parts)
+        ]
+        for proc in procs:
+            proc.start()
+
+        errors = []
+        outputs = []
+        live = _live_models(self)
+        for kind, part, payload in self._coordinate(target_time, inboxes, results):
+            if kind == "error":
+                errors.append(f"partition {part}:\n{payload}")
+                continue
+            states, part_outputs = payload
+            for obj_id, saved in states.items():
+                _restore_state(live[("model", obj_id)], saved, live)
+            outputs.extend(part_outputs)
+        for proc in procs:
+            if errors and proc.is_alive():
+                proc.terminate()
+            proc.join()
+
+        if errors:
+            raise RuntimeError(f"{type(self).__name__} worker failed\n" + "\n".join(errors))
+
+        outputs.sort(key=lambda item: item[0])
+        for t, src, port, body in outputs:
+            msg = SysMessage(src, port)
+            msg.extend(body)
+            self.output_event_queue.append((t, msg))
+        self.global_time = target_time
+
+
+class _RemoteSource:
+    """Stands in for a model of another partition as the source of a
+    coupling, so inbound channel messages route through the worker's
+    own routing index exactly like a local output."""
+
+    def __init__(self, model):
+        self.model = model
+        self._obj_id = model.get_obj_id()
+
+    def get_core_model(self):
+        return self.model
+
+    def get_name(self):
+        return self.model.get_name()
+
+
+class _PartitionGraph:
+    """A partition's SysExecutor together with its cross-partition wiring.
+
+    - ``stubs`` — ``src_index -> _RemoteSource`` for inbound channels
+    - ``cross_out`` — ``(executor, out_port) -> {dst_part: lookahead}``
+    - ``src_index`` — registration index of each channel source executor
+    - ``models`` — ``registration index -> model`` for this partition
+
+    Everything a worker mutates while simulating hangs off this object,
+    so one ``dill.dumps`` of it is a consistent checkpoint.
+    """
+
+    def __init__(self, parallel, plan, part):
+        ss = SysExecutor(parallel.time_resolution, f"{parallel.get_name()}.p{part}",
+                         ExecutionType.V_TIME)
+        ss.global_time = parallel.global_time
+        self.ss = ss
+        self.models = {}
+        for i, p in enumerate(plan):
+            if p == part:
+                entity, inst_t, dest_t, ename, _ = parallel._entities[i]
+                ss.register_entity(entity, inst_t, dest_t, ename)
+                self.models[i] = entity
+        for port in parallel.retrieve_input_ports():
+            ss.insert_input_port(port)
+        for port in parallel.retrieve_output_ports():
+            ss.insert_output_port(port)
+
+        index = parallel._entity_index
+        self.stubs = {}
+        self.in_parts = set()
+        cross = {}      # (src_model, out_port) -> {dst_part: lookahead}
+        for src, out_port, dst, in_port, lookahead in parallel._couplings:
+            sp = None if src is None else plan[index[src]]
+            dp = None if dst is None else plan[index[dst]]
+            if sp is None and dp is None:
+                if part == 0:
+                    ss.coupling_relation(None, out_port, None, in_port)
+            elif sp is None or dp is None or sp == dp:
+                if part in (sp, dp):
+                    ss.coupling_relation(src, out_port, dst, in_port)
+            elif dp == part:
+                if index[src] not in self.stubs:
+                    self.stubs[index[src]] = ss.product_port_map[src] = _RemoteSource(src)
+                ss.coupling_relation(src, out_port, dst, in_port)
+                self.in_parts.add(sp)
+            elif sp == part:
+                dsts = cross.setdefault((src, out_port), {})
+                dsts[dp] = min(dsts.get(dp, Infinite), lookahead)
+
+        self.cross_out = {}
+        self.src_index = {}
+        for (src, out_port), dsts in cross.items():
+            executor = ss.product_port_map[src]
+            self.src_index[executor] = index[src]
+            self.cross_out[(executor, out_port)] = dsts
+
+        for t, port, body in parallel._input_events:
+            msg = SysMessage(SysExecutor.EXTERNAL_SRC, port)
+            msg.insert(body)
+            heapq.heappush(ss.input_event_queue, (t, msg))
+
+
+def _run_partition(parallel, plan, part, target_time, inboxes, results):
+    """Worker entry point: build this partition's SysExecutor and run it."""
+    try:
+        _Partition(parallel, plan, part, target_time, inboxes).run(results)
+    except BaseException:
+        # Release every peer blocked on this partition's bounds.
+        for q, inbox in enumerate(inboxes):
+            if q != part:
+                inbox.put(dill.dumps(("done", part)))
+        results.put(dill.dumps(("error", part, traceback.format_exc())))
+
+
+class _Partition:
+    """One worker: a SysExecutor for the partition plus its CMB channels.
+
+    Channel protocol (all bounds are inclusive lower bounds on future
+    message timestamps):
+
+    - ``("msg", src_part, seq, t, src_index, src_name, port, body)``
+    - ``("null", src_part, bound)``
+    - ``("done", src_part)`` — no further messages from ``src_part``
+
+    An instant ``t`` is processed in two steps. Once every inbound
+    bound is ``>= t`` no earlier message can arrive, so the imminent
+    outputs (pre-transition state) are computed and sent. Transitions
+    wait until every bound is ``> t``, i.e. until all messages stamped
+    ``t`` have arrived, then run through ``SysExecutor._run_instant``.
+    """
+
+    def __init__(self, parallel, plan, part, target_time, inboxes):
+        self.parallel = parallel
+        self.part = part
+        self.target_time = target_time
+        self.inboxes = inboxes
+        self.inbox = inboxes[part]
+
+        graph = _PartitionGraph(parallel, plan, part)
+        self.graph = graph
+        self.ss = graph.ss
+        self.stubs = graph.stubs
+        self.cross_out = graph.cross_out
+        self.src_index = graph.src_index
+
+        self.out_groups = {}    # dst_part -> [(executor, lookahead), ...]
+        for (executor, _), dsts in graph.cross_out.items():
+            for dp, lookahead in dsts.items():
+                self.out_groups.setdefault(dp, []).append((executor, lookahead))
+
+        start = self.ss.global_time
+        self.bounds = {q: start for q in graph.in_parts}
+        self.sent = {q: start for q in self.out_groups}
+        self.peers = set(self.out_groups)
+        self.seq = 0
+
+        self.pending = {}       # t -> [(src_index, seq, stub, msg), ...]
+        self.pending_times = []
+        self.outputs = []
+
+    def _handle(self, raw):
+        kind, src_part, *rest = dill.loads(raw)
+        if kind == "msg":
+            seq, t, src_index, src_name, port, body = rest
+            msg = SysMessage(src_name, port)
+            msg.extend(body)
+            if t not in self.pending:
+                self.pending[t] = []
+                heapq.heappush(self.pending_times, t)
+            self.pending[t].append((src_index, seq, self.stubs[src_index], msg))
+        elif kind == "null":
+            if rest[0] > self.bounds[src_part]:
+                self.bounds[src_part] = rest[0]
+        else:
+            self.bounds[src_part] = Infinite
+            self.peers.discard(src_part)
+
+    def _receive(self, block):
+        if block:
+            self._handle(self.inbox.get())
+        while True:
+            try:
+                self._handle(self.inbox.get_nowait())
+            except queue.Empty:
+                return
+
+    def _eit(self):
+        """Earliest input time: no inbound message can be stamped lower."""
+        return min(self.bounds.values(), default=Infinite)
+
+    def _next_time(self):
+        t = self.ss._peek_next_event_time()
+        if self.pending_times and self.pending_times[0] < t:
+            t = self.pending_times[0]
+        return t
+
+    def _scheduled(self, executor):
+        """Earliest time ``executor`` may emit without further input."""
+        t = self.ss.min_schedule_item.scheduled_time(executor._obj_id)
+        if t is not None:
+            return t
+        if executor._obj_id in self.ss.active_obj_map:
+            return Infinite
+        return executor.get_create_time()
+
+    def _send_nulls(self, horizon):
+        """Advance the channel bounds given that no local transition
+        happens before ``horizon``."""
+        target_time = self.target_time
+        for q, sources in self.out_groups.items():
+            if q not in self.peers:
+                continue
+            bound = Infinite
+            for executor, lookahead in sources:
+                bound = min(bound, self._scheduled(executor), horizon + lookahead)
+            if bound >= target_time:
+                bound = Infinite
+            if bound > self.sent[q]:
+                self.sent[q] = bound
+                self.inboxes[q].put(dill.dumps(("null", self.part, bound)))
+
+    def _outputs(self, instant, imminent):
+        """Phase A for ``imminent``; cross-partition emits are sent now."""
+        outputs = []
+        for X in imminent:
+            md = MessageDeliverer()
+            X.output(md)
+            if not md.has_contents():
+                continue
+            outputs.append((X, md))
+            for msg in md.get_contents():
+                dsts = self.cross_out.get((X, msg.get_dst()))
+                if not dsts:
+                    continue
+                for q in dsts:
+                    if instant < self.sent[q]:
+                        raise RuntimeError(
+                            f"lookahead violated: {X.get_name()}.{msg.get_dst()} "
+                            f"emitted at {instant}, promised >= {self.sent[q]}"
+                        )
+                    if q in self.peers:
+                        self.seq += 1
+                        self.inboxes[q].put(dill.dumps((
+                            "msg", self.part, self.seq, instant, self.src_index[X],
+                            msg.get_src(), msg.get_dst(), list(msg.retrieve()),
+                        )))
+        return outputs
+
+    def _pop_imminent(self, instant):
+        fel = self.ss.min_schedule_item
+        if fel and fel.peek_time(default=Infinite) == instant:
+            return fel.pop_all_at(instant)
+        return []
+
+    def _collect_outputs(self):
+        queue_ = self.ss.output_event_queue
+        while queue_:
+            t, msg = queue_.popleft()
+            self.outputs.append((t, msg.get_src(), msg.get_dst(), list(msg.retrieve())))
+
+    def _step(self, instant):
+        ss = self.ss
+        ss.global_time = instant
+        # As in SysExecutor.schedule: entities expire as time reaches the
+        # instant, before it runs; new ones join it.
+        ss.destroy_active_entity()
+        ss.create_entity()
+        imminent = self._pop_imminent(instant)
+        outputs = self._outputs(instant, imminent)
+        self._send_nulls(instant)
+
+        while self._eit() <= instant:
+            self._receive(block=True)
+
+        if self.pending_times and self.pending_times[0] == instant:
+            heapq.heappop(self.pending_times)
+            inbound = {}
+            for _, _, stub, msg in sorted(self.pending.pop(instant), key=lambda m: m[:2]):
+                if stub not in inbound:
+                    inbound[stub] = MessageDeliverer()
+                inbound[stub].insert_message(msg)
+            outputs.extend(inbound.items())
+
+        ss._run_instant(instant, imminent, outputs)
+        # Zero-delay cascades at the same instant stay local; a cross
+        # emit here is caught by the lookahead check in `_outputs`.
+        imminent = self._pop_imminent(instant)
+        while imminent:
+            ss._run_instant(instant, imminent, self._outputs(instant, imminent))
+            imminent = self._pop_imminent(instant)
+        self._collect_outputs()
+
+    def run(self, results):
+        ss = self.ss
+        ss.init_sim()
+        target_time = self.target_time
+        while True:
+            self._receive(block=False)
+            t = self._next_time()
+            eit = self._eit()
+            if t >= target_time and eit >= target_time:
+                break
+            if t < target_time and eit >= t:
+                self._step(t)
+                self._send_nulls(min(self._next_time(), self._eit()))
+            else:
+                self._send_nulls(min(t, eit))
+                self._receive(block=True)
+
+        for q in self.peers:
+            self.inboxes[q].put(dill.dumps(("done", self.part)))
+        states = _final_states(self.parallel, self.graph)
+        results.put(dill.dumps(("ok", self.part, (states, self.outputs))))
+
+
+class _StatePickler(dill.Pickler):
+    """Pickles a model's attributes, writing the simulator objects they
+    refer to (engines, executors, models) as ``(kind, obj_id)``
+    references instead of copies. ``refs`` maps each reference to the
+    object it stood for."""
+
+    def __init__(self, file):
+        super().__init__(file)
+        self.refs = {}
+
+    def persistent_id(self, obj):
+        if isinstance(obj, Executor):
+            key = ("executor", obj.get_obj_id())
+        elif isinstance(obj, CoreModel):
+            key = ("model", obj.get_obj_id())
+        else:
+            return None
+        self.refs[key] = obj
+        return key
+
+
+class _StateUnpickler(dill.Unpickler):
+    """Loads a :class:`_StatePickler` blob, binding each reference to
+    the object with that key in ``live``, or else to the saved one."""
+
+    def __init__(self, file, refs, live):
+        super().__init__(file)
+        self.refs = refs
+        self.live = live
+
+    def persistent_load(self, key):
+        obj = self.live.get(key)
+        return self.refs[key] if obj is None else obj
+
+
+_MISSING = object()
+_SLOTS = {}
+
+
+def _slot_names(cls):
+    names = _SLOTS.get(cls)
+    if names is None:
+        names = _SLOTS[cls] = tuple(
+            name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ())
+            if name not in ("__dict__", "__weakref__")
+        )
+    return names
+
+
+def _save_state(model):
+    """
+    Saves the attributes of ``model``, instance dict and slots.
+
+    Class-level tables bound on the instance stay shared and are not
+    copied. References to engines, executors and models are kept as
+    references (see :class:`_StatePickler`).
+
+    Returns:
+        tuple: ``(shared names, blob, references)`` for :func:`_restore_state`
+    """
+    cls = type(model)
+    attrs = getattr(model, "__dict__", {})
+    shared = tuple(name for name, value in attrs.items()
+                   if getattr(cls, name, _MISSING) is value)
+    state = (
+        {name: value for name, value in attrs.items() if name not in shared},
+        {name: getattr(model, name) for name in _slot_names(cls) if hasattr(model, name)},
+    )
+    buffer = io.BytesIO()
+    pickler = _StatePickler(buffer)
+    pickler.dump(state)
+    return shared, buffer.getvalue(), pickler.refs
+
+
+def _restore_state(model, saved, live):
+    """
+    Replaces the attributes of ``model`` with a :func:`_save_state` copy.
+
+    Args:
+        model (CoreModel): The model to restore
+        saved (tuple): What :func:`_save_state` returned
+        live (dict): ``(kind, obj_id) -> object`` the references are
+            bound to; a reference missing from it gets the saved object
+    """
+    shared, blob, refs = saved
+    attrs, slots = _StateUnpickler(io.BytesIO(blob), refs, live).load()
+    cls = type(model)
+    for name in shared:
+        attrs[name] = getattr(cls, name)
+    if hasattr(model, "__dict__"):
+        model.__dict__.clear()
+        model.__dict__.update(attrs)
+    for name, value in slots.items():
+        setattr(model, name, value)
+
+
+def _model_tree(model):
+    """``model`` followed by every model nested in it."""
+    models = [model]
+    for m in models:
+        if m.get_model_type() == ModelType.STRUCTURAL:
+            models.extend(m.get_models().values())
+    return models
+
+
+def _live_models(parallel):
+    """``("model", obj_id) -> model`` for ``parallel`` and every model
+    registered with it, nested ones included."""
+    live = {("model", parallel.get_obj_id()): parallel}
+    for entity, *_ in parallel._entities:
+        for model in _model_tree(entity):
+            live[("model", model.get_obj_id())] = model
+    return live
+
+
+def _final_states(parallel, graph):
+    """``obj_id -> saved state`` of every model of the partition, for
+    the parent to restore. References the parent resolves itself are
+    not shipped with the state."""
+    known = _live_models(parallel)
+    states = {}
+    for entity in graph.models.values():
+        for model in _model_tree(entity):
+            shared, blob, refs = _save_state(model)
+            refs = {key: obj for key, obj in refs.items() if key not in known}
+            states[model.get_obj_id()] = (shared, blob, refs)
+    return states
+
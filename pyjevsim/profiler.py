@@ -0,0 +1,149 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains Profiler, the opt-in per-model and per-phase counters behind ``SysExecutor(profile=True)``.
+"""
+
+import csv
+import json
+from time import perf_counter_ns
+
+PROFILED_METHODS = ("output", "int_trans", "ext_trans", "ext_trans_bag", "con_trans",
+                    "set_req_time")
+PHASES = ("A", "B", "C", "D")
+
+
+class Profiler:
+    """Call counts and ``perf_counter_ns`` time per model and per phase.
+
+    A SysExecutor built with ``profile=True`` hands every executor it
+    activates to :py:meth:`instrument`, which shadows the
+    :data:`PROFILED_METHODS` with timing wrappers on that instance only;
+    without ``profile`` nothing is wrapped, so the tick runs unchanged.
+    Phase times and FEL sizes are recorded once per tick.
+
+    Counters are kept per model object (``obj_id``), so models that
+    share a name are reported separately.
+
+    Counters are plain integers updated without a lock: with
+    ``parallel_workers`` on a free-threaded build, concurrent models
+    may lose an increment now and then.
+    """
+
+    def __init__(self):
+        # obj_id -> (model name, class name, {method: [calls, ns]})
+        self._models = {}
+        self._phase_ns = dict.fromkeys(PHASES, 0)
+        self.ticks = 0
+        self._fel_min = None
+        self._fel_max = 0
+        self._fel_sum = 0
+
+    def instrument(self, executor):
+        """Wraps the profiled methods of one executor (idempotent)."""
+        if getattr(executor, "_profiled", False):
+            return
+        obj_id = executor.get_obj_id()
+        core = executor.get_core_model() if hasattr(executor, "get_core_model") else executor
+        entry = self._models.get(obj_id)
+        if entry is None:
+            entry = self._models[obj_id] = (executor.get_name(), type(core).__name__, {})
+        stats = entry[2]
+        for method in PROFILED_METHODS:
+            bound = getattr(executor, method, None)
+            if bound is not None:
+                counter = stats.setdefault(method, [0, 0])
+                setattr(executor, method, self._timed(bound, counter))
+        executor._profiled = True
+
+    @staticmethod
+    def _timed(bound, counter):
+        def timed(*args):
+            start = perf_counter_ns()
+            try:
+                return bound(*args)
+            finally:
+                counter[1] += perf_counter_ns() - start
+                counter[0] += 1
+        return timed
+
+    def add_tick(self, phase_ns, fel_size):
+        """
+        Records one tick.
+
+        Args:
+            phase_ns (tuple): Nanoseconds spent in phases A, B, C and D
+            fel_size (int): Executors in the FEL after rescheduling
+        """
+        self.ticks += 1
+        totals = self._phase_ns
+        for phase, ns in zip(PHASES, phase_ns):
+            totals[phase] += ns
+        if self._fel_min is None or fel_size < self._fel_min:
+            self._fel_min = fel_size
+        if fel_size > self._fel_max:
+            self._fel_max = fel_size
+        self._fel_sum += fel_size
+
+    def report(self):
+        """
+        Returns:
+            dict: ``models`` (per model ``obj_id``: name, class and
+            ``{method: {"calls", "ns"}}``), ``classes`` (the same summed
+            per model class), ``phases`` (total ns per phase), ``ticks``
+            and ``fel`` (``min`` / ``max`` / ``mean`` size per tick)
+        """
+        models = {}
+        classes = {}
+        for obj_id, (name, cls, stats) in self._models.items():
+            methods = {m: {"calls": c, "ns": ns} for m, (c, ns) in stats.items()}
+            models[obj_id] = {"name": name, "class": cls, "methods": methods}
+            merged = classes.setdefault(cls, {})
+            for method, (calls, ns) in stats.items():
+                total = merged.setdefault(method, {"calls": 0, "ns": 0})
+                total["calls"] += calls
+                total["ns"] += ns
+        return {
+            "ticks": self.ticks,
+            "phases": dict(self._phase_ns),
+            "fel": {
+                "min": self._fel_min or 0,
+                "max": self._fel_max,
+                "mean": self._fel_sum / self.ticks if self.ticks else 0.0,
+            },
+            "models": models,
+            "classes": classes,
+        }
+
+    def dump(self, path, fmt=None):
+        """
+        Writes :py:meth:`report` to a file.
+
+        JSON holds the whole report; CSV holds one row per model and
+        method (``model_id, model, class, method, calls, ns``).
+
+        Args:
+            path (str): Output file
+            fmt (str, optional): ``"json"`` or ``"csv"``; taken from the
+                file extension when omitted
+        """
+        if fmt is None:
+            fmt = "csv" if str(path).lower().endswith(".csv") else "json"
+        report = self.report()
+        if fmt == "json":
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+        elif fmt == "csv":
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(("model_id", "model", "class", "method", "calls", "ns"))
+                for obj_id, model in report["models"].items():
+                    for method, stats in model["methods"].items():
+                        writer.writerow((obj_id, model["name"], model["class"], method,
+                                         stats["calls"], stats["ns"]))
+        else:
+            raise ValueError(f"unknown profile format {fmt!r}")
@@ -0,0 +1,108 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains RealTimeClock, which maps simulated time onto absolute wall-clock deadlines for R_TIME runs and applies the overrun policy when a deadline is missed.
+"""
+
+import time
+
+from .definition import Infinite
+
+CATCH_UP = "catch_up"
+SKIP = "skip"
+SLIP = "slip"
+OVERRUN_POLICIES = (CATCH_UP, SKIP, SLIP)
+
+
+class RealTimeClock:
+    """Wall-clock pacing for ``ExecutionType.R_TIME``.
+
+    Simulated time ``t`` is due at the absolute deadline
+    ``origin + (t - sim_origin) / speed``, so errors never accumulate
+    from one event to the next. The executor sleeps until ``spin``
+    seconds before a deadline and busy-waits the rest, which keeps
+    jitter well below a millisecond while only spinning once per event.
+
+    An event reached more than ``tolerance`` seconds after its deadline
+    is an overrun; ``overruns`` counts them and ``max_lag`` keeps the
+    worst lateness. ``overrun`` decides what happens next:
+
+    - ``"catch_up"`` (default) — keep the timeline; late events run
+      back to back until the simulation is on time again.
+    - ``"skip"`` — jump simulated time to the current wall-clock
+      position; events due in between run together at that instant.
+    - ``"slip"`` — shift the timeline by the lateness, so later events
+      keep their spacing but the run stays behind.
+    """
+
+    def __init__(self, speed=1.0, overrun=CATCH_UP, spin=0.001, tolerance=0.001):
+        """
+        Args:
+            speed (float): Simulated seconds per wall-clock second
+            overrun (str): ``"catch_up"``, ``"skip"`` or ``"slip"``
+            spin (float): Seconds busy-waited before each deadline
+            tolerance (float): Lateness in seconds counted as an overrun
+        """
+        if not speed > 0:
+            raise ValueError("speed must be > 0")
+        if overrun not in OVERRUN_POLICIES:
+            raise ValueError(f"unknown overrun policy {overrun!r}")
+        self.speed = speed
+        self.overrun = overrun
+        self.spin = spin
+        self.tolerance = tolerance
+        self.overruns = 0
+        self.max_lag = 0.0
+        self._wall_origin = time.perf_counter()
+        self._sim_origin = 0
+
+    def start(self, sim_time):
+        """Anchors the timeline: ``sim_time`` is due right now."""
+        self._wall_origin = time.perf_counter()
+        self._sim_origin = sim_time
+
+    def deadline(self, sim_time):
+        """
+        Returns:
+            float: The ``time.perf_counter()`` value at which
+            ``sim_time`` is due (``Infinite`` for ``Infinite``)
+        """
+        if sim_time == Infinite:
+            return Infinite
+        return self._wall_origin + (sim_time - self._sim_origin) / self.speed
+
+    def now(self):
+        """
+        Returns:
+            float: The simulated time due at the current wall-clock time
+        """
+        return self._sim_origin + (time.perf_counter() - self._wall_origin) * self.speed
+
+    def spin_until(self, deadline):
+        """Busy-waits for the last stretch before ``deadline``."""
+        while time.perf_counter() < deadline:
+            pass
+
+    def settle(self, sim_time):
+        """
+        Checks the deadline of an event about to run and applies the
+        overrun policy.
+
+        Returns:
+            float: The simulated time to run the event at
+        """
+        lag = time.perf_counter() - self.deadline(sim_time)
+        if lag <= self.tolerance:
+            return sim_time
+        self.overruns += 1
+        if lag > self.max_lag:
+            self.max_lag = lag
+        if self.overrun == SLIP:
+            self._wall_origin += lag
+        elif self.overrun == SKIP:
+            return max(sim_time, self.now())
+        return sim_time
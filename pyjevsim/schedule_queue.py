@@ -20,15 +20,26 @@ tuples:
 The class deliberately keeps the same ``push / pop / peek_time / remove``
 public API as the previous lazy-heap implementation so call sites in
 ``SysExecutor`` and ``StructuralExecutor`` do not change.
+
+Every ``push`` of a brand-new timestamp still costs an O(log n)
+``heappush``, which dominates when timestamps are continuous and almost
+never shared (e.g. exponential inter-arrival times over a large
+population). For those workloads ``CalendarQueue`` and ``LadderQueue``
+implement the same contract with O(1) amortised insert and dequeue;
+``SysExecutor(fel=...)`` selects the backend (see ``FEL_BACKENDS``).
 """
 
 import heapq
-from typing import Optional
+from bisect import insort
+
+from .definition import Infinite
 
 
 class ScheduleQueue:
     """Heapset-backed priority queue for executor scheduling."""
 
+    KIND = "heapset"
+
     def __init__(self):
         # Min-heap of unique timestamps that *might* still be live.
         # An entry is "live" iff `_mapped[t]` exists and is non-empty.
@@ -115,7 +126,7 @@ class ScheduleQueue:
                 del self._reverse[obj_id]
         return list(bucket)
 
-    def peek_time(self, default: Optional[float] = None):
+    def peek_time(self, default: float | None = None):
         """Return the smallest non-empty scheduled time without modifying
         which executors are queued at it. Stale heap entries (timestamps
         whose bucket is empty) are pruned eagerly here.
@@ -131,6 +142,11 @@ class ScheduleQueue:
             return default
         raise IndexError("peek from empty ScheduleQueue")
 
+    def scheduled_time(self, obj_id):
+        """Return the time the executor with ``obj_id`` is queued at, or
+        ``None`` if it is not queued."""
+        return self._reverse.get(obj_id)
+
     def remove(self, executor):
         """Remove ``executor`` from the queue if present."""
         obj_id = executor.get_obj_id()
@@ -148,3 +164,373 @@ class ScheduleQueue:
 
     def __bool__(self):
         return bool(self._reverse)
+
+
+class _TimeBucketQueue:
+    """Shared bookkeeping for the non-heap future-event lists.
+
+    Executors are grouped exactly like the heapset: ``_mapped`` holds one
+    bucket per timestamp and ``_reverse`` tracks where each executor
+    currently sits. Subclasses only order the *distinct* finite
+    timestamps through three hooks:
+
+      * ``_insert(t)`` — add a timestamp that just got a fresh bucket;
+      * ``_first()`` — smallest stored timestamp, or ``None`` if empty;
+      * ``_drop_first()`` — discard the timestamp ``_first()`` returned;
+      * ``_drop_if_first(t)`` — discard ``t`` if it is the stored
+        minimum (eager cleanup after ``pop_all_at``, cheap no-op
+        otherwise).
+
+    Stored timestamps may be stale (their bucket emptied by a
+    reschedule or ``remove``) or duplicated (re-pushed after a
+    ``remove``); like the heapset, stale entries are pruned lazily when
+    they surface. ``Infinite`` never enters the ordered structure — a
+    passive executor only costs a set insertion.
+    """
+
+    def __init__(self):
+        self._mapped: dict = {}        # time -> set(executor)
+        self._reverse: dict = {}       # obj_id -> current scheduled time
+
+    def push(self, executor):
+        """Insert or update an executor at its current ``req_time``."""
+        new_t = executor.get_req_time()
+        obj_id = executor._obj_id
+
+        old_t = self._reverse.get(obj_id)
+        if old_t is not None and old_t != new_t:
+            old_bucket = self._mapped.get(old_t)
+            if old_bucket is not None:
+                old_bucket.discard(executor)
+
+        self._reverse[obj_id] = new_t
+
+        bucket = self._mapped.get(new_t)
+        if bucket is None:
+            self._mapped[new_t] = {executor}
+            if new_t != Infinite:
+                self._insert(new_t)
+        else:
+            bucket.add(executor)
+
+    def _live_min(self):
+        """Smallest timestamp with a non-empty bucket, or ``None``."""
+        mapped = self._mapped
+        while True:
+            t = self._first()
+            if t is None:
+                break
+            if mapped.get(t):
+                return t
+            self._drop_first()
+            if not mapped.get(t, True):
+                del mapped[t]
+        if mapped.get(Infinite):
+            return Infinite
+        return None
+
+    def pop(self):
+        """Remove and return one executor with the smallest ``req_time``."""
+        t = self._live_min()
+        if t is None:
+            raise IndexError(f"pop from empty {type(self).__name__}")
+        bucket = self._mapped[t]
+        executor = bucket.pop()
+        if not bucket:
+            del self._mapped[t]
+        obj_id = executor.get_obj_id()
+        if self._reverse.get(obj_id) == t:
+            del self._reverse[obj_id]
+        return executor
+
+    def pop_all_at(self, time):
+        """Remove and return every executor scheduled at exactly ``time``."""
+        bucket = self._mapped.pop(time, None)
+        if not bucket:
+            return []
+        self._drop_if_first(time)
+        for executor in bucket:
+            obj_id = executor.get_obj_id()
+            if self._reverse.get(obj_id) == time:
+                del self._reverse[obj_id]
+        return list(bucket)
+
+    def peek_time(self, default: float | None = None):
+        """Return the smallest non-empty scheduled time."""
+        t = self._live_min()
+        if t is not None:
+            return t
+        if default is not None:
+            return default
+        raise IndexError(f"peek from empty {type(self).__name__}")
+
+    def scheduled_time(self, obj_id):
+        """Return the time the executor with ``obj_id`` is queued at, or
+        ``None`` if it is not queued."""
+        return self._reverse.get(obj_id)
+
+    def remove(self, executor):
+        """Remove ``executor`` from the queue if present."""
+        old_t = self._reverse.pop(executor.get_obj_id(), None)
+        if old_t is not None:
+            bucket = self._mapped.get(old_t)
+            if bucket is not None:
+                bucket.discard(executor)
+                if not bucket:
+                    self._mapped.pop(old_t, None)
+
+    def __len__(self):
+        return len(self._reverse)
+
+    def __bool__(self):
+        return bool(self._reverse)
+
+
+class CalendarQueue(_TimeBucketQueue):
+    """Calendar-queue future-event list (Brown, 1988).
+
+    Distinct timestamps are hashed into ``len(days)`` sorted day lists
+    of ``width`` time units each, wrapping around like the days of a
+    year. Dequeue scans forward from the current day, so insert and
+    dequeue are O(1) on average when ``width`` matches the typical gap
+    between events. The calendar doubles or halves its day count as it
+    grows or shrinks and re-estimates ``width`` from the gaps between
+    the earliest timestamps.
+    """
+
+    KIND = "calendar"
+    _SAMPLE = 25
+
+    def __init__(self, days=2, width=1.0):
+        super().__init__()
+        self._days = [[] for _ in range(days)]
+        self._width = float(width)
+        self._size = 0            # timestamps stored, stale ones included
+        self._day = 0             # absolute index of the current day
+
+    def _day_of(self, t):
+        return int(t / self._width)
+
+    def _insert(self, t):
+        day = self._day_of(t)
+        insort(self._days[day % len(self._days)], t)
+        self._size += 1
+        if day < self._day:
+            self._day = day
+        if self._size > 2 * len(self._days):
+            self._resize(2 * len(self._days))
+
+    def _first(self):
+        if not self._size:
+            return None
+        days = self._days
+        n = len(days)
+        day = self._day
+        for _ in range(n):
+            entries = days[day % n]
+            if entries and self._day_of(entries[0]) <= day:
+                self._day = day
+                return entries[0]
+            day += 1
+        # A whole year without an event: jump straight to the minimum.
+        t = min(entries[0] for entries in days if entries)
+        self._day = self._day_of(t)
+        return t
+
+    def _drop_first(self):
+        del self._days[self._day % len(self._days)][0]
+        self._size -= 1
+        if len(self._days) > 2 and self._size < len(self._days) // 2:
+            self._resize(len(self._days) // 2)
+
+    def _drop_if_first(self, t):
+        entries = self._days[self._day % len(self._days)]
+        if entries and entries[0] == t:
+            self._drop_first()
+
+    def _resize(self, days):
+        # Rebuild from the live timestamps only; stale and duplicate
+        # entries are dropped on the way.
+        times = sorted({t for entries in self._days for t in entries
+                        if t in self._mapped})
+        width = self._estimate_width(times)
+        if width:
+            self._width = width
+        self._days = [[] for _ in range(days)]
+        for t in times:
+            self._days[self._day_of(t) % days].append(t)
+        self._size = len(times)
+        self._day = self._day_of(times[0]) if times else 0
+
+    def _estimate_width(self, times):
+        """Three times the average gap between the earliest timestamps,
+        ignoring gaps more than twice the plain average (Brown's rule)."""
+        sample = times[:self._SAMPLE]
+        if len(sample) < 2:
+            return None
+        gaps = [b - a for a, b in zip(sample, sample[1:])]
+        mean = sum(gaps) / len(gaps)
+        kept = [g for g in gaps if g <= 2 * mean]
+        width = 3 * sum(kept) / len(kept) if kept else 0
+        return width if 0 < width < Infinite else None
+
+
+class LadderQueue(_TimeBucketQueue):
+    """Ladder-queue future-event list (Tang, Goh & Thng, 2005).
+
+    Distinct timestamps enter an unsorted *top* list in O(1). When the
+    sorted *bottom* runs dry, the top is spread over a *rung* of
+    buckets sized from its time span; buckets are consumed in order, and
+    a bucket still holding more than ``THRESHOLD`` timestamps spawns a
+    finer rung instead of being sorted. Only the bucket being consumed
+    is ever sorted (here: heapified), so the cost per event stays O(1)
+    amortised even when inter-event times are skewed or bursty.
+    """
+
+    KIND = "ladder"
+    THRESHOLD = 50
+    MAX_RUNGS = 8
+
+    def __init__(self):
+        super().__init__()
+        self._top = []
+        self._top_min = Infinite
+        self._top_max = -Infinite
+        self._top_start = -Infinite   # timestamps above this go to top
+        self._rungs = []              # [start, width, buckets, current]
+        self._bottom = []             # heap
+
+    def _insert(self, t):
+        if t > self._top_start:
+            self._top.append(t)
+            if t < self._top_min:
+                self._top_min = t
+            if t > self._top_max:
+                self._top_max = t
+            return
+        for rung in self._rungs:
+            start, width, buckets, current = rung
+            i = int((t - start) / width)
+            if i > current:
+                buckets[min(i, len(buckets) - 1)].append(t)
+                return
+        heapq.heappush(self._bottom, t)
+
+    def _first(self):
+        while not self._bottom:
+            if self._rungs:
+                self._advance()
+            elif self._top:
+                self._spread_top()
+            else:
+                return None
+        return self._bottom[0]
+
+    def _drop_first(self):
+        heapq.heappop(self._bottom)
+
+    def _drop_if_first(self, t):
+        bottom = self._bottom
+        if bottom and bottom[0] == t:
+            heapq.heappop(bottom)
+
+    def _spread_top(self):
+        top = self._top
+        self._top_start = self._top_max
+        lo, hi = self._top_min, self._top_max
+        self._top = []
+        self._top_min, self._top_max = Infinite, -Infinite
+        if len(top) <= self.THRESHOLD or not lo < hi:
+            heapq.heapify(top)
+            self._bottom = top
+            return
+        self._spawn(lo, (hi - lo) / len(top), len(top) + 1, top)
+
+    def _spawn(self, start, width, count, times):
+        buckets = [[] for _ in range(count)]
+        last = count - 1
+        for t in times:
+            buckets[min(int((t - start) / width), last)].append(t)
+        self._rungs.append([start, width, buckets, -1])
+
+    def _advance(self):
+        """Move the next non-empty bucket of the lowest rung into the
+        bottom, or into a finer rung if it is too large to sort."""
+        rung = self._rungs[-1]
+        start, width, buckets, current = rung
+        for i in range(current + 1, len(buckets)):
+            if buckets[i]:
+                break
+        else:
+            self._rungs.pop()
+            return
+        rung[3] = i
+        times = buckets[i]
+        buckets[i] = []
+        if len(times) > self.THRESHOLD and len(self._rungs) < self.MAX_RUNGS:
+            lo = start + i * width
+            if min(times) < max(times):
+                self._spawn(lo, width / len(times), len(times) + 1, times)
+                return
+        heapq.heapify(times)
+        self._bottom = times
+
+
+#: Future-event-list backends selectable with ``SysExecutor(fel=...)``.
+FEL_BACKENDS = {
+    "heapset": ScheduleQueue,
+    "calendar": CalendarQueue,
+    "ladder": LadderQueue,
+}
+
+
+def make_schedule_queue(kind="heapset"):
+    """Instantiate the future-event list named ``kind``."""
+    try:
+        return FEL_BACKENDS[kind]()
+    except KeyError:
+        raise ValueError(
+            f"unknown future-event list {kind!r}; "
+            f"expected one of {sorted(FEL_BACKENDS)} or 'auto'"
+        ) from None
+
+
+def select_schedule_queue(queue, min_times=1 << 18):
+    """Pick a backend for the workload currently held by ``queue``.
+
+    Only the number of *distinct* pending timestamps matters: executors
+    sharing a timestamp cost a set insertion in every backend. The
+    heapset's ``heappush`` runs in C, so its O(log n) beats the
+    interpreted O(1) structures until the heap is very large; with
+    ``benchmark/run_fel.py`` the ladder queue overtakes it at roughly
+    250k distinct timestamps, hence the ``min_times`` default. The
+    calendar queue never came out ahead and is not auto-selected.
+
+    Counting buckets is O(1); buckets emptied by a reschedule but not
+    pruned yet are counted too.
+    """
+    if len(queue._mapped) >= min_times:
+        return "ladder"
+    return "heapset"
+
+
+def migrate_schedule_queue(queue, kind):
+    """Return a ``kind`` queue holding the same executors as ``queue``.
+
+    Buckets are copied as they are, so executors keep their scheduled
+    time without another ``get_req_time`` call.
+    """
+    new = make_schedule_queue(kind)
+    for t, bucket in queue._mapped.items():
+        if not bucket:
+            continue
+        new._mapped[t] = set(bucket)
+        if isinstance(new, ScheduleQueue):
+            heapq.heappush(new._heap, t)
+        elif t != Infinite:
+            new._insert(t)
+    new._reverse = {
+        obj_id: t for obj_id, t in queue._reverse.items()
+        if queue._mapped.get(t)
+    }
+    return new
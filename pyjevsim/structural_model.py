@@ -61,16 +61,21 @@ class StructuralModel(CoreModel):
 
     def remove_model(self, obj):
         """Removes a child model previously added with
-        :py:meth:`register_entity`.
-
-        Existing coupling entries that reference ``obj`` are **not**
-        cleaned up automatically; callers should drop them via
-        ``port_map`` if needed.
+        :py:meth:`register_entity`, together with every coupling that
+        has ``obj`` as its source or destination.
 
         Args:
             obj: The child model to remove. Must already be registered.
         """
         del self.model_map[obj.get_name()]
+        for src in list(self.port_map):
+            if src[0] is obj:
+                del self.port_map[src]
+                continue
+            destinations = self.port_map[src]
+            destinations[:] = [dst for dst in destinations if dst[0] is not obj]
+            if not destinations:
+                del self.port_map[src]
 
     def find_model(self, name):
         """Looks up a registered child model by name.
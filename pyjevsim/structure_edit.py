@@ -0,0 +1,110 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains StructureEdit, a batch of entity and coupling edits that a SysExecutor applies atomically between ticks.
+"""
+
+from .definition import Infinite
+
+ADD_ENTITY = "add_entity"
+REMOVE_ENTITY = "remove_entity"
+ADD_COUPLING = "add_coupling"
+REMOVE_COUPLING = "remove_coupling"
+
+
+class StructureEdit:
+    """A transaction of structure edits, created by
+    :py:meth:`SysExecutor.edit_structure`.
+
+    Edits are only recorded while the ``with`` block runs. On a normal
+    exit the executor checks the whole batch and applies it in one go;
+    if any edit is invalid (unknown model, missing coupling, ...) a
+    ``ValueError`` is raised and nothing is applied. An exception inside
+    the block discards the batch.
+
+    A batch committed from inside a tick (e.g. from a model's
+    ``int_trans``) is checked when the block exits, against the topology
+    plus the batches already waiting, so the ``ValueError`` reaches the
+    committing model. It is then held back until the tick's transitions
+    and rescheduling have finished, so a tick always sees one consistent
+    topology. Added entities are created at ``global_time + inst_t``
+    like with ``register_entity``.
+
+    Example::
+
+        with ss.edit_structure() as edit:
+            edit.add_entity(decoy)
+            edit.add_coupling(ship, "launch", decoy, "start")
+            edit.remove_entity("old_decoy")
+    """
+
+    def __init__(self, executor):
+        """
+        Args:
+            executor (SysExecutor): The executor the edits apply to
+        """
+        self._executor = executor
+        self.ops = []
+
+    def add_entity(self, entity, inst_t=0, dest_t=Infinite, ename="default"):
+        """
+        Registers an entity; arguments as for ``register_entity``.
+
+        Returns:
+            StructureEdit: self, for chaining
+        """
+        self.ops.append((ADD_ENTITY, (entity, inst_t, dest_t, ename)))
+        return self
+
+    def remove_entity(self, model):
+        """
+        Removes every entity registered under a name.
+
+        Args:
+            model (str or CoreModel): The model or its name
+
+        Returns:
+            StructureEdit: self, for chaining
+        """
+        name = model if isinstance(model, str) else model.get_name()
+        self.ops.append((REMOVE_ENTITY, name))
+        return self
+
+    def add_coupling(self, src_obj, out_port, dst_obj, in_port):
+        """
+        Couples ``src_obj.out_port`` to ``dst_obj.in_port``; ``None`` or
+        the executor itself stands for the executor's own ports, as for
+        ``coupling_relation``.
+
+        Returns:
+            StructureEdit: self, for chaining
+        """
+        self.ops.append((ADD_COUPLING, (src_obj, out_port, dst_obj, in_port)))
+        return self
+
+    def remove_coupling(self, src_obj, out_port, dst_obj, in_port):
+        """
+        Removes one coupling previously added with ``coupling_relation``
+        or :py:meth:`add_coupling`.
+
+        Returns:
+            StructureEdit: self, for chaining
+        """
+        self.ops.append((REMOVE_COUPLING, (src_obj, out_port, dst_obj, in_port)))
+        return self
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None and self.ops:
+            self._executor._commit_structure_edit(self.ops)
+        self.ops = []
+        return False
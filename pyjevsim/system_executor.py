@@ -8,23 +8,50 @@ https://github.com/eventsim/pyjevsim/blob/main/LICENSE
 This module includes SysExecutor, a simulation engine that manages models over time. 
 """
 
-import copy
 import datetime
 import heapq
+import itertools
 import math
+import os
+import sys
 import threading
 import time
 from collections import deque
+from time import perf_counter_ns
+
+# asyncio, concurrent.futures, gc / pickle / traceback (fork_run), the
+# TerminationManager (signal) and the Profiler (csv / json) are imported
+# where they are first needed, so a plain V_TIME run never loads them.
 
 from .core_model import CoreModel
 from .default_message_catcher import DefaultMessageCatcher
 from .definition import ExecutionType, Infinite, ModelType, SimulationMode
 from .executor_factory import ExecutorFactory
-from .schedule_queue import ScheduleQueue
+from .flat_structural_executor import FlatStructuralExecutor
+from .structure_edit import (
+    ADD_COUPLING,
+    ADD_ENTITY,
+    REMOVE_COUPLING,
+    REMOVE_ENTITY,
+    StructureEdit,
+)
+from .schedule_queue import (
+    make_schedule_queue,
+    migrate_schedule_queue,
+    select_schedule_queue,
+)
 from .system_message import SysMessage
-from .termination_manager import TerminationManager
 
 from .message_deliverer import MessageDeliverer
+from .output_channel import OutputChannel
+from .realtime_clock import RealTimeClock
+
+
+def _gil_enabled():
+    """True unless this is a free-threaded build running without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
 
 class SysExecutor(CoreModel):
     """The pyjevsim simulation engine.
@@ -53,9 +80,21 @@ class SysExecutor(CoreModel):
     EXTERNAL_SRC = "SRC"
     EXTERNAL_DST = "DST"
 
+    # With ``fel="auto"``, how many ticks pass between checks of the
+    # FEL workload (see :func:`select_schedule_queue`).
+    FEL_AUTO_INTERVAL = 4096
+
+    # With ``parallel_workers``, Phase A / Phase C only fan out to the
+    # thread pool when at least this many models take part in the tick;
+    # smaller ticks are cheaper to run inline.
+    PARALLEL_THRESHOLD = 32
+
     def __init__(self, _time_resolution, _sim_name="default",
                  ex_mode=ExecutionType.V_TIME, snapshot_manager=None,
-                 track_uncaught=False):
+                 track_uncaught=False, flatten_structural=False,
+                 fel="heapset", parallel_workers=None, message_pool=False,
+                 output_capacity=None, rt_speed=1.0, rt_overrun="catch_up",
+                 profile=False):
         """
         Initializes the SysExecutor with time resolution, simulation name, execution mode, and optional snapshot manager.
 
@@ -78,10 +117,75 @@ class SysExecutor(CoreModel):
                 extra ``ext_trans`` + ``set_req_time`` + heap push per
                 uncoupled emit — a measurable hit on dense graphs with
                 many dangling outputs (e.g. DEVStone LI).
+            flatten_structural (bool, optional): When True,
+                ``register_entity`` flattens a :class:`StructuralModel`
+                recursively: every atomic descendant is registered with
+                this executor directly (one FEL, one Parallel-DEVS tick,
+                correct ``con_trans``) and the EIC/IC/EOC couplings are
+                resolved into the routing index at :py:meth:`freeze`
+                time. The structural model stays addressable through
+                ``get_model`` / ``remove_entity`` / ``coupling_relation``
+                via a :class:`FlatStructuralExecutor` handle. Defaults
+                to False (each structural model gets its own
+                :class:`StructuralExecutor`).
+            fel (str, optional): Future-event-list backend —
+                ``"heapset"`` (default; best when many models share
+                timestamps), ``"calendar"``, ``"ladder"`` (O(1)
+                amortised for large populations with continuous
+                inter-event times), or ``"auto"``, which starts as a
+                heapset and re-evaluates the workload every
+                ``FEL_AUTO_INTERVAL`` ticks.
+            parallel_workers (int, optional): On free-threaded
+                (no-GIL) CPython builds, run the ``output()`` calls of
+                Phase A and the transitions of Phase C on a persistent
+                pool of this many threads whenever at least
+                ``PARALLEL_THRESHOLD`` models take part in a tick.
+                Routing (Phase B) and rescheduling (Phase D) stay on
+                the simulation thread, so results are unchanged, but
+                models must not share mutable state. Ignored (0) when
+                the GIL is enabled, where threads cannot speed up
+                CPU-bound models. Defaults to None (disabled).
+            message_pool (bool, optional): When True, every message
+                emitted in a tick is handed back to the
+                :py:meth:`SysMessage.single` free list once the tick's
+                transitions have run (messages forwarded to the
+                executor's output queue are kept). Only safe when models
+                never hold on to a received or emitted ``SysMessage``
+                object past the transition that sees it; payload lists
+                returned by ``retrieve()`` stay valid. Defaults to False.
+            output_capacity (int, optional): Bounds
+                ``output_event_queue``; once full, the oldest event is
+                dropped. Runs that never drain the queue (e.g. V_TIME
+                runs read through :py:meth:`open_output_channel`) can
+                pass 0 to keep nothing. Defaults to None (unbounded).
+            rt_speed (float, optional): R_TIME pace in simulated
+                seconds per wall-clock second, e.g. 10 for ten times
+                real time. Defaults to 1.0.
+            rt_overrun (str, optional): What R_TIME does when an event
+                is reached after its deadline — ``"catch_up"``
+                (default), ``"skip"`` or ``"slip"``; see
+                :class:`RealTimeClock`. Overruns are counted on
+                ``self.rt_clock``.
+            profile (bool, optional): When True, count calls and time
+                (``perf_counter_ns``) of every model's ``output``,
+                ``int_trans``, ``ext_trans``, ``con_trans`` and
+                ``set_req_time``, plus Phase A–D time and FEL size per
+                tick; read them with :py:meth:`get_profile` /
+                :py:meth:`dump_profile`. Defaults to False, which adds
+                no per-model work.
         """
         CoreModel.__init__(self, _sim_name, ModelType.UTILITY)
+        self._profiler = None
+        if profile:
+            from .profiler import Profiler
+            self._profiler = Profiler()
+        self._fel = fel
+        self.min_schedule_item = make_schedule_queue(
+            "heapset" if fel == "auto" else fel
+        )
         self.condition = threading.Condition()
         self._track_uncaught = bool(track_uncaught)
+        self._flatten_structural = bool(flatten_structural)
 
         self.global_time = 0
         self.target_time = 0
@@ -96,30 +200,93 @@ class SysExecutor(CoreModel):
         # dictionary for object to ports
         self.product_port_map = {}
         self.port_map = {}
-
+        # Compiled routing index built from `port_map` by `freeze()`:
+        # src_executor -> {out_port: ((dst_executor, dst_port), ...)}.
+        # Phase B reads it instead of hashing a fresh
+        # (src_executor, port) tuple per emit. Any topology edit drops
+        # the index (`_thaw`) and the next tick recompiles it.
+        self._route_index = {}
+        self._frozen = False
+        # Couplings declared inside flattened StructuralModels, in
+        # executor terms. IC edges keep `port_map` semantics; EOC edges
+        # map a child's output port onto its FlatStructuralExecutor's
+        # output port. Both are resolved into `_route_index` by
+        # `freeze()` and never appear in `port_map` (so snapshots only
+        # ever see top-level couplings).
+        self._flat_couplings = {}
+        self._flat_eoc = {}
 
         self.hierarchical_structure = {}
         self.model_map = {}
         
-        # ScheduleQueue: lazy-deletion priority queue. Push snapshots
-        # (req_time, obj_id, entry_id) at push time; the entries dict
-        # tracks the *current* entry per obj_id so duplicates from
-        # in-place reschedules become stale and get filtered on pop.
-        # No heapify ever runs; Executor.__lt__ is dead code now that
-        # ordering is settled by tuple comparison.
-        self.min_schedule_item = ScheduleQueue()
-        # Counter of registered executors with a finite destruct_time.
-        # `destroy_active_entity` short-circuits when this is zero so
-        # the per-tick scan over `active_obj_map` only runs when a
-        # destruction is actually pending.
-        self._destructs_pending = 0
+        # The FEL itself (`min_schedule_item`) is created first thing
+        # above so an unknown `fel` fails before any other setup. With
+        # `fel="auto"`, `_fel_countdown` counts ticks to the next
+        # workload check; it stays 0 (disabled) for a fixed backend.
+        self._fel_countdown = self.FEL_AUTO_INTERVAL if fel == "auto" else 0
+        # Destruction calendar: min-heap of (destruct_time, obj_id,
+        # executor) for every executor registered with a finite dest_t.
+        # `destroy_active_entity` only looks at its head, so a tick costs
+        # O(1) unless something actually expires.
+        self._destruct_calendar = []
+        # Reverse coupling index: executor -> set of `port_map` /
+        # flattened-coupling keys it appears in, as source or as
+        # destination. May hold keys that were removed since; readers
+        # check the maps themselves.
+        self._coupling_refs = {}
+        # `get_relation` result, rebuilt after the next topology edit.
+        self._relation_cache = None
+        # True while `_run_instant` runs; `edit_structure` batches
+        # committed meanwhile wait in `_pending_edits` until it ends.
+        self._in_tick = False
+        self._pending_edits = []
+        # Phase A/C thread pool, created on first use. The effective
+        # worker count is 0 whenever the GIL would serialise the pool.
+        self.parallel_workers = (
+            int(parallel_workers)
+            if parallel_workers and parallel_workers > 1 and not _gil_enabled()
+            else 0
+        )
+        self._pool = None
+        self.message_pool = bool(message_pool)
+        # Scratch structures reused by every `_run_instant` call instead
+        # of being reallocated per tick: the Phase A deliverers and
+        # result list, the per-receiver bag dict, a free list of emptied
+        # bags, and the imminent / affected sets.
+        self._md_arena = []
+        self._tick_outputs = []
+        self._tick_inputs = {}
+        self._free_bags = []
+        # Route tuples taken this tick, collected for the trace recorder.
+        self._trace_routes = []
+        self._imminent_set = set()
+        self._affected = set()
         self.sim_init_time = datetime.datetime.now()
         self.simulation_mode = SimulationMode.SIMULATION_IDLE
 
         # External Interface
         self.input_event_queue = []
-        self.output_event_queue = deque()
+        # Pull-based ExternalSource streams, read lazily by
+        # `_peek_next_event_time` / `_run_instant`; dropped once exhausted.
+        self._external_sources = []
+        self.output_event_queue = deque(maxlen=output_capacity)
         self._output_event_callback = None
+        self._trace_recorder = None
+        # OutputChannels fed by Phase B, and their lookup by output port:
+        # `_channel_routes[port]` lists the channels subscribed to that
+        # port plus the ones taking every port (`_channel_any`).
+        self._output_channels = []
+        self._channel_routes = {}
+        self._channel_any = ()
+        # (loop, asyncio.Event) of a running `simulate_async`, set by
+        # anything that may move the next event earlier, and the loop
+        # time at which simulated time 0 is due in that run.
+        self._async_wakeup = None
+        self._async_origin = 0.0
+
+        # R_TIME pacing: absolute deadlines, overrun policy and counters.
+        self.rt_clock = RealTimeClock(rt_speed, rt_overrun)
+        self._rt_active = False
 
         # TIME Handling
         self.ex_mode = ex_mode
@@ -143,6 +310,25 @@ class SysExecutor(CoreModel):
             float: The current global time
         """
         return self.global_time
+
+    def next_creation_time(self):
+        """
+        Returns the earliest creation time of an entity still waiting
+        to be created.
+
+        Returns:
+            float: The creation time, or ``Infinite`` if none is waiting
+        """
+        return self._waiting_keys[0] if self._waiting_keys else Infinite
+
+    def next_destruction_time(self):
+        """
+        Returns the earliest destruction time in the destruction calendar.
+
+        Returns:
+            float: The destruction time, or ``Infinite`` if none is due
+        """
+        return self._destruct_calendar[0][0] if self._destruct_calendar else Infinite
     
     '''
     def set_snapshot_manager(self, snapshot_manager):
@@ -166,17 +352,28 @@ class SysExecutor(CoreModel):
             ename (str, optional): SysExecutor name
         """
 
-        sim_obj = self.exec_factory.create_executor(
-            self.global_time, inst_t, self.global_time + dest_t, ename, entity, self
-        )
+        if (self._flatten_structural
+                and entity.get_model_type() == ModelType.STRUCTURAL):
+            sim_obj = self._flatten_entity(entity, inst_t, dest_t, ename)
+        else:
+            sim_obj = self.exec_factory.create_executor(
+                self.global_time, inst_t, self.global_time + dest_t, ename, entity, self
+            )
+            self._stage_executor(sim_obj, dest_t)
         self.product_port_map[entity] = sim_obj
 
-        # Track whether any registered executor has a finite destruct
-        # time. When the count is zero `destroy_active_entity` skips its
-        # full scan over `active_obj_map` — a measurable win on sparse
-        # workloads where the scan runs once per simulated tick.
+        if sim_obj.get_name() in self.model_map:
+            self.model_map[sim_obj.get_name()].append(sim_obj)
+        else:
+            self.model_map[sim_obj.get_name()] = [sim_obj]
+
+    def _stage_executor(self, sim_obj, dest_t):
+        """Queue a schedulable executor for creation at its instance time."""
         if dest_t < Infinite:
-            self._destructs_pending += 1
+            heapq.heappush(
+                self._destruct_calendar,
+                (sim_obj.get_destruct_time(), sim_obj.get_obj_id(), sim_obj),
+            )
 
         if sim_obj.get_create_time() not in self.waiting_obj_map:
             self.waiting_obj_map[sim_obj.get_create_time()] = []
@@ -184,12 +381,58 @@ class SysExecutor(CoreModel):
 
         self.waiting_obj_map[sim_obj.get_create_time()].append(sim_obj)
 
-        if sim_obj.get_name() in self.model_map:
-            self.model_map[sim_obj.get_name()].append(sim_obj)
-        else:
-            self.model_map[sim_obj.get_name()] = [sim_obj]
-        
-        
+    def _flatten_entity(self, structural_model, inst_t, dest_t, ename):
+        """Register every descendant of ``structural_model`` with this
+        executor and record its couplings for :py:meth:`freeze`.
+
+        Children share the structural model's creation and destruction
+        times. Couplings whose endpoints are not registered children are
+        skipped, matching :class:`StructuralExecutor`, which silently
+        ignores them too.
+
+        Returns:
+            FlatStructuralExecutor: handle for ``structural_model``
+        """
+        handle = FlatStructuralExecutor(
+            inst_t, self.global_time + dest_t, ename, structural_model, self
+        )
+        executors = {structural_model: handle}
+
+        for child in structural_model.get_models().values():
+            if child.get_model_type() == ModelType.STRUCTURAL:
+                sim_obj = self._flatten_entity(child, inst_t, dest_t, ename)
+            else:
+                sim_obj = self.exec_factory.create_executor(
+                    self.global_time, inst_t, self.global_time + dest_t,
+                    ename, child, self
+                )
+                self._stage_executor(sim_obj, dest_t)
+            executors[child] = sim_obj
+            handle.members.append(sim_obj)
+
+        for (src, src_port), destinations in structural_model.get_couplings().items():
+            src_exec = executors.get(src)
+            if src_exec is None:
+                continue
+            for dst, dst_port in destinations:
+                dst_exec = executors.get(dst)
+                if dst_exec is None:
+                    continue
+                if src is structural_model:
+                    handle.eic.setdefault(src_port, []).append((dst_exec, dst_port))
+                elif dst is structural_model:
+                    self._flat_eoc.setdefault(
+                        (src_exec, src_port), []
+                    ).append((handle, dst_port))
+                    self._index_coupling((src_exec, src_port), handle)
+                else:
+                    self._flat_couplings.setdefault(
+                        (src_exec, src_port), []
+                    ).append((dst_exec, dst_port))
+                    self._index_coupling((src_exec, src_port), dst_exec)
+
+        self._thaw()
+        return handle
 
     def get_entity(self, model_name):
         """
@@ -239,6 +482,8 @@ class SysExecutor(CoreModel):
                 lst = self.waiting_obj_map.pop(key)
                 for obj in lst:
                     self.active_obj_map[obj.get_obj_id()] = obj
+                    if self._profiler is not None:
+                        self._profiler.instrument(obj)
                     obj.set_req_time(self.global_time)
                     self.min_schedule_item.push(obj)
 
@@ -246,54 +491,88 @@ class SysExecutor(CoreModel):
         """
         Destroys a list of entities.
 
+        Couplings are purged through the reverse coupling index, so the
+        cost is proportional to the couplings the entities take part
+        in, not to the size of ``port_map``.
+
         Args:
             delete_lst (list): List of entities to delete
         """
+        touched = set()
         for agent in delete_lst:
-            del self.active_obj_map[agent.get_obj_id()]
-
-            port_del_map = {}
-            for key, value in self.port_map.items():
-                if key[0] == agent:
-                    port_del_map[key] = True
-
-                if value:
-                    del_items = []
-                    for src_port in value:
-                        src, _ = src_port
-                        if src == agent:
-                            del_items.append(src_port)
-                    for item in del_items:
-                        value.remove(item)
+            self._remove_executor(agent, touched)
+        self._thaw()
 
-            for key in port_del_map:
-                del self.port_map[key]
+    def _remove_executor(self, agent, touched):
+        """Take ``agent`` out of the simulation and purge its couplings;
+        the coupling keys that changed are added to ``touched``.
 
-            self.min_schedule_item.remove(agent)
+        An executor that has not been created yet is dropped from the
+        creation queue instead of ``active_obj_map``.
+        """
+        if isinstance(agent, FlatStructuralExecutor):
+            # A flattened structural model is never scheduled itself;
+            # tearing it down means tearing down its children.
+            for member in agent.members:
+                self._remove_executor(member, touched)
+        elif self.active_obj_map.pop(agent.get_obj_id(), None) is None:
+            waiting = self.waiting_obj_map.get(agent.get_create_time())
+            if waiting and agent in waiting:
+                waiting.remove(agent)
+
+        maps = (self.port_map, self._flat_couplings, self._flat_eoc)
+        for key in self._coupling_refs.pop(agent, ()):
+            for coupling_map in maps:
+                value = coupling_map.get(key)
+                if value is None:
+                    continue
+                touched.add(key)
+                if key[0] is agent:
+                    del coupling_map[key]
+                else:
+                    value[:] = [pair for pair in value if pair[0] is not agent]
+
+        self.min_schedule_item.remove(agent)
+
+    def _index_coupling(self, key, dst_obj):
+        """Record coupling ``key -> dst_obj`` in the reverse coupling index."""
+        refs = self._coupling_refs
+        for obj in (key[0], dst_obj):
+            if obj is not self:
+                keys = refs.get(obj)
+                if keys is None:
+                    keys = refs[obj] = set()
+                keys.add(key)
 
     def destroy_active_entity(self):
         """
         Destroys active entities whose ``destruct_time`` has elapsed.
 
-        Fast-path: when no registered executor was ever given a finite
-        ``destruct_time`` the scan is skipped entirely. This is the
-        common case (most simulations register entities with the
-        default ``Infinite`` destruct time) and the scan would
-        otherwise run once per simulated tick.
+        Expired entities are popped from the destruction calendar, so a
+        tick with nothing to destroy costs one comparison and destroying
+        ``k`` entities costs ``O(k log n)``. An entity whose destruct time
+        comes before its creation time is kept in the calendar until it
+        has been created; one that was already removed is dropped.
         """
-        if self._destructs_pending == 0:
-            return
-        if not self.active_obj_map:
+        calendar = self._destruct_calendar
+        global_time = self.global_time
+        if not calendar or calendar[0][0] > global_time:
             return
 
+        active_obj_map = self.active_obj_map
         delete_lst = []
-        global_time = self.global_time
-        for agent in self.active_obj_map.values():
-            if agent._cached_destruct_time <= global_time:
+        deferred = []
+        while calendar and calendar[0][0] <= global_time:
+            entry = heapq.heappop(calendar)
+            agent = entry[2]
+            if entry[1] in active_obj_map:
                 delete_lst.append(agent)
+            elif agent in self.waiting_obj_map.get(agent.get_create_time(), ()):
+                deferred.append((agent.get_create_time(), entry[1], agent))
+        for entry in deferred:
+            heapq.heappush(calendar, entry)
 
         if delete_lst:
-            self._destructs_pending -= len(delete_lst)
             self.destory_entity(delete_lst)
 
     def coupling_relation(self, src_obj, out_port, dst_obj, in_port):
@@ -321,14 +600,21 @@ class SysExecutor(CoreModel):
             self.port_map[(src_obj, out_port)].append((dst_obj, in_port))
         else:
             self.port_map[(src_obj, out_port)] = [(dst_obj, in_port)]
+        self._index_coupling((src_obj, out_port), dst_obj)
+        self._thaw()
 
     def get_relation(self):
         """
         Retrieves the current coupling relations.
 
+        The map is built once and reused until the next topology edit.
+
         Returns:
-            dict: The relation map
+            dict: The relation map. Treat it as read-only; it is shared
+            between calls.
         """
+        if self._relation_cache is not None:
+            return self._relation_cache
         relation_map = {}
         for relation in self.port_map.keys():
             result_out_list = [] 
@@ -337,6 +623,7 @@ class SysExecutor(CoreModel):
             for out in out_list:
                 result_out_list.append((out[0].get_core_model(), out[1]))
             relation_map[in_tuple] = result_out_list
+        self._relation_cache = relation_map
         return relation_map
         
     def remove_relation(self, src, out_port, dst, in_port):
@@ -355,10 +642,240 @@ class SysExecutor(CoreModel):
         
         if self.port_map[in_tuple] == []:
             del self.port_map[in_tuple]
+        self._thaw()
 
     def reset_relation(self):
         """Resets all coupling relations."""
         self.port_map = {}
+        self._coupling_refs = {}
+        self._thaw()
+
+    def freeze(self):
+        """Compile ``port_map`` into the per-executor routing index.
+
+        ``port_map`` stays the editable source of truth; the index is a
+        read-only projection of it keyed first by source executor and
+        then by output-port name, with every destination list frozen
+        into a tuple. Phase B of :py:meth:`_run_instant` then resolves a
+        model's table once per tick and each emit with a single
+        string-keyed lookup, instead of building and hashing a
+        ``(src_executor, port)`` tuple per message.
+
+        Called from :py:meth:`init_sim`, and lazily at the start of the
+        next tick after any topology edit (``coupling_relation``,
+        ``remove_relation``, ``reset_relation``, entity destruction)
+        has dropped the index. Code that mutates ``port_map`` directly
+        must call ``freeze()`` (or :py:meth:`_thaw`) itself.
+
+        With ``flatten_structural=True`` this is also where structural
+        couplings are resolved: a destination that is a
+        :class:`FlatStructuralExecutor` is expanded through its EIC
+        table, and an emit that leaves a structural model through EOC
+        picks up the destinations of the structural model's output
+        port, recursively, so every compiled entry points at
+        schedulable executors (or this executor, for external output).
+        """
+        route_index = {}
+        if self._flat_couplings or self._flat_eoc:
+            sources = set(self.port_map)
+            sources.update(self._flat_couplings)
+            sources.update(self._flat_eoc)
+            for src, port in sources:
+                if isinstance(src, FlatStructuralExecutor):
+                    continue
+                table = route_index.get(src)
+                if table is None:
+                    route_index[src] = table = {}
+                table[port] = tuple(self._resolve_output(src, port, set()))
+        else:
+            for (src, port), destinations in self.port_map.items():
+                table = route_index.get(src)
+                if table is None:
+                    route_index[src] = table = {}
+                table[port] = tuple(destinations)
+        self._route_index = route_index
+        self._frozen = True
+
+    def _resolve_output(self, src, port, visited):
+        """Destinations reached by an emit on ``(src, port)`` once
+        flattened structural models are seen through. ``visited`` guards
+        against coupling cycles through structural ports."""
+        resolved = []
+        for pair in self.port_map.get((src, port), ()):
+            self._resolve_input(pair, resolved, visited)
+        for pair in self._flat_couplings.get((src, port), ()):
+            self._resolve_input(pair, resolved, visited)
+        for handle_port in self._flat_eoc.get((src, port), ()):
+            if handle_port not in visited:
+                visited.add(handle_port)
+                resolved.extend(
+                    self._resolve_output(handle_port[0], handle_port[1], visited)
+                )
+        return resolved
+
+    def _resolve_input(self, pair, resolved, visited):
+        """Append the schedulable destinations behind input ``pair``."""
+        dst, dst_port = pair
+        if not isinstance(dst, FlatStructuralExecutor):
+            resolved.append(pair)
+            return
+        if ("in", pair) in visited:
+            return
+        visited.add(("in", pair))
+        for inner in dst.eic.get(dst_port, ()):
+            if inner[0] is dst:
+                # EIC straight to EOC: the input re-emerges as output.
+                resolved.extend(self._resolve_output(dst, inner[1], visited))
+            else:
+                self._resolve_input(inner, resolved, visited)
+
+    def _thaw(self):
+        """Drop the compiled routing index after a topology edit. The
+        next tick (or ``init_sim``) recompiles it from ``port_map``."""
+        self._frozen = False
+        self._relation_cache = None
+
+    def _patch_routes(self, keys):
+        """Bring the compiled routing index up to date for the coupling
+        ``keys`` that changed, without recompiling it.
+
+        Only the plain ``port_map`` index can be patched key by key; with
+        flattened structural couplings an edit may change resolved
+        routes anywhere, so the index is dropped instead.
+        """
+        self._relation_cache = None
+        if not self._frozen:
+            return
+        if self._flat_couplings or self._flat_eoc:
+            self._thaw()
+            return
+        route_index = self._route_index
+        for key in keys:
+            src, port = key
+            destinations = self.port_map.get(key)
+            table = route_index.get(src)
+            if destinations is not None:
+                if table is None:
+                    table = route_index[src] = {}
+                table[port] = tuple(destinations)
+            elif table is not None:
+                table.pop(port, None)
+                if not table:
+                    del route_index[src]
+
+    def edit_structure(self):
+        """Start a batch of structure edits.
+
+        Returns a :class:`StructureEdit` to use as a context manager.
+        The batch is checked when the ``with`` block exits and applied
+        atomically — immediately between ticks, or after the current
+        tick's transitions when committed from inside a tick. The
+        routing index is patched for the touched couplings only and
+        added or removed entities go straight into / out of the FEL.
+
+        Returns:
+            StructureEdit: The (empty) transaction
+        """
+        return StructureEdit(self)
+
+    def _commit_structure_edit(self, ops):
+        # Checked now, against the batches still waiting for the tick to
+        # end, so the committing model gets the error and a pending batch
+        # can never fail when it is applied.
+        self._check_structure_edit(ops, self._pending_edits)
+        if self._in_tick:
+            self._pending_edits.append(ops)
+        else:
+            self._apply_structure_edit(ops)
+
+    def _apply_pending_edits(self):
+        pending, self._pending_edits = self._pending_edits, []
+        for ops in pending:
+            self._apply_structure_edit(ops)
+
+    def _coupling_endpoint(self, obj):
+        return self if obj is None or obj is self else self.product_port_map[obj]
+
+    def _check_structure_edit(self, ops, pending=()):
+        """Raise ``ValueError`` if any edit of the batch cannot apply,
+        replaying the batch against the current topology, after the
+        already checked ``pending`` batches, without changing it."""
+        alive = {}      # name -> set of models, for names the batch touched
+        counts = {}     # (src, out_port, dst, in_port) -> coupling count
+
+        def models_named(name):
+            models = alive.get(name)
+            if models is None:
+                models = alive[name] = {
+                    executor.get_core_model()
+                    for executor in self.model_map.get(name, ())
+                }
+            return models
+
+        def known(obj):
+            if obj is None or obj is self:
+                return True
+            models = alive.get(obj.get_name())
+            if models is not None:
+                return obj in models
+            return obj in self.product_port_map and obj.get_name() in self.model_map
+
+        def count(edge):
+            if edge in counts:
+                return counts[edge]
+            src, out_port, dst, in_port = edge
+            for obj in (src, dst):
+                if not known(obj) or (obj is not None and obj is not self
+                                      and obj not in self.product_port_map):
+                    return 0
+            key = (self._coupling_endpoint(src), out_port)
+            pair = (self._coupling_endpoint(dst), in_port)
+            return self.port_map.get(key, ()).count(pair)
+
+        for op, args in itertools.chain(*pending, ops):
+            if op == ADD_ENTITY:
+                models_named(args[0].get_name()).add(args[0])
+            elif op == REMOVE_ENTITY:
+                if not models_named(args):
+                    raise ValueError(f"no entity named {args!r} to remove")
+                alive[args] = set()
+            elif op == ADD_COUPLING:
+                for obj in (args[0], args[2]):
+                    if not known(obj):
+                        raise ValueError(f"{obj.get_name()!r} is not registered")
+                counts[args] = count(args) + 1
+            elif op == REMOVE_COUPLING:
+                current = count(args)
+                if not current:
+                    raise ValueError(f"no coupling {args!r} to remove")
+                counts[args] = current - 1
+
+    def _apply_structure_edit(self, ops):
+        """Apply one checked batch of :class:`StructureEdit` operations."""
+        touched = set()
+        for op, args in ops:
+            if op == ADD_ENTITY:
+                self.register_entity(*args)
+            elif op == REMOVE_ENTITY:
+                for agent in self.model_map.pop(args):
+                    self._remove_executor(agent, touched)
+                    self.product_port_map.pop(agent.get_core_model(), None)
+            elif op == ADD_COUPLING:
+                src_obj, out_port, dst_obj, in_port = args
+                key = (self._coupling_endpoint(src_obj), out_port)
+                dst = self._coupling_endpoint(dst_obj)
+                self.port_map.setdefault(key, []).append((dst, in_port))
+                self._index_coupling(key, dst)
+                touched.add(key)
+            else:
+                src_obj, out_port, dst_obj, in_port = args
+                key = (self._coupling_endpoint(src_obj), out_port)
+                destinations = self.port_map[key]
+                destinations.remove((self._coupling_endpoint(dst_obj), in_port))
+                if not destinations:
+                    del self.port_map[key]
+                touched.add(key)
+        self._patch_routes(touched)
 
     def single_output_handling(self, obj, msg):
         """Immediate (non-two-phase) delivery of a single message.
@@ -393,6 +910,8 @@ class SysExecutor(CoreModel):
             if destination[0] is self:
                 with self.condition:
                     self.output_event_queue.append((self.global_time, msg.retrieve()))
+                if self._output_channels:
+                    self._publish(self.global_time, destination[1], msg)
                 if self._output_event_callback:
                     self._output_event_callback()
             elif destination[0].get_obj_id() in self.active_obj_map:
@@ -425,6 +944,9 @@ class SysExecutor(CoreModel):
         if self.active_obj_map is None:
             self.global_time = min(self.waiting_obj_map)
 
+        if not self._frozen:
+            self.freeze()
+
         if not self.min_schedule_item:
             for obj in self.active_obj_map.items():
                 if obj[1].time_advance() < 0:
@@ -453,6 +975,10 @@ class SysExecutor(CoreModel):
             ext_t = self.input_event_queue[0][0]
             if ext_t < next_t:
                 next_t = ext_t
+        if self._external_sources:
+            ext_t = self._next_source_time()
+            if ext_t < next_t:
+                next_t = ext_t
         if self._waiting_keys:
             wait_t = self._waiting_keys[0]
             if wait_t < next_t:
@@ -460,11 +986,14 @@ class SysExecutor(CoreModel):
         return next_t
 
     _NO_DESTINATIONS = ()
+    _NO_ROUTES = {}
 
     def _destinations_for(self, src_executor, src_port):
         """Return ``(dst_executor, dst_port)`` pairs for a source emit.
 
-        Behaviour depends on the executor's ``track_uncaught`` flag:
+        Reads the compiled routing index (see :py:meth:`freeze`),
+        recompiling it first if the topology was edited. Behaviour for
+        ports without a coupling depends on the executor's ``track_uncaught`` flag:
 
         * Default (``track_uncaught=False``): uncoupled ports return an
           empty tuple, so emits to dangling outputs are no-ops on the
@@ -474,18 +1003,21 @@ class SysExecutor(CoreModel):
           would have been delivered. Pays one extra ``ext_trans`` +
           ``set_req_time`` + heap push per uncoupled emit.
         """
-        pair = (src_executor, src_port)
-        coupling = self.port_map.get(pair)
+        if not self._frozen:
+            self.freeze()
+        coupling = self._route_index.get(src_executor, self._NO_ROUTES).get(src_port)
         if coupling is not None:
             return coupling
+        pair = (src_executor, src_port)
         if self._track_uncaught:
-            self.port_map[pair] = fallback = [
-                (self.active_obj_map[self.dmc.get_obj_id()], "uncaught")
-            ]
+            dmc = self.active_obj_map[self.dmc.get_obj_id()]
+            self.port_map[pair] = fallback = [(dmc, "uncaught")]
+            self._index_coupling(pair, dmc)
+            self._thaw()
             return fallback
         return self._NO_DESTINATIONS
 
-    def _run_instant(self, instant, imminent):
+    def _run_instant(self, instant, imminent, outputs=None):
         """Execute one Parallel-DEVS two-phase tick at simulated time
         ``instant``.
 
@@ -513,87 +1045,273 @@ class SysExecutor(CoreModel):
             ``int_trans``; receiving only -> ``ext_trans``.
           * D — bulk reschedule every affected model.
 
+        The tick allocates no containers of its own: deliverers, bags and
+        sets are executor-owned scratch buffers that are cleared and
+        reused (see ``__init__``). A deliverer or a bag is therefore only
+        valid while the tick that handed it out runs; models must copy,
+        not keep, ``port_msgs`` if they need it later.
+
+        Structure edits committed by models during the tick are applied
+        once it has finished (see :py:meth:`edit_structure`).
+
         Args:
             instant (float): simulated time of this tick. ``global_time``
                 must already equal ``instant``.
             imminent (list): executors already popped for ``instant``.
                 May be empty when only external events are due.
+            outputs (list, optional): Phase A result computed by the
+                caller as ``[(executor, MessageDeliverer), ...]``. When
+                given, Phase A is skipped; used by drivers that must
+                see the outputs before routing them (e.g.
+                :class:`ParallelSysExecutor` partitions).
         """
+        self._in_tick = True
+        try:
+            self._run_phases(instant, imminent, outputs)
+        finally:
+            self._in_tick = False
+        if self._pending_edits:
+            self._apply_pending_edits()
+
+    def _run_phases(self, instant, imminent, outputs):
+        """Body of :py:meth:`_run_instant`."""
         active_obj_map = self.active_obj_map
         callback = self._output_event_callback
         output_queue = self.output_event_queue
+        channels = self._output_channels
+        profiler = self._profiler
+        if profiler is not None:
+            t_start = perf_counter_ns()
+
+        # Recompile the routing index if the topology was edited since
+        # the last tick (entity destruction, runtime couplings, ...).
+        if not self._frozen:
+            self.freeze()
+        route_index = self._route_index
 
         # Seed the per-receiver bag with external events due at <= instant.
         # An external event whose destination model is imminent this
         # instant lands in the same bag, so Phase C dispatches con_trans
         # rather than a separate ext_trans (TSO / confluent delivery).
-        influenced_inputs = {}      # dst_executor -> list[(dst_port, msg)]
+        influenced_inputs = self._tick_inputs  # dst_executor -> [(dst_port, msg)]
+        influenced_inputs.clear()
+        free_bags = self._free_bags
+        # For a trace recorder that keeps deliveries, every route taken
+        # is noted (one append per message, not per delivery) so the
+        # recorder can recognise a tick it has already packed.
+        recorder = self._trace_recorder
+        routed = None
+        if recorder is not None and recorder.deliveries:
+            routed = self._trace_routes
+            routed.clear()
         if self.input_event_queue:
             with self.condition:
                 while (self.input_event_queue
                        and self.input_event_queue[0][0] <= instant):
                     _, ext_msg = heapq.heappop(self.input_event_queue)
-                    for dst_exec, dst_port in self._destinations_for(
-                        self, ext_msg.get_dst()
-                    ):
+                    destinations = self._destinations_for(self, ext_msg.get_dst())
+                    if routed is not None:
+                        routed.append(destinations)
+                    for dst_exec, dst_port in destinations:
                         if dst_exec is not self and dst_exec._obj_id in active_obj_map:
-                            influenced_inputs.setdefault(
-                                dst_exec, []
-                            ).append((dst_port, ext_msg))
-
-        if not imminent and not influenced_inputs:
-            return
-
-        # Phase A — collect lambda outputs from imminents.
-        outputs = []
-        for X in imminent:
-            md = MessageDeliverer()
-            X.output(md)
-            if md.has_contents():
-                outputs.append((X, md))
+                            bag = influenced_inputs.get(dst_exec)
+                            if bag is None:
+                                bag = influenced_inputs[dst_exec] = (
+                                    free_bags.pop() if free_bags else []
+                                )
+                            bag.append((dst_port, ext_msg))
+        if self._external_sources:
+            self._drain_sources(instant, influenced_inputs, routed)
+        if profiler is not None:
+            t_seeded = perf_counter_ns()
+
+        # Only messages emitted by this tick's own Phase A are recycled;
+        # caller-supplied outputs may still be referenced elsewhere.
+        recycle = self.message_pool and outputs is None
+        exported = None
+        if outputs is None:
+            if not imminent and not influenced_inputs:
+                return
+
+            # Phase A — collect lambda outputs from imminents.
+            if self.parallel_workers and len(imminent) >= self.PARALLEL_THRESHOLD:
+                outputs = []
+                for chunk in self._fan_out(self._collect_outputs, imminent):
+                    outputs.extend(chunk)
+            else:
+                outputs = self._collect_outputs_reusing(imminent)
+        if profiler is not None:
+            t_output = perf_counter_ns()
 
         # Phase B — route outputs through coupling, merging into the bag
-        # already seeded with external events.
+        # already seeded with external events. Each imminent's compiled
+        # port table is fetched once; an emit on a port without a table
+        # entry is uncoupled and only falls back to `_destinations_for`
+        # when `track_uncaught` asks for the dmc detour.
+        track_uncaught = self._track_uncaught
         for X, md in outputs:
+            table = route_index.get(X, self._NO_ROUTES)
             for msg in md.get_contents():
-                for dst_exec, dst_port in self._destinations_for(X, msg.get_dst()):
+                destinations = table.get(msg.get_dst())
+                if destinations is None:
+                    if not track_uncaught:
+                        continue
+                    destinations = self._destinations_for(X, msg.get_dst())
+                if routed is not None:
+                    routed.append(destinations)
+                for dst_exec, dst_port in destinations:
                     if dst_exec is self:
                         # External output of the whole simulator. When no
                         # callback is registered we are in the
                         # single-thread fast path and the lock is
-                        # unnecessary.
+                        # unnecessary; otherwise another thread may swap
+                        # the queue out (`handle_external_output_event`),
+                        # so it is re-read under the lock.
                         if callback is not None:
                             with self.condition:
-                                output_queue.append((instant, msg))
+                                self.output_event_queue.append((instant, msg))
                             callback()
                         else:
                             output_queue.append((instant, msg))
+                        if channels:
+                            self._publish(instant, dst_port, msg)
+                        if recycle:
+                            if exported is None:
+                                exported = set()
+                            exported.add(msg)
                     elif dst_exec._obj_id in active_obj_map:
-                        influenced_inputs.setdefault(
-                            dst_exec, []
-                        ).append((dst_port, msg))
-
-        imminent_set = set(imminent)
-        affected = imminent_set | set(influenced_inputs)
+                        bag = influenced_inputs.get(dst_exec)
+                        if bag is None:
+                            bag = influenced_inputs[dst_exec] = (
+                                free_bags.pop() if free_bags else []
+                            )
+                        bag.append((dst_port, msg))
+
+        imminent_set = self._imminent_set
+        imminent_set.clear()
+        imminent_set.update(imminent)
+        affected = self._affected
+        affected.clear()
+        affected.update(imminent_set)
+        affected.update(influenced_inputs)
+        if profiler is not None:
+            t_routed = perf_counter_ns()
 
         # Phase C — apply the right transition for every affected model.
+        if self.parallel_workers and len(affected) >= self.PARALLEL_THRESHOLD:
+            self._fan_out(self._apply_transitions, list(affected),
+                          imminent_set, influenced_inputs)
+        else:
+            self._apply_transitions(affected, imminent_set, influenced_inputs)
+        if recorder is not None:
+            recorder.record(instant, imminent_set, influenced_inputs, routed)
+
+        if recycle:
+            for _, md in outputs:
+                for msg in md.get_contents():
+                    if exported is None or msg not in exported:
+                        msg.recycle()
+
+        # Hand the bags back before Phase D so no message outlives its tick
+        # in scratch storage.
+        for bag in influenced_inputs.values():
+            bag.clear()
+            free_bags.append(bag)
+        influenced_inputs.clear()
+        if profiler is not None:
+            t_applied = perf_counter_ns()
+
+        # Phase D — bulk reschedule via ScheduleQueue.push. Each push
+        # snapshots the new req_time and supersedes the prior entry (lazy
+        # invalidation). No heapify; tuple comparison settles ordering.
         for M in affected:
+            M.set_req_time(instant)
+            self.min_schedule_item.push(M)
+
+        if profiler is not None:
+            # Seeding the bags with external events counts as routing.
+            profiler.add_tick(
+                (t_output - t_seeded,
+                 t_routed - t_output + t_seeded - t_start,
+                 t_applied - t_routed,
+                 perf_counter_ns() - t_applied),
+                len(self.min_schedule_item),
+            )
+
+    @staticmethod
+    def _collect_outputs(imminent):
+        """Phase A body: ``[(executor, MessageDeliverer), ...]`` for the
+        imminents that emitted, in ``imminent`` order."""
+        outputs = []
+        for X in imminent:
+            md = MessageDeliverer()
+            X.output(md)
+            if md.has_contents():
+                outputs.append((X, md))
+        return outputs
+
+    def _collect_outputs_reusing(self, imminent):
+        """Sequential Phase A body over the executor's scratch buffers.
+
+        Same result as :py:meth:`_collect_outputs`, but the deliverers come
+        from ``_md_arena`` and the list is ``_tick_outputs``, both emptied
+        and reused. A deliverer only advances to the next arena slot when
+        its imminent emitted, so the arena grows to the largest number of
+        emitters seen in one tick.
+        """
+        outputs = self._tick_outputs
+        outputs.clear()
+        arena = self._md_arena
+        k = 0
+        for X in imminent:
+            if k == len(arena):
+                arena.append(MessageDeliverer())
+            md = arena[k]
+            data = md.data_list
+            if data:
+                data.clear()
+            X.output(md)
+            if data:
+                outputs.append((X, md))
+                k += 1
+        return outputs
+
+    @staticmethod
+    def _apply_transitions(models, imminent_set, influenced_inputs):
+        """Phase C body: dispatch con/int/ext transitions."""
+        for M in models:
             bag = influenced_inputs.get(M, ())
             is_imminent = M in imminent_set
             if is_imminent and bag:
                 M.con_trans(bag)
             elif is_imminent:
                 M.int_trans()
+            elif M.groups_inputs:
+                M.ext_trans_bag(bag)
             else:
                 for port, msg in bag:
                     M.ext_trans(port, msg)
 
-        # Phase D — bulk reschedule via ScheduleQueue.push. Each push
-        # snapshots the new req_time and supersedes the prior entry (lazy
-        # invalidation). No heapify; tuple comparison settles ordering.
-        for M in affected:
-            M.set_req_time(instant)
-            self.min_schedule_item.push(M)
+    def _fan_out(self, fn, items, *args):
+        """Run ``fn(chunk, *args)`` over ``parallel_workers`` contiguous
+        chunks of ``items`` on the thread pool; results come back in
+        chunk order and a model exception is re-raised here."""
+        pool = self._pool
+        if pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            pool = self._pool = ThreadPoolExecutor(
+                max_workers=self.parallel_workers,
+                thread_name_prefix=f"{self.get_name()}-tick",
+            )
+        size = -(-len(items) // self.parallel_workers)
+        futures = [pool.submit(fn, items[i:i + size], *args)
+                   for i in range(0, len(items), size)]
+        return [future.result() for future in futures]
+
+    def _shutdown_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
 
     def schedule(self):
         """Run one simulated-instant tick (V_TIME / R_TIME).
@@ -608,16 +1326,15 @@ class SysExecutor(CoreModel):
             If more events are still due at the current instant the
             timestamp is left unchanged so the next ``schedule()`` call
             processes them in another round at the same simulated time.
-          * R_TIME: step by ``time_resolution`` and sleep to match
-            wall-clock pace.
+          * R_TIME: jump like V_TIME, but only once the next instant's
+            wall-clock deadline has come (:py:meth:`_advance_real_time`).
         """
         self.create_entity()
 
-        # `time.perf_counter()` is only consulted at the bottom of this
-        # method to compute the R_TIME sleep delta. Avoid the syscall
-        # in V_TIME where the value is never read.
-        is_realtime = self.ex_mode == ExecutionType.R_TIME
-        before = time.perf_counter() if is_realtime else None
+        if self._fel_countdown:
+            self._fel_countdown -= 1
+            if not self._fel_countdown:
+                self._reselect_fel()
 
         # Phase A — pop all imminents at the current global_time.
         # The heapset's `pop_all_at(t)` drains a whole bucket in one O(1)
@@ -652,15 +1369,51 @@ class SysExecutor(CoreModel):
             # the remaining round at the same simulated time.
             if new_time > self.global_time:
                 self.global_time = new_time
-        elif self.ex_mode != ExecutionType.HLA_TIME:
-            self.global_time += self.time_resolution
+        elif self.ex_mode == ExecutionType.R_TIME:
+            self._advance_real_time()
 
         self.destroy_active_entity()
 
-        if is_realtime:
-            delta = float(self.time_resolution) - float(time.perf_counter() - before)
-            if delta > 0:
-                time.sleep(delta)
+    def _advance_real_time(self):
+        """R_TIME Phase E: wait for the next instant's deadline and move
+        ``global_time`` there.
+
+        The wait is a ``condition.wait`` up to ``rt_clock.spin`` seconds
+        before the deadline followed by a busy-wait, so an empty stretch
+        of simulated time costs one wake-up. Anything notifying the
+        condition (an external event, pause, terminate) ends the wait
+        early; ``global_time`` then moves to the current wall-clock
+        position and the caller's loop re-plans from there.
+        """
+        clock = self.rt_clock
+        next_t = min(self._peek_next_event_time(), self.target_time)
+        if next_t <= self.global_time:
+            return
+        deadline = clock.deadline(next_t)
+        coarse = deadline - clock.spin - time.perf_counter()
+        if coarse > 0:
+            with self.condition:
+                # Re-check under the lock: an event inserted since the
+                # peek has already sent its notification.
+                woken = (self._peek_next_event_time() < next_t
+                         or self.simulation_mode != SimulationMode.SIMULATION_RUNNING
+                         or self.condition.wait(None if coarse == Infinite else coarse))
+            if woken:
+                now = clock.now()
+                if now > self.global_time:
+                    self.global_time = min(now, next_t)
+                return
+        clock.spin_until(deadline)
+        self.global_time = min(clock.settle(next_t), self.target_time)
+
+    def _reselect_fel(self):
+        """``fel="auto"``: move the FEL to the backend that suits the
+        current workload and schedule the next check."""
+        fel = self.min_schedule_item
+        kind = select_schedule_queue(fel)
+        if kind != fel.KIND:
+            self.min_schedule_item = migrate_schedule_queue(fel, kind)
+        self._fel_countdown = self.FEL_AUTO_INTERVAL
 
     def simulate(self, _time=Infinite, _tm=True):
         """
@@ -671,6 +1424,7 @@ class SysExecutor(CoreModel):
             _tm (bool): Whether to use the termination manager 
         """
         if _tm:
+            from .termination_manager import TerminationManager
             self.tm = TerminationManager(self)
 
         self.target_time = self.global_time + _time
@@ -686,31 +1440,200 @@ class SysExecutor(CoreModel):
         # times (sparse-time workloads).
         unbounded = (_time == Infinite)
         v_time = self.ex_mode == ExecutionType.V_TIME
+        r_time = self.ex_mode == ExecutionType.R_TIME
+        # While set, external events are scheduled from the wall-clock
+        # position rather than from `global_time`.
+        self._rt_active = r_time
+        if r_time:
+            self.rt_clock.start(self.global_time)
+
+        try:
+            while self.global_time < self.target_time:
+                # Fast path: in the common case the simulation is RUNNING and
+                # no external thread is poking at it. Skip the condition lock
+                # entirely and only acquire it when we actually need to wait
+                # for resume. CPython attribute reads are atomic at the
+                # bytecode level so a stale read is fine — the worst case is
+                # one extra loop iteration before we notice the pause.
+                if self.simulation_mode == SimulationMode.SIMULATION_PAUSE:
+                    with self.condition:
+                        while self.simulation_mode == SimulationMode.SIMULATION_PAUSE:
+                            self.condition.wait()
+                    if r_time:
+                        self.rt_clock.start(self.global_time)
+
+                if self.simulation_mode == SimulationMode.SIMULATION_TERMINATED:
+                    break
+
+                if (unbounded
+                        and v_time
+                        and not self.waiting_obj_map
+                        and not self._external_sources
+                        and self.min_schedule_item
+                        and self.min_schedule_item.peek_time(default=Infinite) == Infinite):
+                    self.simulation_mode = SimulationMode.SIMULATION_TERMINATED
+                    break
+
+                self.schedule()
+        finally:
+            self._rt_active = False
+
+    async def simulate_async(self, _time=Infinite):
+        """
+        Runs the simulation in real time on the running asyncio loop.
+
+        Asyncio counterpart of R_TIME :py:meth:`simulate`, paced by
+        ``rt_speed`` simulated seconds per second: the driver sleeps on
+        an asyncio timer until the next scheduled event, and wakes early
+        when an event is
+        inserted (:py:meth:`insert_external_event_async`, or
+        ``insert_external_event`` from another thread). Each instant runs
+        the same tick as ``schedule``; the loop yields to other tasks
+        between instants. ``pause_sim`` / ``resume_sim`` and
+        ``terminate_simulation`` are honoured; with an infinite ``_time``
+        the run only ends on ``terminate_simulation``.
 
-        while self.global_time < self.target_time:
-            # Fast path: in the common case the simulation is RUNNING and
-            # no external thread is poking at it. Skip the condition lock
-            # entirely and only acquire it when we actually need to wait
-            # for resume. CPython attribute reads are atomic at the
-            # bytecode level so a stale read is fine — the worst case is
-            # one extra loop iteration before we notice the pause.
-            if self.simulation_mode == SimulationMode.SIMULATION_PAUSE:
-                with self.condition:
-                    while self.simulation_mode == SimulationMode.SIMULATION_PAUSE:
-                        self.condition.wait()
+        Args:
+            _time (float): The simulation time
+        """
+        import asyncio
 
-            if self.simulation_mode == SimulationMode.SIMULATION_TERMINATED:
-                break
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        self._async_wakeup = (loop, wakeup)
+        self.target_time = self.global_time + _time
+        self.init_sim()
+        speed = self.rt_clock.speed
+        self._async_origin = loop.time() - self.global_time / speed
+        try:
+            while self.global_time < self.target_time:
+                if self.simulation_mode == SimulationMode.SIMULATION_PAUSE:
+                    wakeup.clear()
+                    await wakeup.wait()
+                    self._async_origin = loop.time() - self.global_time / speed
+                    continue
+                if self.simulation_mode == SimulationMode.SIMULATION_TERMINATED:
+                    break
+
+                self.create_entity()
+                next_t = min(self._peek_next_event_time(), self.target_time)
+                delay = self._async_origin + next_t / speed - loop.time()
+                if delay > 0:
+                    wakeup.clear()
+                    try:
+                        await asyncio.wait_for(
+                            wakeup.wait(), None if delay == Infinite else delay
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                if next_t >= self.target_time:
+                    self.global_time = self.target_time
+                    break
+                if next_t > self.global_time:
+                    self.global_time = next_t
+                self._run_instant(next_t, self.min_schedule_item.pop_all_at(next_t))
+                self.destroy_active_entity()
+                await asyncio.sleep(0)
+        finally:
+            self._async_wakeup = None
+
+    def _wake_async(self):
+        """Wakes a waiting :py:meth:`simulate_async` (thread-safe)."""
+        waker = self._async_wakeup
+        if waker is not None:
+            loop, event = waker
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # the loop has been closed
+                pass
+
+    def fork_run(self, fn, n, workers=None):
+        """Run ``n`` variations of this (already built, possibly warmed
+        up) simulation in forked child processes.
+
+        Each child is an ``os.fork()`` of the current process, so the
+        constructed models are shared copy-on-write instead of being
+        rebuilt per run. Child ``i`` calls ``fn(self, i)``, which applies
+        its parameter override, runs :py:meth:`simulate` and returns a
+        small picklable result; the results are sent back over a pipe.
+        This executor is left untouched.
 
-            if (unbounded
-                    and v_time
-                    and not self.waiting_obj_map
-                    and self.min_schedule_item
-                    and self.min_schedule_item.peek_time(default=Infinite) == Infinite):
-                self.simulation_mode = SimulationMode.SIMULATION_TERMINATED
-                break
+        Args:
+            fn (callable): ``fn(ss, index) -> result``, run in the child.
+            n (int): Number of children.
+            workers (int, optional): Maximum number of children alive at
+                once. Defaults to ``os.cpu_count()``.
 
-            self.schedule()
+        Returns:
+            list: The ``n`` results, in index order.
+
+        Raises:
+            RuntimeError: ``os.fork`` is unavailable, or a child failed
+                (the message carries the child's traceback).
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("fork_run requires os.fork()")
+        import gc
+        import pickle
+
+        workers = max(1, workers or os.cpu_count() or 1)
+
+        results = [None] * n
+        running = deque()       # (index, pid, read_fd)
+        failure = None
+        # Keep the collector from touching (and so copying) the pages
+        # of every object built so far in each child.
+        gc.freeze()
+        try:
+            for index in range(n + 1):
+                while running and (len(running) >= workers or index == n):
+                    done, pid, read_fd = running.popleft()
+                    with os.fdopen(read_fd, "rb") as pipe:
+                        payload = pipe.read()
+                    os.waitpid(pid, 0)
+                    try:
+                        ok, value = pickle.loads(payload)
+                    except Exception:
+                        ok, value = False, f"child {done} exited without a result\n"
+                    if ok:
+                        results[done] = value
+                    elif failure is None:
+                        failure = f"fork_run child {done} failed\n{value}"
+                if index == n or failure is not None:
+                    continue
+                read_fd, write_fd = os.pipe()
+                pid = os.fork()
+                if pid == 0:
+                    os.close(read_fd)
+                    self._fork_child(fn, index, write_fd)
+                os.close(write_fd)
+                running.append((index, pid, read_fd))
+        finally:
+            gc.unfreeze()
+        if failure is not None:
+            raise RuntimeError(failure)
+        return results
+
+    def _fork_child(self, fn, index, write_fd):
+        """Child side of :py:meth:`fork_run`; never returns."""
+        import pickle
+        import traceback
+
+        status = 0
+        try:
+            try:
+                payload = pickle.dumps((True, fn(self, index)))
+            except BaseException:
+                status = 1
+                payload = pickle.dumps((False, traceback.format_exc()))
+            with os.fdopen(write_fd, "wb") as pipe:
+                pipe.write(payload)
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(status)
 
     def get_next_event_time(self):
         """
@@ -728,6 +1651,8 @@ class SysExecutor(CoreModel):
         with self.condition:
             if self.input_event_queue:
                 next_external = self.input_event_queue[0][0]
+        if self._external_sources:
+            next_external = min(next_external, self._next_source_time())
 
         return min(next_internal, next_external)
 
@@ -764,10 +1689,13 @@ class SysExecutor(CoreModel):
         # events at <= next_t into the same round so a model that is both
         # imminent and externally influenced gets `con_trans` (TSO
         # delivery).
-        while self.min_schedule_item or self.input_event_queue:
+        while (self.min_schedule_item or self.input_event_queue
+               or self._external_sources):
             next_internal = self.min_schedule_item.peek_time(default=Infinite)
             next_external = (self.input_event_queue[0][0]
                              if self.input_event_queue else Infinite)
+            if self._external_sources:
+                next_external = min(next_external, self._next_source_time())
             next_t = min(next_internal, next_external)
             if next_t > granted_time:
                 break
@@ -795,12 +1723,14 @@ class SysExecutor(CoreModel):
         """Pauses the simulation. External threads can still insert events while paused."""
         with self.condition:
             self.simulation_mode = SimulationMode.SIMULATION_PAUSE
+            self.condition.notify_all()
 
     def resume_sim(self):
         """Resumes the simulation from a paused state."""
         with self.condition:
             self.simulation_mode = SimulationMode.SIMULATION_RUNNING
             self.condition.notify_all()
+        self._wake_async()
 
     def simulation_stop(self):
         """Stops the simulation and resets SysExecutor."""
@@ -812,9 +1742,19 @@ class SysExecutor(CoreModel):
         self._waiting_keys = []
         self.active_obj_map = {}
         self.port_map = {}
+        self._route_index = {}
+        self._frozen = False
+        self._flat_couplings = {}
+        self._flat_eoc = {}
 
-        self.min_schedule_item = ScheduleQueue()
-        self._destructs_pending = 0
+        self.min_schedule_item = make_schedule_queue(
+            "heapset" if self._fel == "auto" else self._fel
+        )
+        self._fel_countdown = self.FEL_AUTO_INTERVAL if self._fel == "auto" else 0
+        self._destruct_calendar = []
+        self._coupling_refs = {}
+        self._relation_cache = None
+        self._pending_edits = []
 
         self.sim_init_time = datetime.datetime.now()
 
@@ -836,11 +1776,155 @@ class SysExecutor(CoreModel):
         if _port in self.external_input_ports:
             with self.condition:
                 heapq.heappush(
-                    self.input_event_queue, (scheduled_time + self.global_time, sys_msg)
+                    self.input_event_queue, (scheduled_time + self._external_base_time(), sys_msg)
                 )
+                self.condition.notify_all()
+            self._wake_async()
         else:
             print("[INSERT_EXTERNAL_EVNT] Port Not Found")
 
+    def _external_base_time(self):
+        """Time external events are scheduled from: ``global_time``, or
+        the wall-clock position of a running R_TIME or
+        :py:meth:`simulate_async` run, which may be waiting ahead of
+        ``global_time`` for its next instant."""
+        if self.simulation_mode != SimulationMode.SIMULATION_RUNNING:
+            return self.global_time
+        waker = self._async_wakeup
+        if waker is not None:
+            elapsed = (waker[0].time() - self._async_origin) * self.rt_clock.speed
+            return max(self.global_time, elapsed)
+        if self._rt_active:
+            return max(self.global_time, self.rt_clock.now())
+        return self.global_time
+
+    async def insert_external_event_async(self, _port, _msg, scheduled_time=0):
+        """
+        Inserts an external event into a :py:meth:`simulate_async` run.
+
+        Coroutine form of :py:meth:`insert_external_event`. During the run
+        ``scheduled_time`` counts from the current wall-clock position of
+        the run rather than from the last processed event, so
+        ``scheduled_time=0`` means "now".
+
+        Args:
+            _port (str): port name
+            _msg (SysMessage or None): Event message
+            scheduled_time (float, optional): Delay before the event
+        """
+        self.insert_external_event(_port, _msg, scheduled_time)
+
+    def insert_external_events(self, _port, times, payloads=None):
+        """
+        Inserts a batch of external events on one port.
+
+        The port is checked once, the whole batch is merged into the
+        input queue under a single lock acquisition and each event is
+        a :py:meth:`SysMessage.single` message. A batch sorted by time
+        (the usual case for a recorded trace) is appended as one run;
+        an unsorted one is sorted first.
+
+        Args:
+            _port (str): port name
+            times (iterable): Scheduled times, relative to the current
+                global time like ``insert_external_event``; a NumPy
+                array is accepted as is.
+            payloads (iterable, optional): One payload per time.
+                Defaults to ``None`` for every event.
+
+        Raises:
+            ValueError: If ``times`` and ``payloads`` differ in length
+        """
+        if _port not in self.external_input_ports:
+            print("[INSERT_EXTERNAL_EVNT] Port Not Found")
+            return
+
+        if hasattr(times, "tolist"):
+            times = times.tolist()
+        if payloads is None:
+            payloads = itertools.repeat(None)
+            pairs = zip(times, payloads)
+        else:
+            pairs = zip(times, payloads, strict=True)
+        now = self._external_base_time()
+        src = self.EXTERNAL_SRC
+        single = SysMessage.single
+        run = [(now + t, single(src, _port, value)) for t, value in pairs]
+        if not run:
+            return
+        if any(run[i][0] > run[i + 1][0] for i in range(len(run) - 1)):
+            run.sort(key=lambda event: event[0])
+
+        with self.condition:
+            queue = self.input_event_queue
+            # A sorted list is a valid heap, so a run into an empty queue
+            # needs no heap maintenance at all.
+            empty = not queue
+            queue.extend(run)
+            if not empty:
+                heapq.heapify(queue)
+            self.condition.notify_all()
+        self._wake_async()
+
+    def add_external_source(self, source):
+        """
+        Attaches a pull-based :class:`ExternalSource`.
+
+        The executor reads the source lazily: only its next event time is
+        consulted when the next instant is chosen, and events are taken
+        from it when their instant is processed, so the stream never sits
+        in ``input_event_queue``. Source times are absolute. Events on a
+        port without a coupling are dropped.
+
+        Args:
+            source (ExternalSource): The event stream
+        """
+        with self.condition:
+            self._external_sources.append(source)
+            self.condition.notify_all()
+        self._wake_async()
+
+    def _next_source_time(self):
+        """Earliest next event time over the attached sources; drops
+        exhausted ones."""
+        next_t = Infinite
+        exhausted = False
+        for source in self._external_sources:
+            t = source.peek_time()
+            if t == Infinite:
+                exhausted = True
+            elif t < next_t:
+                next_t = t
+        if exhausted:
+            self._external_sources = [
+                source for source in self._external_sources
+                if source.peek_time() != Infinite
+            ]
+        return next_t
+
+    def _drain_sources(self, instant, influenced_inputs, routed=None):
+        """Move the source events due at ``<= instant`` into the
+        per-receiver bags of the current tick, noting the routes taken
+        in ``routed`` when it is a list."""
+        active_obj_map = self.active_obj_map
+        free_bags = self._free_bags
+        src = self.EXTERNAL_SRC
+        for source in self._external_sources:
+            while source.peek_time() <= instant:
+                _, port, payload = source.pop()
+                msg = SysMessage.single(src, port, payload)
+                destinations = self._destinations_for(self, port)
+                if routed is not None:
+                    routed.append(destinations)
+                for dst_exec, dst_port in destinations:
+                    if dst_exec is not self and dst_exec._obj_id in active_obj_map:
+                        bag = influenced_inputs.get(dst_exec)
+                        if bag is None:
+                            bag = influenced_inputs[dst_exec] = (
+                                free_bags.pop() if free_bags else []
+                            )
+                        bag.append((dst_port, msg))
+
     def insert_custom_external_event(self, _port, _bodylist, scheduled_time=0):
         """
         Inserts a custom external event into the simulation.
@@ -856,8 +1940,10 @@ class SysExecutor(CoreModel):
         if _port in self.external_input_ports:
             with self.condition:
                 heapq.heappush(
-                    self.input_event_queue, (scheduled_time + self.global_time, sys_msg)
+                    self.input_event_queue, (scheduled_time + self._external_base_time(), sys_msg)
                 )
+                self.condition.notify_all()
+            self._wake_async()
         else:
             print("[INSERT_EXTERNAL_EVNT] Port Not Found")
 
@@ -871,6 +1957,97 @@ class SysExecutor(CoreModel):
         """
         self._output_event_callback = callback
 
+    def open_output_channel(self, capacity=None, policy="drop_oldest", ports=None):
+        """
+        Subscribes a new :class:`OutputChannel` to the external outputs.
+
+        From the next emit on, every message routed to one of this
+        executor's output ports (or only to ``ports``) is pushed to the
+        channel as ``(time, port, msg)``, next to ``output_event_queue``.
+
+        Args:
+            capacity (int, optional): Maximum buffered events; None is
+                unbounded
+            policy (str, optional): What a full channel does —
+                ``"drop_oldest"``, ``"drop_newest"`` or ``"block"``
+            ports (iterable, optional): Output ports to receive
+
+        Returns:
+            OutputChannel: The subscribed channel
+        """
+        channel = OutputChannel(capacity, policy, ports)
+        self._output_channels.append(channel)
+        self._rebuild_channel_routes()
+        return channel
+
+    def close_output_channel(self, channel):
+        """
+        Unsubscribes and closes a channel from :py:meth:`open_output_channel`.
+
+        Args:
+            channel (OutputChannel): The channel to close
+        """
+        if channel in self._output_channels:
+            self._output_channels.remove(channel)
+            self._rebuild_channel_routes()
+        channel.close()
+
+    def _rebuild_channel_routes(self):
+        self._channel_any = tuple(c for c in self._output_channels if c.ports is None)
+        routes = {}
+        for channel in self._output_channels:
+            for port in channel.ports or ():
+                routes.setdefault(port, list(self._channel_any)).append(channel)
+        self._channel_routes = {port: tuple(chs) for port, chs in routes.items()}
+
+    def _publish(self, instant, port, msg):
+        for channel in self._channel_routes.get(port, self._channel_any):
+            channel.push(instant, port, msg)
+
+    def set_trace_recorder(self, recorder):
+        """
+        Attaches a :class:`TraceRecorder` that gets every delivery and
+        transition from the next tick on; None detaches it. Closing the
+        recorder is up to the caller.
+
+        Args:
+            recorder (TraceRecorder or None): The recorder
+        """
+        previous = self._trace_recorder
+        if previous is not None and previous is not recorder:
+            previous.flush()
+        self._trace_recorder = recorder
+
+    def get_profile(self):
+        """
+        Returns the counters of a ``profile=True`` executor.
+
+        Returns:
+            dict: See :py:meth:`Profiler.report`
+
+        Raises:
+            ValueError: Profiling is not enabled.
+        """
+        if self._profiler is None:
+            raise ValueError("Profiling is not enabled; build the SysExecutor with profile=True.")
+        return self._profiler.report()
+
+    def dump_profile(self, path, fmt=None):
+        """
+        Writes :py:meth:`get_profile` as JSON or CSV.
+
+        Args:
+            path (str): Output file
+            fmt (str, optional): ``"json"`` or ``"csv"``; taken from the
+                file extension when omitted
+
+        Raises:
+            ValueError: Profiling is not enabled.
+        """
+        if self._profiler is None:
+            raise ValueError("Profiling is not enabled; build the SysExecutor with profile=True.")
+        self._profiler.dump(path, fmt)
+
     def get_generated_event(self):
         """
         Returns a snapshot of the generated events queue.
@@ -926,14 +2103,15 @@ class SysExecutor(CoreModel):
     def handle_external_output_event(self):
         """
         Handles external output events and clears the output event queue.
-        Thread-safe: deepcopy and clear are performed atomically.
+        Thread-safe: the queue is swapped for an empty one under the
+        lock, so the events are handed over without copying them.
 
         Returns:
             deque: List of output events
         """
         with self.condition:
-            event_lists = copy.deepcopy(self.output_event_queue)
-            self.output_event_queue.clear()
+            event_lists = self.output_event_queue
+            self.output_event_queue = deque(maxlen=event_lists.maxlen)
         return event_lists
 
     def is_terminated(self):
@@ -969,3 +2147,7 @@ class SysExecutor(CoreModel):
         with self.condition:
             self.simulation_mode = SimulationMode.SIMULATION_TERMINATED
             self.condition.notify_all()
+        for channel in self._output_channels:
+            channel.close()
+        self._wake_async()
+        self._shutdown_pool()
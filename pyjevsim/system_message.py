@@ -10,6 +10,28 @@ This module contains an object SysMessage for handling messages (port and data)
 
 from .system_object import SystemObject
 
+
+class _Sentinel:
+    """Module-level marker that survives pickling as itself."""
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name):
+        self._name = name
+
+    def __reduce__(self):
+        return self._name
+
+    def __repr__(self):
+        return self._name
+
+
+# Marks an empty single-payload slot (``None`` is a valid payload) and,
+# in ``_src``, a message that sits in the free list.
+_EMPTY = _Sentinel("_EMPTY")
+_FREE = _Sentinel("_FREE")
+
+
 class SysMessage(SystemObject):
     """SysMessage for handling messages(port and data) between Models.
 
@@ -20,8 +42,24 @@ class SysMessage(SystemObject):
         is consistent with the Python-DEVS ecosystem (xdevs.py and
         PythonPDEVS use the same shared-reference model). To mutate a
         payload, copy it on the receiver side first.
+
+    Messages are slotted. The payload list is only created when it is
+    needed: a message built with :py:meth:`single` holds its one value
+    in a dedicated slot, skips the global object-id increment (the id is
+    assigned on first :py:meth:`get_obj_id`) and may come from a free
+    list of recycled messages (see :py:meth:`recycle`). ``retrieve()``
+    still returns a list, materialised on first call; receivers that
+    only need the one value can call :py:meth:`value` instead.
     """
 
+    __slots__ = ("_SystemObject__object_id", "_src", "_dst", "_msg_time",
+                 "_msg_list", "_single")
+
+    # Free list shared by every executor running with
+    # ``message_pool=True``; ``single`` pops from it, ``recycle`` pushes.
+    _free = []
+    POOL_LIMIT = 4096
+
     def __init__(self, src_name="", dst_name=""):
         """
         Args:
@@ -32,7 +70,80 @@ class SysMessage(SystemObject):
         self._src = src_name  # Source name(Model)
         self._dst = dst_name  # Destination name(port)
         self._msg_time = -1  # Message time
-        self._msg_list = []  # List of messages
+        self._msg_list = None  # List of messages, created on demand
+        self._single = _EMPTY  # Payload of a `single` message
+
+    @classmethod
+    def single(cls, src_name, dst_name, value):
+        """
+        Creates a message carrying exactly one value.
+
+        The fast path for the common one-value emit: no payload list is
+        allocated and, for plain ``SysMessage``, a recycled message is
+        reused when the free list has one.
+
+        Args:
+            src_name (str): The source name(Model name)
+            dst_name (str): The destination name(port)
+            value (any): The payload
+
+        Returns:
+            SysMessage: The message
+        """
+        msg = None
+        free = SysMessage._free
+        if free and cls is SysMessage:
+            try:
+                msg = free.pop()
+            except IndexError:  # emptied by another thread meanwhile
+                pass
+        if msg is None:
+            msg = cls.__new__(cls)
+            msg._msg_time = -1
+            msg._msg_list = None
+        msg._src = src_name
+        msg._dst = dst_name
+        msg._single = value
+        return msg
+
+    def recycle(self):
+        """
+        Returns the message to the free list used by :py:meth:`single`.
+
+        Called by a :class:`SysExecutor` built with ``message_pool=True``
+        once the tick that delivered the message has finished its
+        transitions. The payload list handed out by ``retrieve()`` is
+        detached, not cleared, so copies of it stay valid; the message
+        object itself must no longer be referenced. Recycling a message
+        twice is a no-op.
+        """
+        if self._src is _FREE or type(self) is not SysMessage:
+            return
+        free = SysMessage._free
+        if len(free) < self.POOL_LIMIT:
+            self._src = _FREE
+            self._dst = None
+            self._msg_time = -1
+            self._msg_list = None
+            self._single = _EMPTY
+            free.append(self)
+
+    def get_obj_id(self):
+        """
+        Returns the unique object ID, assigning one on first use for
+        messages built with :py:meth:`single`.
+
+        Returns:
+            int: The unique object ID
+        """
+        try:
+            return self._SystemObject__object_id
+        except AttributeError:
+            SystemObject.__init__(self)
+            return self._SystemObject__object_id
+
+    def __lt__(self, other):
+        return self.get_obj_id() < other.get_obj_id()
 
     def __str__(self):
         """
@@ -41,7 +152,7 @@ class SysMessage(SystemObject):
         Returns:
             str: The string representation
         """
-        return super().__str__() + f"\tSRC:{self._src}\t DST:{self._dst}"
+        return f"ID:{self.get_obj_id()}\tSRC:{self._src}\t DST:{self._dst}"
 
     def insert(self, msg):
         """
@@ -50,7 +161,7 @@ class SysMessage(SystemObject):
         Args:
             msg (any): The message to insert
         """
-        self._msg_list.append(msg)
+        self.retrieve().append(msg)
 
     def extend(self, _list):
         """
@@ -59,7 +170,7 @@ class SysMessage(SystemObject):
         Args:
             _list (list): The list of messages to add
         """
-        self._msg_list.extend(_list)
+        self.retrieve().extend(_list)
 
     def retrieve(self):
         """
@@ -68,7 +179,31 @@ class SysMessage(SystemObject):
         Returns:
             list: The list of messages
         """
-        return self._msg_list
+        msg_list = self._msg_list
+        if msg_list is None:
+            if self._single is _EMPTY:
+                msg_list = self._msg_list = []
+            else:
+                msg_list = self._msg_list = [self._single]
+                self._single = _EMPTY
+        return msg_list
+
+    def value(self):
+        """
+        Returns the first (for :py:meth:`single`, the only) value
+        without materialising the payload list.
+
+        Returns:
+            any: The first value
+
+        Raises:
+            IndexError: If the message is empty
+        """
+        if self._single is not _EMPTY:
+            return self._single
+        if not self._msg_list:
+            raise IndexError("empty SysMessage")
+        return self._msg_list[0]
 
     def get_src(self):
         """
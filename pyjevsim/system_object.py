@@ -17,8 +17,14 @@ class SystemObject:
     and never used elsewhere, but the ``datetime.now()`` call was
     measurable in hot allocation paths (every ``SysMessage`` paid for
     it). It has been removed.
+
+    ``__slots__`` is empty so that slotted subclasses (``SysMessage``)
+    can drop the per-instance ``__dict__``; subclasses that do not
+    declare ``__slots__`` keep theirs.
     """
 
+    __slots__ = ()
+
     # Object ID which tracks the entire instantiated Objects
     __GLOBAL_OBJECT_ID = 0
 
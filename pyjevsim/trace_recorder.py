@@ -0,0 +1,441 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains TraceRecorder, which writes a SysExecutor's deliveries and transitions as fixed-width binary records to a memory-mapped file, read_trace, which loads such a trace as NumPy structured arrays, and replay_model, which drives a single model from its recorded inputs.
+"""
+
+import json
+import mmap
+import os
+import pickle
+import struct
+
+from .definition import ExecutionType, Infinite
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency: pip install pyjevsim[array]
+    np = None
+
+# Record kinds. A DELIVER record is one message placed in a model's bag;
+# the model's INT / EXT / CON record for the same instant follows it.
+DELIVER = 0
+INT = 1
+EXT = 2
+CON = 3
+KIND_NAMES = ("deliver", "int", "ext", "con")
+
+# time, kind, model, port, src, src_port, payload
+RECORD = struct.Struct("<diiiiiq")
+_TIME = struct.Struct("<d")
+_TAIL = struct.Struct("<iiiiiq")
+RECORD_FIELDS = ("time", "kind", "model", "port", "src", "src_port", "payload")
+RECORD_FORMATS = ("<f8", "<i4", "<i4", "<i4", "<i4", "<i4", "<i8")
+
+# Separates the imminent models, the receivers and the routes in a tick key.
+_SEP = object()
+
+
+class TraceRecorder:
+    """Binary event trace of a :class:`SysExecutor` run.
+
+    Attach it with :py:meth:`SysExecutor.set_trace_recorder`. After the
+    transitions of every tick the executor hands over its imminent
+    models and the input bags, and the recorder appends one
+    :data:`RECORD` per delivered message and per transition:
+
+    ========= ======================================================
+    field     meaning
+    ========= ======================================================
+    time      simulated time of the tick
+    kind      ``DELIVER``, ``INT``, ``EXT`` or ``CON``
+    model     receiving / transitioning model (interned name)
+    port      input port of a delivery, -1 otherwise
+    src       sending model of a delivery, -1 otherwise
+    src_port  output port it was sent from, -1 otherwise
+    payload   index into the payload file, -1 if not captured
+    ========= ======================================================
+
+    Names are interned to ints. Packed records collect in memory and
+    are copied ``buffer_records`` at a time into the preallocated,
+    memory-mapped file at ``path``, which grows by doubling. Payloads
+    (``msg.retrieve()``) are only pickled for the models in
+    ``payloads`` (or all of them with ``payloads=True``) into
+    ``path + ".payloads"``; :py:meth:`close` truncates the record file
+    and writes the name tables to ``path + ".json"``.
+
+    Most ticks repeat an earlier tick's pattern: the same imminent
+    models, receivers and routes. The executor hands over the compiled
+    route tuple of every message it routed (topology edits compile new
+    ones), so a tick's pattern is the imminent models, the receivers and
+    the ids of those routes, built without a step per delivery, and its
+    packed record tails are cached. The pattern that followed the
+    previous tick's pattern last time is compared first; otherwise the
+    pattern is looked up in a dict. At most ``tick_cache`` patterns
+    are kept and the cache starts over when it is full. Ticks of
+    ``payloads`` models and calls without routes take the uncached
+    path, one Python-level step per delivery. A delivery's ``src`` is
+    the sender name carried by the first message seen on its route.
+    ``benchmark/run_trace.py`` measures the overhead on DEVStone. On
+    one core, keeping only transitions (``deliveries=False``) adds 5-7%
+    to the run, and full recording adds 4-7% once every transition does
+    50 dhrystones of work. Full recording of DEVStone with no work, where
+    the recorder is compared against a near-empty tick, still adds
+    11-17%. The under-10% target does not cover that case.
+    """
+
+    def __init__(self, path, payloads=False, deliveries=True,
+                 buffer_records=4096, capacity=1 << 16, tick_cache=4096):
+        """
+        Args:
+            path (str): Record file
+            payloads (bool or iterable): Models whose inputs keep their
+                payload (needed by :py:func:`replay_model`)
+            deliveries (bool): Record DELIVER records; when False only
+                the transitions (and the inputs of ``payloads`` models)
+                are kept
+            buffer_records (int): Records buffered per flush
+            capacity (int): Records the file is preallocated for
+            tick_cache (int): Tick patterns whose records are cached
+        """
+        self.path = os.fspath(path)
+        self.count = 0
+        self._chunks = []
+        self._pending = 0
+        self._buffer_records = buffer_records
+        self.deliveries = bool(deliveries)
+        self._names = {}
+        self._ports = {}
+        self._exec_ids = {}
+        self._deliver_tails = {}
+        # tick pattern -> [pattern, tails, entry of the next tick, routes]
+        self._tick_blocks = {}
+        self._tick_cache = max(1, tick_cache)
+        self._last_tick = None
+        self._int_tails = self._transition_tail(INT)
+        self._ext_tails = self._transition_tail(EXT)
+        self._con_tails = self._transition_tail(CON)
+        if payloads is True or payloads is False:
+            self._capture_all = payloads
+            self._capture = frozenset()
+        else:
+            self._capture_all = False
+            self._capture = frozenset(payloads)
+        self._capturing = bool(self._capture_all or self._capture)
+        self._capture_ids = set()
+        self._payload_file = None
+        self._payload_count = 0
+
+        self._file = open(self.path, "w+b")
+        self._capacity = max(1, capacity)
+        self._file.truncate(self._capacity * RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), self._capacity * RECORD.size)
+
+    def _name_id(self, name):
+        names = self._names
+        nid = names.get(name)
+        if nid is None:
+            nid = names[name] = len(names)
+            if self._capture_all or name in self._capture:
+                self._capture_ids.add(nid)
+        return nid
+
+    def _port_id(self, port):
+        ports = self._ports
+        pid = ports.get(port)
+        if pid is None:
+            pid = ports[port] = len(ports)
+        return pid
+
+    def _payload(self, msg):
+        if self._payload_file is None:
+            self._payload_file = open(self.path + ".payloads", "wb")
+        pickle.dump(msg.retrieve(), self._payload_file, pickle.HIGHEST_PROTOCOL)
+        index = self._payload_count
+        self._payload_count += 1
+        return index
+
+    def _transition_tail(self, kind):
+        """Cache of ``executor -> packed record minus its time`` for one
+        transition kind."""
+        recorder = self
+
+        class _Tails(dict):
+            def __missing__(self, executor):
+                mid = recorder._exec_id(executor)
+                tail = self[executor] = _TAIL.pack(kind, mid, -1, -1, -1, -1)
+                return tail
+
+        return _Tails()
+
+    def _exec_id(self, executor):
+        mid = self._exec_ids.get(executor)
+        if mid is None:
+            mid = self._exec_ids[executor] = self._name_id(executor.get_name())
+        return mid
+
+    def _deliver_tail(self, key):
+        executor, port, src, src_port = key
+        tail = self._deliver_tails[key] = _TAIL.pack(
+            DELIVER, self._exec_id(executor), self._port_id(port),
+            self._name_id(src), self._port_id(src_port), -1,
+        )
+        return tail
+
+    def record(self, instant, imminent_set, inputs, routes=None):
+        """
+        Records one tick; called by the executor after Phase C.
+
+        Within a tick the deliveries come first, then the INT, EXT and
+        CON transitions. Every record is its time prefix plus a cached
+        tail; the tails of a tick are looked up by its pattern.
+
+        Args:
+            instant (float): Simulated time of the tick
+            imminent_set (set): The imminent executors
+            inputs (dict): ``executor -> [(port, msg), ...]`` bags of the
+                influenced executors
+            routes (list, optional): The route tuple of every message
+                routed into ``inputs``, in routing order
+        """
+        if self._capturing or (routes is None and inputs and self.deliveries):
+            tails = self._tick_tails(imminent_set, inputs)
+        else:
+            if self.deliveries and routes:
+                pattern = (*imminent_set, _SEP, *inputs, _SEP, *map(id, routes))
+            else:
+                routes = ()
+                pattern = (*imminent_set, _SEP, *inputs)
+            last = self._last_tick
+            entry = None if last is None else last[2]
+            if entry is None or entry[0] != pattern:
+                entry = self._tick_entry(pattern, imminent_set, inputs, routes)
+                if last is not None and self._last_tick is last:
+                    last[2] = entry
+            self._last_tick = entry
+            tails = entry[1]
+        if not tails:
+            return
+        prefix = _TIME.pack(instant)
+        chunks = self._chunks
+        chunks.append(prefix)
+        chunks.append(prefix.join(tails))
+        self._pending += len(tails)
+        if self._pending >= self._buffer_records:
+            self.flush()
+
+    def _tick_entry(self, pattern, imminent_set, inputs, routes):
+        """Cache entry of a tick pattern, packing its tails on a miss.
+        The entry keeps the routes alive, so their ids in the pattern
+        cannot be reused by other objects."""
+        blocks = self._tick_blocks
+        entry = blocks.get(pattern)
+        if entry is None:
+            if len(blocks) >= self._tick_cache:
+                blocks.clear()
+                self._last_tick = None
+            entry = blocks[pattern] = [
+                pattern, tuple(self._tick_tails(imminent_set, inputs)), None, tuple(routes),
+            ]
+        return entry
+
+    def _tick_tails(self, imminent_set, inputs):
+        """Record tails of one tick, one Python-level step per delivery."""
+        tails = []
+        if inputs:
+            deliveries = self.deliveries
+            capturing = self._capturing
+            if deliveries or capturing:
+                append = tails.append
+                cached = self._deliver_tails.get
+                for M, bag in inputs.items():
+                    if capturing and self._exec_id(M) in self._capture_ids:
+                        mid = self._exec_id(M)
+                        for port, msg in bag:
+                            append(_TAIL.pack(
+                                DELIVER, mid, self._port_id(port), self._name_id(msg._src),
+                                self._port_id(msg._dst), self._payload(msg),
+                            ))
+                    elif deliveries:
+                        for port, msg in bag:
+                            key = (M, port, msg._src, msg._dst)
+                            tail = cached(key)
+                            if tail is None:
+                                tail = self._deliver_tail(key)
+                            append(tail)
+            keys = inputs.keys()
+            tails.extend(map(self._int_tails.__getitem__, imminent_set.difference(keys)))
+            tails.extend(map(self._ext_tails.__getitem__, keys - imminent_set))
+            tails.extend(map(self._con_tails.__getitem__, imminent_set.intersection(keys)))
+        else:
+            tails.extend(map(self._int_tails.__getitem__, imminent_set))
+        return tails
+
+    def flush(self):
+        """Copies the buffered records into the mapped file."""
+        if not self._pending:
+            return
+        size = RECORD.size
+        needed = (self.count + self._pending) * size
+        if needed > self._capacity * size:
+            while self._capacity * size < needed:
+                self._capacity *= 2
+            self._map.close()
+            self._file.truncate(self._capacity * size)
+            self._map = mmap.mmap(self._file.fileno(), self._capacity * size)
+        mapped = self._map
+        offset = self.count * size
+        for chunk in self._chunks:
+            end = offset + len(chunk)
+            mapped[offset:end] = chunk
+            offset = end
+        self.count += self._pending
+        self._pending = 0
+        self._chunks.clear()
+
+    def close(self):
+        """Flushes, trims the record file and writes the name tables."""
+        if self._file is None:
+            return
+        self.flush()
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(self.count * RECORD.size)
+        self._file.close()
+        self._file = None
+        if self._payload_file is not None:
+            self._payload_file.close()
+        with open(self.path + ".json", "w") as f:
+            json.dump({
+                "records": self.count,
+                "fields": list(RECORD_FIELDS),
+                "formats": list(RECORD_FORMATS),
+                "kinds": list(KIND_NAMES),
+                "models": sorted(self._names, key=self._names.get),
+                "ports": sorted(self._ports, key=self._ports.get),
+                "payloads": self._payload_count,
+            }, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class Trace:
+    """A trace loaded by :py:func:`read_trace`.
+
+    ``records`` is a NumPy structured array with the :class:`TraceRecorder`
+    fields; ``models`` and ``ports`` map the interned ids back to names.
+    """
+
+    def __init__(self, records, models, ports, payloads):
+        self.records = records
+        self.models = models
+        self.ports = ports
+        self._payloads = payloads
+
+    def model_id(self, name):
+        return self.models.index(name)
+
+    def for_model(self, name):
+        """
+        Returns:
+            numpy.ndarray: The records of one model, in recorded order
+        """
+        return self.records[self.records["model"] == self.model_id(name)]
+
+    def transitions(self, name):
+        """
+        Returns:
+            list: ``(time, kind name)`` of every transition of a model
+        """
+        rows = self.for_model(name)
+        rows = rows[rows["kind"] != DELIVER]
+        return [(float(t), KIND_NAMES[k]) for t, k in zip(rows["time"], rows["kind"])]
+
+    def inputs(self, name):
+        """
+        Returns:
+            list: ``(time, port, payload)`` of every message delivered to a
+            model; ``payload`` is None unless it was captured
+        """
+        rows = self.for_model(name)
+        rows = rows[rows["kind"] == DELIVER]
+        return [
+            (float(row["time"]), self.ports[row["port"]], self.payload(int(row["payload"])))
+            for row in rows
+        ]
+
+    def payload(self, index):
+        """
+        Returns:
+            list: A captured payload (``msg.retrieve()``), None for -1
+        """
+        return None if index < 0 else self._payloads[index]
+
+
+def read_trace(path):
+    """
+    Loads a trace written by :class:`TraceRecorder`.
+
+    Args:
+        path (str): The recorder's record file
+
+    Returns:
+        Trace: Records as a NumPy structured array plus the name tables
+    """
+    if np is None:
+        raise ImportError("read_trace requires numpy (pip install pyjevsim[array])")
+    path = os.fspath(path)
+    with open(path + ".json") as f:
+        meta = json.load(f)
+    dtype = np.dtype(list(zip(meta["fields"], meta["formats"])))
+    records = np.fromfile(path, dtype=dtype, count=meta["records"])
+    payloads = []
+    if meta["payloads"]:
+        with open(path + ".payloads", "rb") as f:
+            for _ in range(meta["payloads"]):
+                payloads.append(pickle.load(f))
+    return Trace(records, meta["models"], meta["ports"], payloads)
+
+
+def replay_model(trace, model, until=Infinite, name=None):
+    """
+    Drives one model alone from its recorded inputs.
+
+    The model is registered with a fresh V_TIME :class:`SysExecutor`
+    and every recorded delivery is re-inserted as an external event on
+    the same input port at the same time, with its captured payload.
+    Record the trace with ``payloads`` covering the model, or it only
+    sees empty messages.
+
+    Args:
+        trace (Trace): A trace from :py:func:`read_trace`
+        model (BehaviorModel): A fresh instance of the recorded model
+        until (float): Simulation horizon
+        name (str, optional): Recorded model name; defaults to
+            ``model.get_name()``
+
+    Returns:
+        SysExecutor: The replay executor, after the run
+    """
+    from .system_executor import SysExecutor
+
+    ss = SysExecutor(1, f"replay-{model.get_name()}", ex_mode=ExecutionType.V_TIME)
+    ss.register_entity(model)
+    coupled = set()
+    for t, port, payload in trace.inputs(name or model.get_name()):
+        if port not in coupled:
+            ss.insert_input_port(port)
+            ss.coupling_relation(None, port, model, port)
+            coupled.add(port)
+        ss.insert_custom_external_event(port, payload or [], t)
+    ss.simulate(until, _tm=False)
+    return ss
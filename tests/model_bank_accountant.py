@@ -38,8 +38,7 @@ class BankAccountant(BehaviorModel):
     def ext_trans(self, port, msg):
         if port == "in":
             self.user = msg.retrieve()[0]
-            self._cur_state = "PROC"
-            self.update_state("PROC", self.user.get_service_time())
+            self.hold_in("PROC", self.user.get_service_time())
 
     def output(self, msg_deliver):
         if self._cur_state == "PROC":
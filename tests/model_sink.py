@@ -0,0 +1,48 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains Sink, a passive model that keeps what it receives.
+"""
+
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import Infinite
+
+
+class Sink(BehaviorModel):
+    """Keeps the first value of every message received on ``in`` in
+    ``received``.
+
+    When ``ss`` is set, ``log`` also gets a ``(simulation time, value)``
+    pair per message.
+    """
+
+    def __init__(self, name, ss=None):
+        """
+        Args:
+            name (str): The name of the model
+            ss (SysExecutor, optional): Executor whose clock ``log`` reads
+        """
+        BehaviorModel.__init__(self, name)
+        self.insert_state("passive", Infinite)
+        self.init_state("passive")
+        self.insert_input_port("in")
+
+        self.received = []  # first value of every message
+        self.log = []       # (simulation time, value) pairs (with ss)
+        self.ss = ss
+
+    def ext_trans(self, port, msg):
+        value = msg.value()
+        self.received.append(value)
+        if self.ss is not None:
+            self.log.append((self.ss.get_global_time(), value))
+
+    def int_trans(self):
+        pass
+
+    def output(self, msg_deliver):
+        pass
@@ -0,0 +1,47 @@
+"""
+Author: Changbeom Choi (@cbchoi)
+Copyright (c) 2014-2020 Handong Global University
+Copyright (c) 2021-2024 Hanbat National University
+License: MIT.  The full license text is available at:
+https://github.com/eventsim/pyjevsim/blob/main/LICENSE
+
+This module contains Ticker, a model that emits a running count at a fixed period.
+"""
+
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.system_message import SysMessage
+
+
+class Ticker(BehaviorModel):
+    """Emits its tick number (1, 2, ...) on ``out`` every ``period``.
+
+    When ``ss`` is set, the simulation time of every tick is kept in
+    ``fired``.
+    """
+
+    def __init__(self, name, period=1, ss=None):
+        """
+        Args:
+            name (str): The name of the model
+            period (float, optional): Time between two ticks
+            ss (SysExecutor, optional): Executor whose clock ``fired`` reads
+        """
+        BehaviorModel.__init__(self, name)
+        self.insert_state("active", period)
+        self.init_state("active")
+        self.insert_output_port("out")
+
+        self.count = 0      # ticks so far
+        self.fired = []     # simulation time of every tick (with ss)
+        self.ss = ss
+
+    def ext_trans(self, port, msg):
+        pass
+
+    def int_trans(self):
+        self.count += 1
+        if self.ss is not None:
+            self.fired.append(self.ss.get_global_time())
+
+    def output(self, msg_deliver):
+        msg_deliver.insert_message(SysMessage.single(self.get_name(), "out", self.count + 1))
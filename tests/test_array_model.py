@@ -0,0 +1,193 @@
+"""Tests for ``ArrayBehaviorModel`` / ``ArrayExecutor``.
+
+A population of N identical atomics registers as one entity. These
+tests check that it fires the same events as N individual
+``BehaviorModel`` instances, that messages reach only the addressed
+members, and that confluent instants go through ``con_trans``.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyjevsim.array_behavior_model import ArrayBehaviorModel
+from pyjevsim.array_executor import ArrayExecutor
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.system_executor import SysExecutor
+from pyjevsim.system_message import SysMessage
+
+from .model_sink import Sink
+
+
+class _Timers(ArrayBehaviorModel):
+    """Member i emits its index every ``i + 1`` time units."""
+
+    def __init__(self, name, size):
+        super().__init__(name, size)
+        self.insert_state("run")
+        self.insert_output_port("out")
+        self.hold_in(slice(None), "run", np.arange(1, size + 1, dtype=float))
+
+    def output(self, members, msg_deliver):
+        self.emit(msg_deliver, "out", members, members.tolist())
+
+    def int_trans(self, members):
+        pass
+
+    def ext_trans(self, port, members, values):
+        pass
+
+
+class _Timer(BehaviorModel):
+    def __init__(self, name, index):
+        super().__init__(name)
+        self.insert_state("run", index + 1)
+        self.init_state("run")
+        self.insert_output_port("out")
+        self._index = index
+
+    def output(self, msg_deliver):
+        m = SysMessage(self.get_name(), "out")
+        m.insert((self._index, self._index))
+        msg_deliver.insert_message(m)
+
+    def int_trans(self):
+        pass
+
+    def ext_trans(self, port, msg):
+        pass
+
+
+class _MemberSink(Sink):
+    """Keeps the member index of every ``(member, value)`` pair received."""
+
+    def ext_trans(self, port, msg):
+        for member, _ in msg.retrieve():
+            self.received.append(member)
+            self.log.append((self.ss.get_global_time(), member))
+
+
+def test_population_registers_as_one_executor():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    timers = _Timers("timers", 1000)
+    ss.register_entity(timers)
+    assert isinstance(ss.product_port_map[timers], ArrayExecutor)
+
+    ss.simulate(1, _tm=False)
+    # DefaultMessageCatcher + the population.
+    assert len(ss.active_obj_map) == 2
+
+
+def test_population_matches_individual_models():
+    size = 4
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    timers = _Timers("timers", size)
+    sink = _MemberSink("sink", ss)
+    ss.register_entity(timers)
+    ss.register_entity(sink)
+    ss.coupling_relation(timers, "out", sink, "in")
+    ss.simulate(9, _tm=False)
+
+    ref = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    ref_sink = _MemberSink("sink", ref)
+    ref.register_entity(ref_sink)
+    for i in range(size):
+        timer = _Timer(f"t{i}", i)
+        ref.register_entity(timer)
+        ref.coupling_relation(timer, "out", ref_sink, "in")
+    ref.simulate(9, _tm=False)
+
+    assert sink.log
+    assert sorted(sink.log) == sorted(ref_sink.log)
+
+
+class _Servers(ArrayBehaviorModel):
+    """Idle members become busy for 2 time units when addressed."""
+
+    def __init__(self, name, size):
+        super().__init__(name, size)
+        self.insert_state("idle")
+        self.insert_state("busy", 2)
+        self.init_state("idle")
+        self.insert_input_port("job")
+        self.insert_output_port("done")
+        self.n_con = 0
+        self.ext_calls = []
+
+    def output(self, members, msg_deliver):
+        self.emit(msg_deliver, "done", members)
+
+    def int_trans(self, members):
+        self.hold_in(members, "idle")
+
+    def ext_trans(self, port, members, values):
+        self.ext_calls.append(sorted(members.tolist()))
+        self.hold_in(members, "busy")
+
+    def con_trans(self, members, inputs):
+        self.n_con += 1
+        super().con_trans(members, inputs)
+
+
+def test_messages_reach_only_addressed_members():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    servers = _Servers("servers", 5)
+    sink = _MemberSink("sink", ss)
+    ss.register_entity(servers)
+    ss.register_entity(sink)
+    ss.insert_input_port("job")
+    ss.coupling_relation(None, "job", servers, "job")
+    ss.coupling_relation(servers, "done", sink, "in")
+
+    ss.insert_external_event("job", (3, "payload"), scheduled_time=1)
+    ss.simulate(2, _tm=False)
+
+    busy = servers.in_state("busy")
+    assert busy.tolist() == [False, False, False, True, False]
+
+    ss.simulate(3, _tm=False)
+    assert sink.received == [3]
+    assert not servers.in_state("busy").any()
+
+
+def test_confluent_instant_uses_con_trans():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    servers = _Servers("servers", 3)
+    ss.register_entity(servers)
+    ss.insert_input_port("job")
+    ss.coupling_relation(None, "job", servers, "job")
+
+    ss.insert_external_event("job", (0, None), scheduled_time=1)
+    # Member 0 finishes at t=3 while member 1 receives a job at t=3.
+    ss.insert_external_event("job", (1, None), scheduled_time=3)
+    ss.simulate(4, _tm=False)
+
+    assert servers.n_con == 1
+    assert servers.in_state("busy").tolist() == [False, True, False]
+
+
+def test_bag_runs_in_transitions_one_call_per_port():
+    """Every message of an instant reaches ``ext_trans`` in one call per
+    port, run by the executor's transition; ``set_req_time`` only
+    reschedules."""
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    servers = _Servers("servers", 4)
+    ss.register_entity(servers)
+    ss.insert_input_port("job")
+    ss.coupling_relation(None, "job", servers, "job")
+    ss.insert_external_event("job", (0, None), scheduled_time=1)
+    ss.insert_external_event("job", (2, None), scheduled_time=1)
+    ss.simulate(2, _tm=False)
+    assert servers.ext_calls == [[0, 2]]
+
+    executor = ss.product_port_map[servers]
+    msg = SysMessage("src", "job")
+    msg.insert((3, None))
+    executor.ext_trans_bag([("job", msg)])
+    assert servers.in_state("busy").tolist() == [True, False, True, True]
+    assert servers.next_t[3] == Infinite
+
+    executor.set_req_time(2)
+    assert servers.next_t.tolist() == [3, Infinite, 3, 4]
+    assert executor.get_req_time() == 3
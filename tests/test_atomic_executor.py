@@ -0,0 +1,102 @@
+"""Tests for ``AtomicExecutor``, the classic-DEVS executor picked for
+every ``AtomicModel``.
+"""
+
+from pyjevsim.atomic_executor import AtomicExecutor
+from pyjevsim.atomic_model import AtomicModel
+from pyjevsim.behavior_executor import BehaviorExecutor
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.system_executor import SysExecutor
+from pyjevsim.system_message import SysMessage
+
+
+class _Clock(AtomicModel):
+    """Ticks every ``period`` once started; sigma persists between ticks."""
+
+    def __init__(self, name, period, ss):
+        super().__init__(name)
+        self.insert_input_port("start")
+        self.insert_output_port("tick")
+        self.period = period
+        self.ss = ss
+        self.ticks = []
+        self.passivate()
+
+    def ext_trans(self, port, msg):
+        self.hold_in("run", self.period)
+
+    def int_trans(self):
+        pass
+
+    def output(self, msg_deliver):
+        self.ticks.append(self.ss.get_global_time())
+        msg_deliver.insert_message(SysMessage.single(self.get_name(), "tick", None))
+
+
+class _Countdown(AtomicModel):
+    """Overrides ``time_advance`` instead of using sigma."""
+
+    def __init__(self, name, ss):
+        super().__init__(name)
+        self.left = 3
+        self.ss = ss
+        self.fired = []
+
+    def ext_trans(self, port, msg):
+        pass
+
+    def int_trans(self):
+        self.left -= 1
+
+    def output(self, msg_deliver):
+        self.fired.append(self.ss.get_global_time())
+
+    def time_advance(self):
+        return self.left if self.left > 0 else Infinite
+
+
+class _Plain(BehaviorModel):
+    def __init__(self, name):
+        super().__init__(name)
+        self.insert_state("idle", Infinite)
+        self.init_state("idle")
+
+    def ext_trans(self, port, msg):
+        pass
+
+    def int_trans(self):
+        pass
+
+    def output(self, msg_deliver):
+        pass
+
+
+def test_factory_picks_atomic_executor():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    clock, plain = _Clock("c", 2, ss), _Plain("p")
+    ss.register_entity(clock)
+    ss.register_entity(plain)
+    assert type(ss.product_port_map[clock]) is AtomicExecutor
+    assert type(ss.product_port_map[plain]) is BehaviorExecutor
+
+
+def test_sigma_persists_across_transitions():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    clock = _Clock("c", 2, ss)
+    ss.register_entity(clock)
+    ss.insert_input_port("start")
+    ss.coupling_relation(None, "start", clock, "start")
+    ss.insert_external_event("start", None, 1)
+    ss.simulate(10, _tm=False)
+    assert clock.ticks == [3, 5, 7, 9]
+    assert clock.sigma == 2.0
+
+
+def test_time_advance_override_is_called_per_transition():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    countdown = _Countdown("d", ss)
+    ss.register_entity(countdown)
+    ss.simulate(20, _tm=False)
+    # time_advance 3, then 2, then 1, then Infinite
+    assert countdown.fired == [3, 5, 6]
@@ -0,0 +1,64 @@
+"""Tests for the compact per-model footprint.
+
+Transition maps are created on first use, and ``BehaviorExecutor``
+keeps its fields in ``__slots__`` while still accepting extra
+attributes.
+"""
+
+import pickle
+
+from pyjevsim.behavior_executor import BehaviorExecutor
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import Infinite
+
+MAPS = (
+    "external_transition_map_tuple",
+    "external_transition_map_state",
+    "internal_transition_map_tuple",
+    "internal_transition_map_state",
+)
+
+
+class _Bare(BehaviorModel):
+    def __init__(self, name):
+        super().__init__(name)
+        self.insert_state("idle", Infinite)
+        self.init_state("idle")
+
+    def ext_trans(self, port, msg):
+        pass
+
+    def int_trans(self):
+        pass
+
+    def output(self, msg_deliver):
+        pass
+
+
+def test_transition_maps_are_created_on_first_use():
+    model = _Bare("m")
+    assert not set(MAPS) & set(vars(model))
+
+    model.insert_external_transition("idle", "go", "busy")
+    model.insert_internal_transition("busy", "done", "idle")
+    assert set(MAPS) <= set(vars(model))
+    assert model.retrieve_next_external_state("idle", "go") == "busy"
+    assert model.find_internal_transition("busy")
+    assert not _Bare("other").find_external_transition("idle")
+
+    copy = _Bare("copy")
+    copy.deserialize(model.serialize())
+    assert copy.retrieve_internal_transition("busy") == [("done", "idle")]
+
+
+def test_executor_is_slotted_but_extensible():
+    executor = BehaviorExecutor(0, Infinite, "default", _Bare("m"), None)
+    executor.set_req_time(0)
+    assert executor.request_time == Infinite
+    executor.extra = 1
+    assert vars(executor) == {"extra": 1}
+
+    clone = pickle.loads(pickle.dumps(executor))
+    assert clone.extra == 1
+    assert clone.get_name() == "m"
+    assert clone.request_time == Infinite
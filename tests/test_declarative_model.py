@@ -0,0 +1,113 @@
+"""Tests for ``DeclarativeBehaviorModel`` and ``DeclarativeExecutor``.
+
+A table-driven model runs from its compiled integer tables, and gives
+the same trajectory when a plain ``BehaviorExecutor`` interprets the
+same tables through the model's own hooks.
+"""
+
+import pytest
+
+from pyjevsim.behavior_executor import BehaviorExecutor
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.declarative_executor import DeclarativeExecutor
+from pyjevsim.declarative_model import DeclarativeBehaviorModel
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.executor_factory import ExecutorFactory
+from pyjevsim.system_executor import SysExecutor
+
+
+class _Door(DeclarativeBehaviorModel):
+    state_table = {"closed": Infinite, "opening": 2, "open": 3}
+    initial_state = "closed"
+    input_ports = ("push", "noise")
+    output_ports = ("opened", "closed")
+    external_transitions = {("closed", "push"): "opening"}
+    internal_transitions = {"opening": "open", "open": "closed"}
+    state_outputs = {"opening": (("opened", True),), "open": (("closed", False),)}
+
+
+class _Log(BehaviorModel):
+    def __init__(self, name, ss):
+        super().__init__(name)
+        self.insert_state("idle", Infinite)
+        self.init_state("idle")
+        self.insert_input_port("in")
+        self.ss = ss
+        self.log = []
+
+    def ext_trans(self, port, msg):
+        self.log.append((self.ss.get_global_time(), msg.get_dst(), msg.retrieve()[0]))
+
+    def int_trans(self):
+        pass
+
+    def output(self, msg_deliver):
+        pass
+
+
+class _InterpretingFactory(ExecutorFactory):
+    def create_behavior_executor(self, _, ins_t, des_t, en_name, model, parent):
+        return BehaviorExecutor(ins_t, des_t, en_name, model, parent)
+
+
+def _run(door, events, horizon=20, interpret=False):
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    if interpret:
+        ss.exec_factory = _InterpretingFactory()
+    log = _Log("log", ss)
+    ss.register_entity(door)
+    ss.register_entity(log)
+    for port in ("push", "noise"):
+        ss.insert_input_port(port)
+        ss.coupling_relation(None, port, door, port)
+    for port in ("opened", "closed"):
+        ss.coupling_relation(door, port, log, "in")
+    for port, t in events:
+        ss.insert_external_event(port, None, t)
+    ss.simulate(horizon, _tm=False)
+    return ss, log.log
+
+
+def test_tables_drive_the_model():
+    door = _Door("d")
+    ss, log = _run(door, [("push", 1), ("push", 10)])
+    assert type(ss.product_port_map[door]) is DeclarativeExecutor
+    assert log == [(3, "opened", True), (6, "closed", False),
+                   (12, "opened", True), (15, "closed", False)]
+    assert door._cur_state == "closed"
+
+
+def test_ignored_input_keeps_the_deadline():
+    # "noise" has no transition: the pending deadline of "opening" stays.
+    _, log = _run(_Door("d"), [("push", 1), ("noise", 2), ("push", 4)])
+    assert log == [(3, "opened", True), (6, "closed", False)]
+
+
+def test_interpreted_hooks_match_the_compiled_executor():
+    events = [("push", 1), ("noise", 2), ("push", 8), ("noise", 9)]
+    _, compiled = _run(_Door("a"), events)
+    _, interpreted = _run(_Door("b"), events, interpret=True)
+    assert compiled == interpreted
+
+
+def test_class_tables_compile_once_and_instances_can_extend():
+    a, b = _Door("a"), _Door("b")
+    assert a.compile() is b.compile()
+
+    b.insert_external_transition("open", "push", "closed")
+    b.insert_state_output("opening", "closed", "extra")
+    assert b.compile() is not a.compile()
+    _, log = _run(b, [("push", 1), ("push", 4)])
+    # The push at 4 closes the door early, so nothing fires at 6.
+    assert log == [(3, "opened", True), (3, "closed", "extra")]
+    assert b._cur_state == "closed"
+
+
+def test_unknown_state_is_rejected():
+    class Broken(DeclarativeBehaviorModel):
+        state_table = {"a": 1}
+        initial_state = "a"
+        internal_transitions = {"a": "b"}
+
+    with pytest.raises(ValueError, match="'b'"):
+        Broken("x").compile()
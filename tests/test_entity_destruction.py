@@ -4,11 +4,12 @@
 destruction at an absolute simulated time. The destruction itself is
 driven by `destroy_active_entity()`, which:
 
-  * short-circuits unless `_destructs_pending > 0` (the count of active
-    executors registered with a finite `dest_t`), and
-  * removes every active executor whose cached absolute destruct time
-    (`_cached_destruct_time`, exposed via `get_destruct_time()`) has
-    reached the current `global_time`.
+  * pops every entry due at `global_time` from `_destruct_calendar`, a
+    min-heap holding one entry per executor registered with a finite
+    `dest_t` (keyed by its cached absolute destruct time, exposed via
+    `get_destruct_time()`), and
+  * purges the couplings of the destroyed executors through the reverse
+    coupling index instead of scanning `port_map`.
 
 These tests pin that behaviour down: entities must disappear from
 `active_obj_map` at the correct simulated time and in destruct-time
@@ -58,11 +59,11 @@ def _build(destruction_times):
 DMC = 1
 
 
-def test_pending_destruct_count_tracks_finite_dest_t():
-    """`_destructs_pending` counts only entities with a finite dest_t."""
+def test_calendar_tracks_finite_dest_t():
+    """The destruction calendar holds only entities with a finite dest_t."""
     ss = _build([10, 20, Infinite, 30])
     # Infinite dest_t entities and the DefaultMessageCatcher do not count.
-    assert ss._destructs_pending == 3
+    assert sorted(t for t, _, _ in ss._destruct_calendar) == [10, 20, 30]
 
 
 def test_cached_destruct_time_matches_registration():
@@ -104,15 +105,50 @@ def test_entities_destroyed_at_correct_time():
 
     # Past the last destruct time only the DefaultMessageCatcher remains.
     assert len(ss.active_obj_map) == DMC
-    assert ss._destructs_pending == 0
+    assert not ss._destruct_calendar
 
 
 def test_no_destruction_when_all_infinite():
     """With no finite dest_t the destruction scan is a no-op and every
     registered entity stays active."""
     ss = _build([Infinite, Infinite])
-    assert ss._destructs_pending == 0
+    assert not ss._destruct_calendar
 
     ss.simulate(1000, _tm=False)
     # Both models plus the DefaultMessageCatcher survive.
     assert len(ss.active_obj_map) == 2 + DMC
+
+
+def test_destruction_purges_couplings_both_ways():
+    """A destroyed entity disappears from port_map as a source and as a
+    destination; unrelated couplings are left alone."""
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    a, b, c = IdleModel("a"), IdleModel("b"), IdleModel("c")
+    ss.register_entity(a)
+    ss.register_entity(b, dest_t=5)
+    ss.register_entity(c)
+    ss.coupling_relation(a, "out", b, "in")
+    ss.coupling_relation(a, "out", c, "in")
+    ss.coupling_relation(b, "out", c, "in")
+    ss.coupling_relation(c, "out", a, "in")
+
+    ss.simulate(10, _tm=False)
+
+    relation = {(src.get_name(), port): [(d.get_name(), p) for d, p in dsts]
+                for (src, port), dsts in ss.get_relation().items()}
+    assert relation == {("a", "out"): [("c", "in")], ("c", "out"): [("a", "in")]}
+    assert ss.get_entity("b")[0] not in ss._coupling_refs
+
+
+def test_destruction_before_creation_waits_for_creation():
+    """An entity whose destruct time precedes its creation time is
+    destroyed as soon as it has been created."""
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    ss.register_entity(IdleModel("late"), inst_t=8, dest_t=3)
+    ss.simulate(5, _tm=False)
+    assert len(ss.active_obj_map) == DMC
+    assert ss._destruct_calendar
+
+    ss.simulate(5, _tm=False)
+    assert len(ss.active_obj_map) == DMC
+    assert not ss._destruct_calendar
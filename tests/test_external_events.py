@@ -0,0 +1,95 @@
+"""Tests for bulk external-event ingestion and ``ExternalSource`` streams.
+
+``insert_external_events`` must deliver exactly what the equivalent
+``insert_external_event`` calls deliver; an attached source must be read
+lazily, one event ahead of the simulation clock.
+"""
+
+import pytest
+
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.external_source import ExternalSource, IterableSource
+from pyjevsim.system_executor import SysExecutor
+
+from .model_sink import Sink
+
+
+def _build():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    rec = Sink("rec", ss)
+    ss.register_entity(rec)
+    ss.insert_input_port("trace")
+    ss.coupling_relation(None, "trace", rec, "in")
+    return ss, rec
+
+
+def test_bulk_insert_matches_single_inserts():
+    times = [1, 2, 2.5, 4, 7]
+    values = ["a", "b", "c", "d", "e"]
+
+    one, one_rec = _build()
+    for t, v in zip(times, values):
+        one.insert_external_event("trace", v, t)
+    one.simulate(10, _tm=False)
+
+    bulk, bulk_rec = _build()
+    bulk.insert_external_event("trace", "x", 3)
+    bulk.insert_external_events("trace", times[::-1], values[::-1])
+    bulk.simulate(10, _tm=False)
+
+    assert one_rec.log == list(zip(times, values))
+    assert bulk_rec.log == sorted(one_rec.log + [(3, "x")])
+
+
+def test_bulk_insert_accepts_arrays():
+    np = pytest.importorskip("numpy")
+    ss, rec = _build()
+    ss.insert_external_events("trace", np.arange(1.0, 4.0), np.array([10, 20, 30]))
+    ss.simulate(5, _tm=False)
+    assert rec.log == [(1.0, 10), (2.0, 20), (3.0, 30)]
+    assert type(rec.log[0][0]) is float
+
+
+def test_bulk_insert_checks_lengths():
+    ss, _ = _build()
+    with pytest.raises(ValueError):
+        ss.insert_external_events("trace", [1, 2, 3], ["a"])
+    ss.insert_external_events("trace", [1, 2])
+    assert [t for t, _ in ss.input_event_queue] == [1, 2]
+
+
+def test_source_is_read_lazily():
+    pulled = []
+
+    def trace():
+        for i in range(1, 6):
+            pulled.append(i)
+            yield 2.0 * i, "trace", i
+
+    ss, rec = _build()
+    ss.add_external_source(IterableSource(trace()))
+    ss.simulate(5, _tm=False)
+    # Events at 2 and 4 delivered; the one at 6 is only peeked.
+    assert rec.log == [(2.0, 1), (4.0, 2)]
+    assert pulled == [1, 2, 3]
+    assert not ss.input_event_queue
+
+    ss.simulate(Infinite, _tm=False)
+    assert [v for _, v in rec.log] == [1, 2, 3, 4, 5]
+    assert not ss._external_sources
+
+
+def test_source_rejects_time_going_backwards():
+    source = IterableSource([(1, "trace", 0), (0.5, "trace", 1)])
+    with pytest.raises(ValueError):
+        source.pop()
+
+
+def test_source_must_implement_peek_time_and_pop():
+    class _PeekOnly(ExternalSource):
+        def peek_time(self):
+            return Infinite
+
+    with pytest.raises(TypeError):
+        _PeekOnly()
+
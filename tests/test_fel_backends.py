@@ -0,0 +1,164 @@
+"""Tests for the pluggable future-event lists (``SysExecutor(fel=...)``).
+
+Every backend implements the heapset's ``push / pop / pop_all_at /
+peek_time / scheduled_time / remove`` contract, so a random schedule/reschedule/remove
+sequence must drain in the same order from all of them, and a model
+run must not depend on the backend.
+"""
+
+import functools
+import random
+
+import pytest
+
+from pyjevsim import system_executor
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.schedule_queue import (
+    FEL_BACKENDS,
+    LadderQueue,
+    make_schedule_queue,
+    migrate_schedule_queue,
+    select_schedule_queue,
+)
+from pyjevsim.system_executor import SysExecutor
+from pyjevsim.system_message import SysMessage
+
+
+class _Entry:
+    def __init__(self, obj_id, req_time):
+        self._obj_id = obj_id
+        self.req_time = req_time
+
+    def get_obj_id(self):
+        return self._obj_id
+
+    def get_req_time(self):
+        return self.req_time
+
+
+def _draw(rnd, now):
+    r = rnd.random()
+    if r < 0.05:
+        return Infinite
+    if r < 0.3:
+        return now + rnd.randint(0, 2)
+    return now + rnd.expovariate(0.1)
+
+
+@pytest.mark.parametrize("kind", sorted(FEL_BACKENDS))
+def test_backend_matches_heapset(kind, monkeypatch):
+    # A tiny threshold makes the ladder spawn nested rungs.
+    monkeypatch.setattr(LadderQueue, "THRESHOLD", 4)
+    rnd = random.Random(7)
+    queues = [make_schedule_queue("heapset"), make_schedule_queue(kind)]
+    entries = [[_Entry(i, 0) for i in range(300)] for _ in queues]
+    for i in range(300):
+        t = _draw(rnd, 0)
+        for q, es in zip(queues, entries):
+            es[i].req_time = t
+            q.push(es[i])
+
+    for _ in range(3000):
+        times = [q.peek_time(default=Infinite) for q in queues]
+        assert times[0] == times[1]
+        if times[0] == Infinite:
+            break
+        popped = [sorted(e._obj_id for e in q.pop_all_at(times[0])) for q in queues]
+        assert popped[0] == popped[1]
+        for i in popped[0] + [rnd.randrange(300)]:
+            t = _draw(rnd, times[0])
+            remove = rnd.random() < 0.1
+            for q, es in zip(queues, entries):
+                if remove:
+                    q.remove(es[i])
+                else:
+                    es[i].req_time = t
+                    q.push(es[i])
+        assert len(queues[0]) == len(queues[1])
+        for i in (0, rnd.randrange(300)):
+            assert queues[0].scheduled_time(i) == queues[1].scheduled_time(i)
+
+
+def test_migration_keeps_schedule():
+    heapset = make_schedule_queue("heapset")
+    for i, t in enumerate((3.0, 1.0, 1.0, Infinite, 2.5)):
+        heapset.push(_Entry(i, t))
+
+    ladder = migrate_schedule_queue(heapset, "ladder")
+    assert ladder.KIND == "ladder"
+    assert len(ladder) == 5
+    assert ladder.scheduled_time(4) == 2.5
+    assert ladder.scheduled_time(99) is None
+    order = []
+    while ladder.peek_time(default=Infinite) != Infinite:
+        t = ladder.peek_time()
+        order.append((t, sorted(e._obj_id for e in ladder.pop_all_at(t))))
+    assert order == [(1.0, [1, 2]), (2.5, [4]), (3.0, [0])]
+    assert [e._obj_id for e in ladder.pop_all_at(Infinite)] == [3]
+
+
+def test_select_prefers_heapset_until_many_timestamps():
+    fel = make_schedule_queue("heapset")
+    for i in range(100):
+        fel.push(_Entry(i, float(i)))
+    assert select_schedule_queue(fel) == "heapset"
+    assert select_schedule_queue(fel, min_times=50) == "ladder"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        SysExecutor(1, fel="splay")
+
+
+class _Customer(BehaviorModel):
+    """Arrives after exponential think times and reports each visit."""
+
+    def __init__(self, name, seed):
+        super().__init__(name)
+        self.insert_state("think", 0)
+        self.init_state("think")
+        self.insert_output_port("visit")
+        self._rnd = random.Random(seed)
+        self.visits = 0
+
+    def output(self, msg_deliver):
+        msg = SysMessage(self.get_name(), "visit")
+        msg.insert(self.visits)
+        msg_deliver.insert_message(msg)
+
+    def int_trans(self):
+        self.visits += 1
+        self.update_state("think", self._rnd.expovariate(1.0))
+
+    def ext_trans(self, port, msg):
+        pass
+
+
+def _run(fel, n=50):
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, fel=fel)
+    customers = [_Customer(f"c{i}", i) for i in range(n)]
+    for c in customers:
+        ss.register_entity(c)
+        ss.coupling_relation(c, "visit", None, "visit")
+    ss.insert_output_port("visit")
+    ss.simulate(20, _tm=False)
+    events = sorted((t, msg.get_src(), msg.retrieve()[0])
+                    for t, msg in ss.get_generated_event())
+    return [c.visits for c in customers], events, ss
+
+
+@pytest.mark.parametrize("kind", ["calendar", "ladder", "auto"])
+def test_simulation_does_not_depend_on_backend(kind, monkeypatch):
+    # Let "auto" re-evaluate early and switch at a size this test reaches.
+    monkeypatch.setattr(SysExecutor, "FEL_AUTO_INTERVAL", 16)
+    monkeypatch.setattr(
+        system_executor, "select_schedule_queue",
+        functools.partial(select_schedule_queue, min_times=20),
+    )
+    expected = _run("heapset")[:2]
+    visits, events, ss = _run(kind)
+    assert (visits, events) == expected
+    assert events
+    if kind == "auto":
+        assert ss.min_schedule_item.KIND == "ladder"
@@ -0,0 +1,198 @@
+"""Tests for ``SysExecutor(flatten_structural=True)``.
+
+In flattening mode ``register_entity(structural_model)`` registers every
+atomic descendant with the root executor and resolves EIC / IC / EOC
+into the root routing index. The structural model itself stays
+reachable through ``get_model`` / ``remove_entity`` and as an endpoint
+of top-level ``coupling_relation`` calls.
+"""
+
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.flat_structural_executor import FlatStructuralExecutor
+from pyjevsim.structural_model import StructuralModel
+from pyjevsim.system_executor import SysExecutor
+from pyjevsim.system_message import SysMessage
+
+from .model_sink import Sink
+from .model_ticker import Ticker
+
+
+class _Gen(Ticker):
+    """Waits for ``start``, then ticks every time unit."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.insert_state("wait", Infinite)
+        self.init_state("wait")
+        self.insert_input_port("start")
+
+    def ext_trans(self, port, msg):
+        if port == "start":
+            self._cur_state = "active"
+
+
+class _Relay(BehaviorModel):
+    """Forwards each input on ``out`` with zero delay."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.insert_state("idle", Infinite)
+        self.insert_state("send", 0)
+        self.init_state("idle")
+        self.insert_input_port("in")
+        self.insert_output_port("out")
+        self._pending = []
+
+    def ext_trans(self, port, msg):
+        self._pending.append(msg.retrieve()[0])
+        self._cur_state = "send"
+
+    def int_trans(self):
+        self._pending = []
+        self._cur_state = "idle"
+
+    def output(self, msg_deliver):
+        for value in self._pending:
+            m = SysMessage(self.get_name(), "out")
+            m.insert(value)
+            msg_deliver.insert_message(m)
+
+
+class _Inner(StructuralModel):
+    def __init__(self, name):
+        super().__init__(name)
+        self.insert_input_port("start")
+        self.insert_output_port("out")
+        self.gen = _Gen("gen")
+        self.register_entity(self.gen)
+        self.coupling_relation(self, "start", self.gen, "start")
+        self.coupling_relation(self.gen, "out", self, "out")
+
+
+class _Outer(StructuralModel):
+    def __init__(self, name):
+        super().__init__(name)
+        self.insert_input_port("start")
+        self.insert_output_port("out")
+        self.inner = _Inner("inner")
+        self.relay = _Relay("relay")
+        self.register_entity(self.inner)
+        self.register_entity(self.relay)
+        self.coupling_relation(self, "start", self.inner, "start")
+        self.coupling_relation(self.inner, "out", self.relay, "in")
+        self.coupling_relation(self.relay, "out", self, "out")
+
+
+def _build_flattened():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None,
+                     flatten_structural=True)
+    outer = _Outer("outer")
+    sink = Sink("sink", ss)
+    ss.register_entity(outer)
+    ss.register_entity(sink)
+    ss.insert_input_port("start")
+    ss.coupling_relation(None, "start", outer, "start")
+    ss.coupling_relation(outer, "out", sink, "in")
+    ss.insert_external_event("start", None)
+    return ss, outer, sink
+
+
+def _build_hand_flattened():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    gen = _Gen("gen")
+    relay = _Relay("relay")
+    sink = Sink("sink", ss)
+    for m in (gen, relay, sink):
+        ss.register_entity(m)
+    ss.insert_input_port("start")
+    ss.coupling_relation(None, "start", gen, "start")
+    ss.coupling_relation(gen, "out", relay, "in")
+    ss.coupling_relation(relay, "out", sink, "in")
+    ss.insert_external_event("start", None)
+    return ss, sink
+
+
+def test_children_registered_with_root():
+    ss, outer, _ = _build_flattened()
+    ss.simulate(1, _tm=False)
+
+    active = set(ss.active_obj_map)
+    assert outer.inner.gen.get_obj_id() in active
+    assert outer.relay.get_obj_id() in active
+    # Structural models are not schedulable in flattening mode.
+    assert outer.get_obj_id() not in active
+    assert isinstance(ss.product_port_map[outer], FlatStructuralExecutor)
+
+
+def test_matches_hand_flattened_graph():
+    ss, _, sink = _build_flattened()
+    ref_ss, ref_sink = _build_hand_flattened()
+
+    ss.simulate(6, _tm=False)
+    ref_ss.simulate(6, _tm=False)
+
+    assert sink.log
+    assert sink.log == ref_sink.log
+
+
+def test_structural_addressable_by_name():
+    ss, outer, sink = _build_flattened()
+    ss.simulate(3, _tm=False)
+    assert ss.get_model("outer") is outer
+
+    delivered = len(sink.received)
+    ss.remove_entity("outer")
+    assert outer.inner.gen.get_obj_id() not in ss.active_obj_map
+    assert outer.relay.get_obj_id() not in ss.active_obj_map
+
+    ss.simulate(3, _tm=False)
+    assert len(sink.received) == delivered
+
+
+def test_confluent_inside_flattened_structural():
+    """Two children imminent at the same instant with an IC between them:
+    the receiver must fire con_trans, exactly as in a flat graph."""
+
+    class _Counter(BehaviorModel):
+        def __init__(self, name):
+            super().__init__(name)
+            self.insert_state("active", 1)
+            self.insert_state("done", Infinite)
+            self.init_state("active")
+            self.insert_input_port("in")
+            self.insert_output_port("out")
+            self.n_con = 0
+
+        def ext_trans(self, port, msg):
+            pass
+
+        def int_trans(self):
+            self._cur_state = "done"
+
+        def con_trans(self, port_msgs):
+            self.n_con += 1
+            self._cur_state = "done"
+
+        def output(self, msg_deliver):
+            m = SysMessage(self.get_name(), "out")
+            m.insert(1)
+            msg_deliver.insert_message(m)
+
+    class _Pair(StructuralModel):
+        def __init__(self, name):
+            super().__init__(name)
+            self.a = _Counter("a")
+            self.b = _Counter("b")
+            self.register_entity(self.a)
+            self.register_entity(self.b)
+            self.coupling_relation(self.a, "out", self.b, "in")
+
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None,
+                     flatten_structural=True)
+    pair = _Pair("pair")
+    ss.register_entity(pair)
+    ss.simulate(3, _tm=False)
+
+    assert pair.b.n_con == 1
+    assert pair.a.n_con == 0
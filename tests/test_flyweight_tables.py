@@ -0,0 +1,78 @@
+"""Tests for class-level state and port tables on ``BehaviorModel``.
+
+Instances share the class tables until they change them, and the
+executor schedules from the shared table directly.
+"""
+
+import pickle
+
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.system_executor import SysExecutor
+from pyjevsim.system_message import SysMessage
+
+
+class _Gen(BehaviorModel):
+    state_table = {"WAIT": Infinite, "GEN": 2}
+    initial_state = "GEN"
+    input_ports = ("start",)
+    output_ports = ("out",)
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.sent = 0
+
+    def ext_trans(self, port, msg):
+        self._cur_state = "GEN"
+
+    def int_trans(self):
+        if self.sent >= 3:
+            self._cur_state = "WAIT"
+
+    def output(self, msg_deliver):
+        self.sent += 1
+        msg_deliver.insert_message(SysMessage.single(self.get_name(), "out", self.sent))
+
+
+class _FastGen(_Gen):
+    output_ports = ("out", "log")
+
+
+def test_instances_share_the_class_tables():
+    a, b = _Gen("a"), _Gen("b")
+    assert a._states is b._states is _Gen._states
+    assert a.retrieve_input_ports() is b.retrieve_input_ports()
+    assert a._cur_state == "GEN"
+    assert a._states == {"WAIT": Infinite, "GEN": 2.0}
+
+
+def test_changes_are_copied_per_instance():
+    a, b = _Gen("a"), _Gen("b")
+    a.update_state("GEN", 5)
+    a.insert_output_port("debug")
+    assert a._states["GEN"] == 5.0
+    assert b._states["GEN"] == 2.0 and b._states is _Gen._states
+    assert a.retrieve_output_ports() == ["out", "debug"]
+    assert b.retrieve_output_ports() == ["out"]
+
+
+def test_subclass_inherits_and_overrides_tables():
+    fast = _FastGen("f")
+    assert fast._states is _Gen._states
+    assert fast.retrieve_input_ports() == ["start"]
+    assert fast.retrieve_output_ports() == ["out", "log"]
+    assert _Gen("g").retrieve_output_ports() == ["out"]
+
+
+def test_shared_tables_drive_the_schedule():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    slow, fast = _Gen("slow"), _Gen("fast")
+    fast.update_state("GEN", 1)
+    for model in (slow, fast):
+        ss.register_entity(model)
+    ss.simulate(10, _tm=False)
+    assert (slow.sent, fast.sent) == (3, 3)
+    assert slow._cur_state == fast._cur_state == "WAIT"
+
+    clone = pickle.loads(pickle.dumps(slow))
+    assert clone._states == _Gen._states and clone.retrieve_output_ports() == ["out"]
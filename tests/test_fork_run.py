@@ -0,0 +1,75 @@
+"""Tests for ``SysExecutor.fork_run``.
+
+Children start from the parent's built (and warmed-up) executor, apply
+their own override, and return a result; the parent executor must not
+be affected by anything a child does.
+"""
+
+import os
+
+import pytest
+
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType
+from pyjevsim.system_executor import SysExecutor
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+
+class _Counter(BehaviorModel):
+    def __init__(self, name, period):
+        super().__init__(name)
+        self.insert_state("run", period)
+        self.init_state("run")
+        self.count = 0
+
+    def int_trans(self):
+        self.count += 1
+
+    def output(self, msg_deliver):
+        pass
+
+    def ext_trans(self, port, msg):
+        pass
+
+
+def _warm():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    ss.register_entity(_Counter("c", 1))
+    ss.simulate(5, _tm=False)
+    return ss
+
+
+def _variant(ss, index):
+    counter = ss.get_model("c")
+    counter.update_state("run", index + 1)
+    ss.simulate(12, _tm=False)
+    return os.getpid(), ss.get_global_time(), counter.count
+
+
+def test_children_run_variants_from_warm_state():
+    ss = _warm()
+    counter = ss.get_model("c")
+    before = counter.count
+
+    results = ss.fork_run(_variant, 4, workers=2)
+
+    assert [r[1] for r in results] == [17] * 4
+    # Period index + 1 for the remaining 12 time units.
+    assert [r[2] - before for r in results] == [12, 6, 4, 3]
+    assert len({r[0] for r in results}) == 4
+    assert os.getpid() not in {r[0] for r in results}
+    assert ss.get_global_time() == 5
+    assert counter.count == before
+
+
+def _fail_odd(ss, index):
+    if index % 2:
+        raise ValueError(f"bad variant {index}")
+    return index
+
+
+def test_child_failure_is_reported():
+    ss = _warm()
+    with pytest.raises(RuntimeError, match="bad variant 1"):
+        ss.fork_run(_fail_odd, 3)
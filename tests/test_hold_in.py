@@ -0,0 +1,67 @@
+"""Tests for the one-shot time advance ``BehaviorModel.hold_in`` / ``sigma``.
+
+A sigma applies to a single reschedule and never changes the state
+table, unlike ``update_state``.
+"""
+
+import pickle
+
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.system_executor import SysExecutor
+from pyjevsim.system_message import SysMessage
+
+
+class _Pulse(BehaviorModel):
+    """Fires with the gaps listed in ``gaps``, then at the table's 10."""
+
+    def __init__(self, name, gaps, ss):
+        super().__init__(name)
+        self.insert_state("RUN", 10)
+        self.insert_state("IDLE", Infinite)
+        self.insert_input_port("stop")
+        self.gaps = list(gaps)
+        self.fired = []
+        self.ss = ss
+        self.hold_in("RUN", self.gaps.pop(0))
+
+    def ext_trans(self, port, msg):
+        self.passivate()
+
+    def int_trans(self):
+        if self.gaps:
+            self.hold_in("RUN", self.gaps.pop(0))
+
+    def output(self, msg_deliver):
+        self.fired.append(self.ss.get_global_time())
+
+
+def test_sigma_applies_to_one_reschedule():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    pulse = _Pulse("p", [1, 2, 3], ss)
+    ss.register_entity(pulse)
+    ss.simulate(30, _tm=False)
+
+    assert pulse.fired == [1, 3, 6, 16, 26]
+    assert pulse.retrieve_states() == {"RUN": 10.0, "IDLE": Infinite}
+    assert pulse.sigma is None
+
+
+def test_passivate_keeps_the_state():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    pulse = _Pulse("p", [2], ss)
+    ss.register_entity(pulse)
+    ss.insert_input_port("stop")
+    ss.coupling_relation(None, "stop", pulse, "stop")
+    ss.insert_external_event("stop", None, 1)
+    ss.simulate(30, _tm=False)
+
+    assert pulse.fired == []
+    assert pulse._cur_state == "RUN"
+
+
+def test_hold_in_does_not_leak_into_snapshots():
+    pulse = _Pulse("p", [4], None)
+    restored = pickle.loads(pickle.dumps(pulse))
+    assert restored.retrieve_states()["RUN"] == 10.0
+    assert restored.sigma == 4.0
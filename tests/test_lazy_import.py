@@ -0,0 +1,49 @@
+"""Tests for the lazy attribute loading in ``pyjevsim/__init__.py``.
+
+``import pyjevsim`` must not load the snapshot / restore machinery or
+other optional dependencies; they are imported on first attribute
+access instead.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    proc = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    return proc.stdout.split()
+
+
+def test_core_import_skips_optional_machinery():
+    loaded = _run(
+        "import sys, pyjevsim\n"
+        "for m in ('dill', 'asyncio', 'concurrent.futures', 'json', 'ast',\n"
+        "          'pyjevsim.snapshot_manager', 'pyjevsim.restore_handler'):\n"
+        "    print(m in sys.modules)"
+    )
+    assert loaded == ["False"] * 7
+
+
+def test_lazy_attributes_resolve_on_first_use():
+    out = _run(
+        "import sys, pyjevsim\n"
+        "print(pyjevsim.SnapshotManager.__module__)\n"
+        "print('pyjevsim.snapshot_manager' in sys.modules)\n"
+        "print(pyjevsim.profiler.__name__)\n"
+        "print('SnapshotManager' in dir(pyjevsim))"
+    )
+    assert out == ["pyjevsim.snapshot_manager", "True", "pyjevsim.profiler", "True"]
+
+
+def test_unknown_attribute_raises():
+    import pyjevsim
+
+    with pytest.raises(AttributeError):
+        pyjevsim.no_such_thing
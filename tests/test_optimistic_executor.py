@@ -0,0 +1,211 @@
+"""Tests for ``TimeWarpSysExecutor``.
+
+Workers run ahead optimistically and roll back on stragglers, so
+zero-lookahead interactions across partitions — including zero-delay
+cascades and confluent instants — must still reproduce the sequential
+engine's results.
+"""
+
+import multiprocessing
+
+import dill
+import pytest
+
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.optimistic_executor import (
+    TimeWarpSysExecutor,
+    _live_objects,
+    _restore_model,
+    _save_model,
+)
+from pyjevsim.system_executor import SysExecutor
+from pyjevsim.system_message import SysMessage
+
+from .model_ticker import Ticker
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="TimeWarpSysExecutor forks its workers",
+)
+
+
+class _Listener(Ticker):
+    """Ticker whose output also carries how many inputs it has logged;
+    an input does not delay its next tick."""
+
+    def __init__(self, name, period):
+        super().__init__(name, period)
+        self.insert_input_port("in")
+        self.log = []
+
+    def output(self, msg_deliver):
+        m = SysMessage(self.get_name(), "out")
+        m.insert((self.get_name(), self.count, len(self.log)))
+        msg_deliver.insert_message(m)
+
+    def ext_trans(self, port, msg):
+        self.log.append(("ext", self.count, msg.retrieve()[0]))
+        self.cancel_rescheduling()
+
+    def con_trans(self, port_msgs):
+        self.log.append(("con", self.count, [m.retrieve()[0] for _, m in port_msgs]))
+        self.int_trans()
+
+
+class _Echo(BehaviorModel):
+    """Zero-delay relay: forwards each input in the next cascade round."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.insert_state("idle", Infinite)
+        self.insert_state("send", 0)
+        self.init_state("idle")
+        self.insert_input_port("in")
+        self.insert_output_port("out")
+        self.pending = []
+        self.count = 0
+
+    def ext_trans(self, port, msg):
+        self.pending.extend(msg.retrieve())
+        self._cur_state = "send"
+
+    def int_trans(self):
+        self.count += len(self.pending)
+        self.pending = []
+        self._cur_state = "idle"
+
+    def output(self, msg_deliver):
+        m = SysMessage(self.get_name(), "out")
+        m.insert(("echo", self.count, tuple(self.pending)))
+        msg_deliver.insert_message(m)
+
+
+def _build(engine, partitioned):
+    """slow (p0) -> echo (p1) -> fast (p1) and slow ; fast -> slow.
+
+    ``fast`` ticks ten times per ``slow`` tick, so partition 1 runs far
+    ahead and is rolled back whenever ``slow`` emits.
+    """
+    slow = _Listener("slow", 1)
+    echo = _Echo("echo")
+    fast = _Listener("fast", 0.25)
+    for model, part in ((slow, 0), (echo, 1), (fast, 1)):
+        if partitioned:
+            engine.register_entity(model, partition=part)
+        else:
+            engine.register_entity(model)
+    engine.insert_output_port("out")
+    engine.coupling_relation(slow, "out", echo, "in")
+    engine.coupling_relation(echo, "out", fast, "in")
+    engine.coupling_relation(echo, "out", slow, "in")
+    engine.coupling_relation(fast, "out", slow, "in")
+    engine.coupling_relation(echo, "out", None, "out")
+    return slow, echo, fast
+
+
+def _state(models):
+    """Model state for comparison. ``slow`` has two sources (``echo``
+    and ``fast``) whose same-instant inputs the sequential engine hands
+    over in arbitrary order, so only its bags are compared unordered;
+    every other model must match exactly."""
+    state = []
+    for m in models:
+        log = m.__dict__.get("log")
+        if m.get_name() == "slow":
+            log = [(kind, count, sorted(inputs) if kind == "con" else inputs)
+                   for kind, count, inputs in log]
+        state.append((m.get_name(), log, m.__dict__.get("count")))
+    return state
+
+
+def test_matches_sequential_engine_with_zero_lookahead():
+    seq = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    ref = _build(seq, partitioned=False)
+    seq.simulate(8, _tm=False)
+
+    tw = TimeWarpSysExecutor(1, workers=2, gvt_interval=0.01)
+    models = _build(tw, partitioned=True)
+    tw.simulate(8)
+
+    assert _state(models) == _state(ref)
+    assert any(entry[0] == "con" for entry in models[0].log)
+
+    got = [(t, msg.retrieve()) for t, msg in tw.get_generated_event()]
+    want = [(t, msg.retrieve()) for t, msg in seq.get_generated_event()]
+    assert got and got == want
+    assert set(tw.stats) == {0, 1}
+
+
+def test_external_events_and_single_partition():
+    def build(engine, partitioned):
+        models = _build(engine, partitioned)
+        engine.insert_input_port("kick")
+        engine.coupling_relation(None, "kick", models[1], "in")
+        engine.insert_external_event("kick", "k1", scheduled_time=2.5)
+        return models
+
+    seq = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    ref = build(seq, partitioned=False)
+    seq.simulate(5, _tm=False)
+
+    for workers in (1, 2):
+        tw = TimeWarpSysExecutor(1, workers=workers, gvt_interval=0.01)
+        models = build(tw, partitioned=workers > 1)
+        tw.simulate(5)
+        assert _state(models) == _state(ref)
+
+
+def test_rollback_across_entity_creation_and_destruction():
+    """Rounds that create or destroy entities save the whole partition;
+    rollbacks crossing them must still undo the per-model rounds."""
+    def build(engine, partitioned):
+        slow, echo, fast = _build(engine, partitioned)
+        late = _Listener("late", 0.5)
+        if partitioned:
+            engine.register_entity(late, 2.25, 6.25, partition=1)
+        else:
+            engine.register_entity(late, 2.25, 6.25)
+        engine.coupling_relation(echo, "out", late, "in")
+        return slow, echo, fast, late
+
+    seq = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    ref = build(seq, partitioned=False)
+    seq.simulate(8, _tm=False)
+
+    tw = TimeWarpSysExecutor(1, workers=2, gvt_interval=0.01)
+    models = build(tw, partitioned=True)
+    tw.simulate(8)
+
+    assert _state(models) == _state(ref)
+    assert models[3].count
+    assert tw.stats[1]["rollbacks"]
+
+
+def test_saved_state_rebinds_simulator_references():
+    """A model's references to the SysExecutor and to other models are
+    not copied by state saving; restoring rebinds them to the objects
+    of the graph being restored, also after a whole-graph reload."""
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    a, b = _Listener("a", 1), _Listener("b", 1)
+    ss.register_entity(a)
+    ss.register_entity(b)
+    ss.create_entity()
+    a.engine, a.peers = ss, [b]
+    a.log.append("before")
+    executor = ss.active_obj_map[a.get_obj_id()]
+    saved = _save_model(executor)
+
+    a.count = 5
+    a.log.append("after")
+    a.peers = []
+    _restore_model(executor, *saved[1:], _live_objects(ss))
+    assert (a.count, a.log) == (0, ["before"])
+    assert a.engine is ss and a.peers[0] is b
+
+    copy = dill.loads(dill.dumps(ss))
+    executor = copy.active_obj_map[a.get_obj_id()]
+    _restore_model(executor, *saved[1:], _live_objects(copy))
+    restored = executor.behavior_model
+    assert restored.engine is copy
+    assert restored.peers[0] is copy.active_obj_map[b.get_obj_id()].behavior_model
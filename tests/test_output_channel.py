@@ -0,0 +1,109 @@
+"""Tests for ``OutputChannel`` and ``SysExecutor.open_output_channel``.
+
+A channel receives the executor's EOC outputs as ``(time, port, msg)``,
+bounded by its capacity and policy, and hands them over by swapping
+buffers rather than copying them.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from pyjevsim.definition import ExecutionType
+from pyjevsim.output_channel import OutputChannel
+from pyjevsim.system_executor import SysExecutor
+
+from .model_ticker import Ticker
+
+
+def _build(**kwargs):
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, **kwargs)
+    for name in ("a", "b"):
+        model = Ticker(name)
+        ss.register_entity(model)
+        ss.insert_output_port(name)
+        ss.coupling_relation(model, "out", None, name)
+    return ss
+
+
+def test_channel_receives_outputs_per_port():
+    ss = _build(output_capacity=0)
+    every = ss.open_output_channel()
+    only_b = ss.open_output_channel(ports=["b"])
+    ss.simulate(4, _tm=False)
+
+    events = every.drain()
+    assert sorted((t, port, msg.value()) for t, port, msg in events) == [
+        (t, port, v) for t, v in ((1, 1), (2, 2), (3, 3)) for port in ("a", "b")
+    ]
+    assert [(t, msg.value()) for t, _, msg in only_b.drain()] == [(1, 1), (2, 2), (3, 3)]
+    assert not every.drain()
+    assert not ss.output_event_queue
+
+
+def test_drain_swaps_buffers():
+    channel = OutputChannel()
+    for i in range(3):
+        channel.push(i, "out", i)
+    events = channel.drain()
+    channel.push(3, "out", 3)
+    assert list(events) == [(0, "out", 0), (1, "out", 1), (2, "out", 2)]
+    assert len(channel) == 1
+
+
+@pytest.mark.parametrize(
+    "policy, kept",
+    [("drop_oldest", [2, 3, 4]), ("drop_newest", [0, 1, 2])],
+)
+def test_drop_policies(policy, kept):
+    channel = OutputChannel(capacity=3, policy=policy)
+    for i in range(5):
+        channel.push(i, "out", i)
+    assert [msg for _, _, msg in channel.drain()] == kept
+    assert channel.dropped == 2
+
+
+def test_block_policy_applies_backpressure():
+    ss = _build()
+    channel = ss.open_output_channel(capacity=2, policy="block", ports=["a"])
+    received = []
+
+    def consume():
+        for t, _, msg in channel:
+            received.append((t, msg.value()))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    ss.simulate(21, _tm=False)
+    ss.terminate_simulation()
+    consumer.join(5)
+
+    assert not consumer.is_alive()
+    assert received == [(t, t) for t in range(1, 21)]
+    assert channel.dropped == 0
+
+
+def test_async_iteration():
+    ss = _build()
+    channel = ss.open_output_channel(ports=["a"])
+
+    async def consume():
+        producer = threading.Thread(target=lambda: (ss.simulate(6, _tm=False),
+                                                    ss.close_output_channel(channel)))
+        producer.start()
+        values = [msg.value() async for _, _, msg in channel]
+        producer.join()
+        return values
+
+    assert asyncio.run(consume()) == [1, 2, 3, 4, 5]
+    assert channel.closed
+
+
+def test_handle_external_output_event_hands_over_queue():
+    ss = _build(output_capacity=4)
+    ss.simulate(3, _tm=False)
+    queue = ss.output_event_queue
+    events = ss.handle_external_output_event()
+    assert events is queue and len(events) == 4
+    assert not ss.output_event_queue and ss.output_event_queue.maxlen == 4
@@ -0,0 +1,178 @@
+"""Tests for ``ParallelSysExecutor``.
+
+Partitions run in forked worker processes and synchronise with null
+messages. A graph cut at couplings with a positive lookahead must give
+exactly the sequential engine's results.
+"""
+
+import multiprocessing
+
+import pytest
+
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.parallel_executor import ParallelSysExecutor
+from pyjevsim.system_executor import SysExecutor
+from pyjevsim.system_message import SysMessage
+
+from .model_ticker import Ticker
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="ParallelSysExecutor forks its workers",
+)
+
+
+class _Delay(BehaviorModel):
+    """Forwards queued inputs on ``out``, smallest first, one per
+    ``delay``; any input restarts the delay. Records every input it saw.
+
+    Inputs that arrive at the same instant reach ``ext_trans`` in an
+    arbitrary order in the sequential engine, so the queue is kept
+    sorted to make the behaviour independent of it."""
+
+    def __init__(self, name, delay):
+        super().__init__(name)
+        self.insert_state("idle", Infinite)
+        self.insert_state("busy", delay)
+        self.init_state("idle")
+        self.insert_input_port("in")
+        self.insert_output_port("out")
+        self.queue = []
+        self.seen = []
+
+    def ext_trans(self, port, msg):
+        for item in msg.retrieve():
+            self.seen.append(item)
+            self.queue.append(item)
+        self.queue.sort()
+        self._cur_state = "busy"
+
+    def int_trans(self):
+        self.queue.pop(0)
+        if not self.queue:
+            self._cur_state = "idle"
+
+    def output(self, msg_deliver):
+        m = SysMessage(self.get_name(), "out")
+        m.insert(self.queue[0])
+        msg_deliver.insert_message(m)
+
+
+class _Linked(Ticker):
+    """A ticker keeping a count in a slot and references to its
+    engine and to other models."""
+
+    __slots__ = ("total",)
+
+    def __init__(self, name, period):
+        super().__init__(name, period)
+        self.total = 0
+        self.engine = None
+        self.peers = []
+
+    def int_trans(self):
+        super().int_trans()
+        self.total += 1
+
+
+def _build(engine, partitions=None):
+    """gen -> a -> b -> a (ring) ; b -> external output"""
+    gen = Ticker("gen", 1.5)
+    a = _Delay("a", 1)
+    b = _Delay("b", 0.5)
+    models = (gen, a, b)
+    for m, part in zip(models, partitions or (None,) * 3):
+        if partitions is None:
+            engine.register_entity(m)
+        else:
+            engine.register_entity(m, partition=part)
+    engine.insert_output_port("done")
+    kw = {} if partitions is None else {"lookahead": 0.5}
+    engine.coupling_relation(gen, "out", a, "in", **kw)
+    engine.coupling_relation(a, "out", b, "in", **kw)
+    engine.coupling_relation(b, "out", a, "in", **kw)
+    engine.coupling_relation(b, "out", None, "done")
+    return models
+
+
+def test_matches_sequential_engine():
+    seq = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    ref = _build(seq)
+    seq.simulate(30, _tm=False)
+
+    par = ParallelSysExecutor(1, workers=3)
+    models = _build(par, partitions=(0, 1, 2))
+    par.simulate(30)
+
+    gen, a, b = models
+    # ``a`` gets ``gen`` and ``b`` outputs at the same instants, in the
+    # sequential engine's arbitrary order; ``b`` has one source, so its
+    # inputs (and everything emitted) must match exactly.
+    assert sorted(a.seen) == sorted(ref[1].seen)
+    assert b.seen and b.seen == ref[2].seen
+    assert gen.count == ref[0].count
+
+    got = [(t, msg.retrieve()) for t, msg in par.get_generated_event()]
+    want = [(t, msg.retrieve()) for t, msg in seq.get_generated_event()]
+    assert got and got == want
+
+
+def test_entity_lifetimes_match_sequential_engine():
+    def build(engine, partitioned):
+        models = _build(engine, (0, 1, 2) if partitioned else None)
+        late = Ticker("late", 1)
+        # Created at 2, destroyed as time reaches 7: fires at 3 .. 6.
+        if partitioned:
+            engine.register_entity(late, 2, 7, partition=2)
+        else:
+            engine.register_entity(late, 2, 7)
+        return models + (late,)
+
+    seq = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    ref = build(seq, partitioned=False)
+    seq.simulate(30, _tm=False)
+
+    par = ParallelSysExecutor(1, workers=3)
+    models = build(par, partitioned=True)
+    par.simulate(30)
+
+    assert ref[3].count == 4
+    assert models[3].count == ref[3].count
+    assert models[2].seen == ref[2].seen
+
+
+def test_cross_partition_coupling_needs_lookahead():
+    par = ParallelSysExecutor(1, workers=2)
+    gen = Ticker("gen", 1)
+    a = _Delay("a", 1)
+    par.register_entity(gen, partition=0)
+    par.register_entity(a, partition=1)
+    par.coupling_relation(gen, "out", a, "in")
+    with pytest.raises(ValueError):
+        par.simulate(5)
+
+
+def test_broken_lookahead_promise_is_reported():
+    par = ParallelSysExecutor(1, workers=2)
+    gen = Ticker("gen", 1)
+    a = _Delay("a", 1)
+    par.register_entity(gen, partition=0)
+    par.register_entity(a, partition=1)
+    # gen emits every 1.0, so a lookahead of 2 is a false promise.
+    par.coupling_relation(gen, "out", a, "in", lookahead=2)
+    with pytest.raises(RuntimeError, match="lookahead violated"):
+        par.simulate(5)
+
+
+def test_copy_back_restores_slots_and_keeps_references():
+    engine = ParallelSysExecutor(1, workers=2)
+    a, b = _Linked("a", 1), _Linked("b", 1)
+    engine.register_entity(a, partition=0)
+    engine.register_entity(b, partition=1)
+    a.engine, a.peers = engine, [b]
+    engine.simulate(3.5)
+
+    assert (a.count, a.total, b.total) == (3, 3, 3)
+    assert a.engine is engine
+    assert a.peers[0] is b
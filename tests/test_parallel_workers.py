@@ -0,0 +1,107 @@
+"""Tests for ``SysExecutor(parallel_workers=N)``.
+
+Phase A outputs and Phase C transitions of large ticks run on a thread
+pool on free-threaded builds. The pool is switched off under the GIL;
+the fan-out path is exercised here by pretending the GIL is disabled,
+which is safe because the result must not depend on it.
+"""
+
+import threading
+
+import pytest
+
+from pyjevsim import system_executor
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.system_executor import SysExecutor
+from pyjevsim.system_message import SysMessage
+
+
+class _Node(BehaviorModel):
+    """Emits its id every ``period``; sums every id it receives."""
+
+    def __init__(self, name, index, period):
+        super().__init__(name)
+        self.insert_state("run", period)
+        self.init_state("run")
+        self.insert_input_port("in")
+        self.insert_output_port("out")
+        self.index = index
+        self.total = 0
+        self.fired = 0
+        self.threads = set()
+
+    def output(self, msg_deliver):
+        self.threads.add(threading.current_thread().name)
+        m = SysMessage(self.get_name(), "out")
+        m.insert(self.index)
+        msg_deliver.insert_message(m)
+
+    def int_trans(self):
+        self.fired += 1
+
+    def ext_trans(self, port, msg):
+        self.total += msg.retrieve()[0]
+        self.threads.add(threading.current_thread().name)
+        self.cancel_rescheduling()
+
+    def con_trans(self, port_msgs):
+        for _, msg in port_msgs:
+            self.total += msg.retrieve()[0]
+        self.fired += 1
+
+
+class _Boom(_Node):
+    def int_trans(self):
+        raise RuntimeError("boom")
+
+
+def _build(ss, n=80, model=_Node):
+    nodes = [model(f"n{i}", i, 1 + i % 3) for i in range(n)]
+    for node in nodes:
+        ss.register_entity(node)
+    # Ring: every node feeds the next one.
+    for a, b in zip(nodes, nodes[1:] + nodes[:1]):
+        ss.coupling_relation(a, "out", b, "in")
+    return nodes
+
+
+def _result(nodes):
+    return [(n.total, n.fired) for n in nodes]
+
+
+def test_pool_is_disabled_under_the_gil(monkeypatch):
+    monkeypatch.setattr(system_executor, "_gil_enabled", lambda: True)
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, parallel_workers=4)
+    assert ss.parallel_workers == 0
+    _build(ss)
+    ss.simulate(5, _tm=False)
+    assert ss._pool is None
+
+
+def test_fan_out_matches_sequential(monkeypatch):
+    seq = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    seq_nodes = _build(seq)
+    seq.simulate(12, _tm=False)
+    expected = _result(seq_nodes)
+
+    monkeypatch.setattr(system_executor, "_gil_enabled", lambda: False)
+    par = SysExecutor(1, ex_mode=ExecutionType.V_TIME, parallel_workers=4)
+    nodes = _build(par)
+    par.simulate(12, _tm=False)
+
+    assert _result(nodes) == expected
+    assert any(n.total for n in seq_nodes)
+    assert any(name.startswith(f"{par.get_name()}-tick")
+               for n in nodes for name in n.threads)
+    par.terminate_simulation()
+    assert par._pool is None
+
+
+def test_model_exception_reaches_caller(monkeypatch):
+    monkeypatch.setattr(system_executor, "_gil_enabled", lambda: False)
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, parallel_workers=2)
+    _build(ss, model=_Boom)
+    with pytest.raises(RuntimeError, match="boom"):
+        ss.simulate(Infinite, _tm=False)
+    ss.terminate_simulation()
@@ -0,0 +1,93 @@
+"""Tests for ``SysExecutor(profile=True)``.
+
+Every model method call must be counted under its model and class, and
+each tick must add its phase times and FEL size; a default executor
+must leave the models untouched.
+"""
+
+import csv
+import json
+
+import pytest
+
+from pyjevsim.definition import ExecutionType
+from pyjevsim.system_executor import SysExecutor
+
+from .model_sink import Sink
+from .model_ticker import Ticker
+
+
+def _build(profile):
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, profile=profile)
+    sink = Sink("sink")
+    ss.register_entity(sink)
+    for name in ("t1", "t2"):
+        ticker = Ticker(name)
+        ss.register_entity(ticker)
+        ss.coupling_relation(ticker, "out", sink, "in")
+    return ss
+
+
+def _named(models, name):
+    (entry,) = [m for m in models.values() if m["name"] == name]
+    return entry
+
+
+def test_profile_counts_calls_per_model_and_class():
+    ss = _build(profile=True)
+    ss.simulate(4, _tm=False)
+    profile = ss.get_profile()
+
+    t1 = _named(profile["models"], "t1")
+    assert t1["class"] == "Ticker"
+    assert t1["methods"]["output"]["calls"] == 3
+    assert t1["methods"]["int_trans"]["calls"] == 3
+    assert _named(profile["models"], "sink")["methods"]["ext_trans"]["calls"] == 6
+    assert profile["classes"]["Ticker"]["output"]["calls"] == 6
+    assert profile["classes"]["Ticker"]["output"]["ns"] > 0
+
+    assert profile["ticks"] == 3
+    assert set(profile["phases"]) == {"A", "B", "C", "D"}
+    assert all(ns >= 0 for ns in profile["phases"].values())
+    assert profile["fel"]["max"] >= 2
+
+
+def test_dump_profile(tmp_path):
+    ss = _build(profile=True)
+    ss.simulate(3, _tm=False)
+
+    ss.dump_profile(tmp_path / "profile.json")
+    with open(tmp_path / "profile.json") as f:
+        models = json.load(f)["models"]
+    assert _named(models, "t2")["methods"]["output"]["calls"] == 2
+
+    ss.dump_profile(tmp_path / "profile.csv")
+    with open(tmp_path / "profile.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    row = next(r for r in rows if r["model"] == "t1" and r["method"] == "int_trans")
+    assert row["class"] == "Ticker" and row["calls"] == "2"
+
+
+def test_same_named_models_are_counted_separately():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, profile=True)
+    sink = Sink("sink")
+    ss.register_entity(sink)
+    tickers = [Ticker("twin"), Ticker("twin")]
+    for ticker in tickers:
+        ss.register_entity(ticker)
+        ss.coupling_relation(ticker, "out", sink, "in")
+    ss.simulate(3, _tm=False)
+
+    models = ss.get_profile()["models"]
+    for ticker in tickers:
+        entry = models[ticker.get_obj_id()]
+        assert entry["name"] == "twin"
+        assert entry["methods"]["output"]["calls"] == 2
+
+
+def test_profiling_is_off_by_default():
+    ss = _build(profile=False)
+    ss.simulate(3, _tm=False)
+    assert all("output" not in vars(e) for e in ss.active_obj_map.values())
+    with pytest.raises(ValueError):
+        ss.get_profile()
@@ -0,0 +1,148 @@
+"""Tests for the R_TIME scheduler and ``RealTimeClock``.
+
+R_TIME must wake once per event at its absolute deadline (scaled by
+``rt_speed``), wake early for external events, and apply the overrun
+policy when a deadline has already passed.
+"""
+
+import threading
+import time
+
+import pytest
+
+from pyjevsim.definition import ExecutionType
+from pyjevsim.realtime_clock import RealTimeClock
+from pyjevsim.system_executor import SysExecutor
+
+from .model_sink import Sink
+from .model_ticker import Ticker
+
+
+class _WallTicker(Ticker):
+    """Ticker that also keeps the wall-clock time of every tick."""
+
+    def __init__(self, name, period, ss):
+        super().__init__(name, period, ss)
+        self.wall = []
+
+    def int_trans(self):
+        super().int_trans()
+        self.wall.append(time.perf_counter())
+
+
+class _WallSink(Sink):
+    """Sink that also keeps the wall-clock time of every delivery."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.wall = []
+
+    def ext_trans(self, port, msg):
+        self.wall.append(time.perf_counter())
+        super().ext_trans(port, msg)
+
+
+def test_events_fire_on_absolute_deadlines():
+    # ``skip`` re-anchors after a missed deadline, so one oversleep on a
+    # busy machine cannot make every later event late as well.
+    ss = SysExecutor(0.0001, ex_mode=ExecutionType.R_TIME, rt_overrun="skip")
+    ticker = _WallTicker("ticker", 0.02, ss)
+    ss.register_entity(ticker)
+    ticks = []
+    schedule = ss.schedule
+    ss.schedule = lambda: (ticks.append(ss.get_global_time()), schedule())
+
+    start = time.perf_counter()
+    ss.simulate(0.21, _tm=False)
+
+    # A skipped stretch can push the last event past the horizon.
+    assert 10 - ss.rt_clock.overruns <= len(ticker.fired) <= 10
+    errors = sorted(abs((wall - start) - sim_t)
+                    for sim_t, wall in zip(ticker.fired, ticker.wall))
+    assert errors[len(errors) // 2] < 0.001
+    assert errors[-1] < 0.01
+    # One pass per event (plus the start and the horizon), not one per
+    # 0.1 ms resolution step.
+    assert len(ticks) <= 12
+    # Relative sleeps or resolution stepping drift behind, which shows up
+    # as most of the ten deadlines being missed.
+    assert ss.rt_clock.overruns <= 3
+
+
+def test_speed_scales_wall_clock_time():
+    ss = SysExecutor(1, ex_mode=ExecutionType.R_TIME, rt_speed=10)
+    ticker = _WallTicker("ticker", 0.5, ss)
+    ss.register_entity(ticker)
+    start = time.perf_counter()
+    ss.simulate(2, _tm=False)
+    elapsed = time.perf_counter() - start
+    assert ticker.fired == [0.5, 1.0, 1.5]
+    assert 0.2 <= elapsed < 0.3
+
+
+def test_external_event_interrupts_the_wait():
+    ss = SysExecutor(1, ex_mode=ExecutionType.R_TIME)
+    rec = _WallSink("rec")
+    ss.register_entity(rec)
+    ss.insert_input_port("in")
+    ss.coupling_relation(None, "in", rec, "in")
+
+    runner = threading.Thread(target=ss.simulate, args=(0.5,), kwargs={"_tm": False})
+    runner.start()
+    time.sleep(0.1)
+    sent = time.perf_counter()
+    ss.insert_external_event("in", None)
+    runner.join()
+
+    assert len(rec.wall) == 1
+    assert rec.wall[0] - sent < 0.01
+    assert ss.get_global_time() == 0.5
+
+
+def test_custom_external_event_interrupts_the_wait():
+    ss = SysExecutor(1, ex_mode=ExecutionType.R_TIME)
+    rec = _WallSink("rec")
+    ss.register_entity(rec)
+    ss.insert_input_port("in")
+    ss.coupling_relation(None, "in", rec, "in")
+
+    runner = threading.Thread(target=ss.simulate, args=(3,), kwargs={"_tm": False})
+    runner.start()
+    time.sleep(0.2)
+    sent = time.perf_counter()
+    ss.insert_custom_external_event("in", [1])
+    time.sleep(0.1)
+    delivered = list(rec.wall)
+    ss.terminate_simulation()
+    runner.join()
+
+    assert len(delivered) == 1
+    assert delivered[0] - sent < 0.01
+
+
+@pytest.mark.parametrize("policy", ["catch_up", "skip", "slip"])
+def test_overrun_policies(policy):
+    clock = RealTimeClock(overrun=policy)
+    clock.start(0)
+    clock._wall_origin -= 1.0  # one wall-clock second has gone by
+
+    run_at = clock.settle(0.5)
+
+    assert clock.overruns == 1
+    assert clock.max_lag == pytest.approx(0.5, abs=0.05)
+    if policy == "skip":
+        assert run_at == pytest.approx(1.0, abs=0.05)
+    else:
+        assert run_at == 0.5
+    late = time.perf_counter() - clock.deadline(1.0)
+    if policy == "slip":
+        assert late == pytest.approx(-0.5, abs=0.05)
+    else:
+        assert late == pytest.approx(0.0, abs=0.05)
+
+
+def test_invalid_clock_arguments():
+    with pytest.raises(ValueError):
+        RealTimeClock(speed=0)
+    with pytest.raises(ValueError):
+        RealTimeClock(overrun="rewind")
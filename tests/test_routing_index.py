@@ -0,0 +1,62 @@
+"""Tests for the compiled routing index on ``SysExecutor``.
+
+``freeze()`` compiles ``port_map`` into a per-executor, per-output-port
+table that Phase B of ``_run_instant`` reads directly. ``port_map``
+remains the editable source of truth: every topology edit drops the
+compiled index and the next tick recompiles it, so runtime structure
+changes must keep taking effect.
+"""
+
+from pyjevsim.definition import ExecutionType
+from pyjevsim.system_executor import SysExecutor
+
+from .model_sink import Sink
+from .model_ticker import Ticker
+
+
+def _build():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME, snapshot_manager=None)
+    ticker = Ticker("ticker")
+    a = Sink("a")
+    b = Sink("b")
+    for m in (ticker, a, b):
+        ss.register_entity(m)
+    ss.coupling_relation(ticker, "out", a, "in")
+    return ss, ticker, a, b
+
+
+def test_init_sim_freezes_port_map():
+    ss, ticker, a, _ = _build()
+    assert not ss._frozen
+
+    ss.init_sim()
+
+    assert ss._frozen
+    src = ss.product_port_map[ticker]
+    dst = ss.product_port_map[a]
+    assert ss._route_index[src]["out"] == ((dst, "in"),)
+
+
+def test_coupling_added_mid_run_takes_effect():
+    ss, ticker, a, b = _build()
+    ss.simulate(3, _tm=False)
+    assert b.received == []
+
+    ss.coupling_relation(ticker, "out", b, "in")
+    assert not ss._frozen
+
+    ss.simulate(2, _tm=False)
+    assert ss._frozen
+    assert len(b.received) == 2
+    assert a.received[-2:] == b.received
+
+
+def test_removed_coupling_stops_delivery():
+    ss, ticker, a, _ = _build()
+    ss.simulate(3, _tm=False)
+    delivered = len(a.received)
+    assert delivered > 0
+
+    ss.remove_relation("ticker", "out", "a", "in")
+    ss.simulate(3, _tm=False)
+    assert len(a.received) == delivered
@@ -0,0 +1,99 @@
+"""Tests for the asyncio real-time driver ``SysExecutor.simulate_async``.
+
+The driver must sleep until the next event instead of stepping by
+``time_resolution``, and wake early for externally inserted events.
+"""
+
+import asyncio
+import threading
+
+from pyjevsim.definition import ExecutionType, Infinite
+from pyjevsim.system_executor import SysExecutor
+
+from .model_sink import Sink
+from .model_ticker import Ticker
+
+
+class _LoopSink(Sink):
+    """Also keeps the event-loop time of every message in ``wall``."""
+
+    def __init__(self, name, ss):
+        super().__init__(name, ss)
+        self.wall = []
+
+    def ext_trans(self, port, msg):
+        super().ext_trans(port, msg)
+        self.wall.append(asyncio.get_running_loop().time())
+
+
+def _build():
+    ss = SysExecutor(0.001, ex_mode=ExecutionType.R_TIME)
+    rec = _LoopSink("rec", ss)
+    ss.register_entity(rec)
+    ss.insert_input_port("in")
+    ss.coupling_relation(None, "in", rec, "in")
+    return ss, rec
+
+
+def test_runs_in_real_time_without_stepping():
+    ss, _ = _build()
+    ticker = Ticker("ticker", 0.1, ss)
+    ss.register_entity(ticker)
+    ticks = []
+    run_instant = ss._run_instant
+    ss._run_instant = lambda *args: (ticks.append(args[0]), run_instant(*args))
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await ss.simulate_async(0.35)
+        return loop.time() - start
+
+    elapsed = asyncio.run(main())
+    assert elapsed >= 0.35
+    assert ss.get_global_time() == 0.35
+    assert len(ticker.fired) == 3
+    # One tick per event instead of one per 1 ms resolution step.
+    assert len(ticks) == 3
+
+
+def test_async_insert_wakes_the_driver():
+    ss, rec = _build()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        run = asyncio.create_task(ss.simulate_async())
+        await asyncio.sleep(0.05)
+        sent = loop.time()
+        await ss.insert_external_event_async("in", "now")
+        await asyncio.sleep(0.02)
+        ss.terminate_simulation()
+        await asyncio.wait_for(run, 1)
+        return sent
+
+    sent = asyncio.run(main())
+    assert rec.received == ["now"]
+    assert rec.wall[0] - sent < 0.02
+    assert ss.get_global_time() >= 0.05
+
+
+def test_thread_insert_wakes_the_driver():
+    ss, rec = _build()
+
+    def produce():
+        ss.insert_external_event("in", "hello")
+
+    async def main():
+        run = asyncio.create_task(ss.simulate_async(Infinite))
+        await asyncio.sleep(0.3)
+        producer = threading.Thread(target=produce)
+        producer.start()
+        producer.join()
+        await asyncio.sleep(0.05)
+        ss.terminate_simulation()
+        await asyncio.wait_for(run, 1)
+
+    asyncio.run(main())
+    assert rec.received == ["hello"]
+    # Timed from the run's wall-clock position, not from global_time 0.
+    assert 0.3 <= rec.log[0][0] < 0.4
@@ -0,0 +1,161 @@
+"""Tests for ``SysExecutor.edit_structure``.
+
+A batch of entity / coupling edits is checked as a whole and applied
+atomically: between ticks right away, from inside a tick once the tick
+has finished (but checked when committed). The compiled routing index
+is patched in place rather than recompiled.
+"""
+
+import pytest
+
+from pyjevsim.definition import ExecutionType
+from pyjevsim.structural_model import StructuralModel
+from pyjevsim.system_executor import SysExecutor
+
+from .model_sink import Sink
+from .model_ticker import Ticker
+
+
+class _Spawner(Ticker):
+    """At t == 2 swaps the sink it feeds for a freshly spawned one."""
+
+    def __init__(self, name, ss, old, new):
+        super().__init__(name, ss=ss)
+        self.old, self.new = old, new
+
+    def int_trans(self):
+        super().int_trans()
+        if self.ss.get_global_time() == 2:
+            with self.ss.edit_structure() as edit:
+                edit.add_entity(self.new)
+                edit.add_coupling(self, "out", self.new, "in")
+                edit.remove_entity(self.old)
+            # Still the old topology until the tick is over.
+            assert self.ss.get_model(self.old.get_name()) is self.old
+
+
+def _build():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    ticker, a, b = Ticker("ticker"), Sink("a"), Sink("b")
+    for m in (ticker, a, b):
+        ss.register_entity(m)
+    ss.coupling_relation(ticker, "out", a, "in")
+    return ss, ticker, a, b
+
+
+def test_batch_patches_routing_index():
+    ss, ticker, a, b = _build()
+    ss.simulate(3, _tm=False)
+    assert ss._frozen
+
+    with ss.edit_structure() as edit:
+        edit.add_coupling(ticker, "out", b, "in")
+        edit.remove_coupling(ticker, "out", a, "in")
+
+    assert ss._frozen
+    src = ss.product_port_map[ticker]
+    assert ss._route_index[src]["out"] == ((ss.product_port_map[b], "in"),)
+    ss.simulate(2, _tm=False)
+    assert len(a.received) == 2 and len(b.received) == 2
+
+
+def test_invalid_batch_changes_nothing():
+    ss, ticker, a, b = _build()
+    ss.simulate(2, _tm=False)
+    c = Sink("c")
+    with pytest.raises(ValueError):
+        with ss.edit_structure() as edit:
+            edit.add_entity(c)
+            edit.add_coupling(ticker, "out", c, "in")
+            edit.remove_coupling(ticker, "out", b, "in")
+    assert "c" not in ss.model_map
+    assert list(ss.get_relation()) == [(ticker, "out")]
+
+    with pytest.raises(RuntimeError):
+        with ss.edit_structure() as edit:
+            edit.remove_entity("a")
+            raise RuntimeError("abort")
+    assert "a" in ss.model_map
+
+
+def test_edit_from_inside_a_tick_applies_after_it():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    old, new = Sink("old"), Sink("new")
+    spawner = _Spawner("spawner", ss, old, new)
+    for m in (spawner, old):
+        ss.register_entity(m)
+    ss.coupling_relation(spawner, "out", old, "in")
+
+    ss.simulate(5, _tm=False)
+
+    assert old.received == [1, 2]
+    assert new.received == [3, 4]
+    assert "old" not in ss.model_map
+    assert old not in ss.product_port_map
+    assert all(e.get_core_model() is not old for e in ss.active_obj_map.values())
+
+
+class _Remover(Ticker):
+    """At t == 1 removes ``victim`` in a batch of its own and keeps the
+    error, if the commit is rejected."""
+
+    def __init__(self, name, ss, victim):
+        super().__init__(name, ss=ss)
+        self.victim, self.error = victim, None
+
+    def int_trans(self):
+        super().int_trans()
+        if self.ss.get_global_time() == 1:
+            try:
+                with self.ss.edit_structure() as edit:
+                    edit.remove_entity(self.victim)
+            except ValueError as exc:
+                self.error = exc
+
+
+def test_invalid_edit_inside_a_tick_raises_at_commit():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    victim = Sink("victim")
+    first = _Remover("first", ss, "victim")
+    second = _Remover("second", ss, "victim")
+    for m in (first, second, victim):
+        ss.register_entity(m)
+
+    ss.simulate(3, _tm=False)
+
+    # Both committed in the same tick: the second batch is checked
+    # against the first, still pending one, and rejected in its
+    # committer; the first one still applies.
+    errors = [m.error for m in (first, second)]
+    assert sum(e is not None for e in errors) == 1
+    assert "victim" not in ss.model_map
+    assert ss._pending_edits == []
+
+
+def test_remove_entity_before_creation():
+    ss, ticker, a, _ = _build()
+    late = Sink("late")
+    with ss.edit_structure() as edit:
+        edit.add_entity(late, inst_t=10)
+        edit.add_coupling(ticker, "out", late, "in")
+    ss.simulate(3, _tm=False)
+    with ss.edit_structure() as edit:
+        edit.remove_entity("late")
+    ss.simulate(10, _tm=False)
+    assert late.received == []
+    assert all(e.get_core_model() is not late for e in ss.active_obj_map.values())
+
+
+def test_remove_model_drops_its_couplings():
+    parent = StructuralModel("parent")
+    a, b = Sink("a"), Sink("b")
+    parent.register_entity(a)
+    parent.register_entity(b)
+    parent.coupling_relation(parent, "in", a, "in")
+    parent.coupling_relation(parent, "in", b, "in")
+    parent.coupling_relation(a, "out", b, "in")
+    parent.coupling_relation(b, "out", parent, "out")
+
+    parent.remove_model(b)
+
+    assert parent.get_couplings() == {(parent, "in"): [(a, "in")]}
@@ -0,0 +1,57 @@
+"""Tests for the reusable scratch buffers of ``SysExecutor._run_instant``.
+
+Deliverers, bags and sets are owned by the executor and recycled tick
+after tick; a tick must leave no message behind in them and must not
+grow them beyond what its largest tick needed.
+"""
+
+from pyjevsim.behavior_model import BehaviorModel
+from pyjevsim.definition import ExecutionType
+from pyjevsim.system_executor import SysExecutor
+from pyjevsim.system_message import SysMessage
+
+
+class _Pulse(BehaviorModel):
+    def __init__(self, name):
+        super().__init__(name)
+        self.insert_state("run", 1)
+        self.init_state("run")
+        self.insert_input_port("in")
+        self.insert_output_port("out")
+        self.received = []
+
+    def output(self, msg_deliver):
+        msg_deliver.insert_message(SysMessage.single(self.get_name(), "out", self.get_name()))
+
+    def int_trans(self):
+        pass
+
+    def ext_trans(self, port, msg):
+        self.received.append(msg.value())
+
+    def con_trans(self, port_msgs):
+        for _, msg in port_msgs:
+            self.received.append(msg.value())
+
+
+def test_scratch_buffers_are_reused():
+    ss = SysExecutor(1, ex_mode=ExecutionType.V_TIME)
+    models = [_Pulse(f"p{i}") for i in range(4)]
+    for m in models:
+        ss.register_entity(m)
+    for a, b in zip(models, models[1:] + models[:1]):
+        ss.coupling_relation(a, "out", b, "in")
+
+    ss.simulate(2, _tm=False)
+    arena = list(ss._md_arena)
+    bags = list(ss._free_bags)
+    ss.simulate(9, _tm=False)
+
+    # Every model emits at every instant; no later tick needs more.
+    assert ss._md_arena == arena and len(arena) == 4
+    assert ss._free_bags == bags and len(bags) == 4
+    assert all(not bag for bag in bags)
+    assert not ss._tick_inputs
+
+    assert models[1].received == ["p0"] * 10
+    assert models[0].received == ["p3"] * 10